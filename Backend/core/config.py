@@ -29,6 +29,19 @@ class Settings(BaseSettings):
     # Files
     UPLOAD_DIR: str = "./uploads"
 
+    # GF(2^m) engine
+    GF_BATCH_MAX_ITEMS: int = 1_000_000
+    GF_MAX_M: int = 1024
+    GF_CATALOG_LIVE_MAX_M: int = 128  # uncached degrees above this are built in the background
+    AUTOGRADE_WORKERS: int = 2
+    FACTOR_BUDGET_SECONDS: float = 2.0
+    GF_RESULT_CACHE_ITEMS: int = 4096
+    GF_RESULT_CACHE_BYTES: int = 32 * 1024 * 1024
+    GF_COMPUTE_MAX_STEPS: int = 100_000  # longer traces go through /gf/trace
+    GF_GCD_MAX_DEGREE: int = 1_000_000
+    GF_EC_MAX_WORK: int = 5_000_000  # sum of m * scalar bits per /gf/ec request; about 1.5 s
+    GF_MATRIX_MAX_WORK: int = 2_000_000_000  # weighted products per /gf/matrix request; about 2 s
+
     # Seed admin (optional)
     ADMIN_EMAIL: Optional[EmailStr] = None
     ADMIN_PASSWORD: Optional[str] = None
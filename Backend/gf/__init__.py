@@ -0,0 +1,4 @@
+from .bigint import BigField, get_big_field
+from .field import IRRED_DEFAULTS, NIST_POLYS, GFConfig, default_config, poly_degree
+from .ops import gf_add, gf_div, gf_inv, gf_mod, gf_mul, gf_pow
+from .tables import FieldTables, get_tables
@@ -0,0 +1,264 @@
+"""AES (FIPS-197) rounds built on the GF(2^8) engine.
+
+The S-box is derived, not transcribed: S(a) = affine(a^-1) with the inverse
+taken in GF(2^8) mod 0x11B (0 maps to 0), exactly as the calculator's
+``gfInv`` computes it. States are 16 bytes in FIPS column-major order
+(byte r + 4c is row r of column c).
+
+Two evaluation paths:
+
+* the individual steps (``sub_bytes``, ``shift_rows``, ``mix_columns``,
+  ``add_round_key``) for single blocks, and ``batch_round`` which runs the same
+  steps over an (N, 16) uint8 array with table gathers and can record every
+  intermediate state;
+* T-tables -- SubBytes, ShiftRows and MixColumns folded into four 256-entry
+  word tables, so a full round is 16 lookups and XORs per block
+  (``encrypt_block``, and ``batch_encrypt`` without traces).
+"""
+from functools import lru_cache
+from typing import Optional, Sequence
+
+import numpy as np
+
+from .field import default_config
+from .tables import get_tables
+
+AES_FIELD = default_config(8)
+BLOCK_SIZE = 16
+# Rounds per key length in bytes
+ROUNDS = {16: 10, 24: 12, 32: 14}
+STEPS = ("subBytes", "shiftRows", "mixColumns", "addRoundKey")
+
+# ShiftRows as a gather: new[r + 4c] = old[r + 4((c + r) % 4)]
+SHIFT_ROWS = tuple(r + 4 * ((c + r) % 4) for c in range(4) for r in range(4))
+
+Block = Sequence[int]
+
+
+def _affine(b: int) -> int:
+    # b ^ rotl(b, 1) ^ rotl(b, 2) ^ rotl(b, 3) ^ rotl(b, 4) ^ 0x63
+    out = b
+    for k in range(1, 5):
+        out ^= ((b << k) | (b >> (8 - k))) & 0xFF
+    return out ^ 0x63
+
+
+@lru_cache(maxsize=None)
+def sbox() -> tuple[int, ...]:
+    t = get_tables(AES_FIELD)
+    return tuple(_affine(t.inv(a) if a else 0) for a in range(256))
+
+
+@lru_cache(maxsize=None)
+def inv_sbox() -> tuple[int, ...]:
+    out = [0] * 256
+    for a, s in enumerate(sbox()):
+        out[s] = a
+    return tuple(out)
+
+
+@lru_cache(maxsize=None)
+def _mul_table(c: int) -> tuple[int, ...]:
+    t = get_tables(AES_FIELD)
+    return tuple(t.mul(c, a) for a in range(256))
+
+
+@lru_cache(maxsize=None)
+def t_tables() -> tuple[tuple[int, ...], ...]:
+    """Te0..Te3: Te0[a] is the MixColumns image of column (S(a), 0, 0, 0) as a
+    big-endian word; Te_i is Te0 rotated right by 8i bits."""
+    s, m2, m3 = sbox(), _mul_table(2), _mul_table(3)
+    te0 = tuple((m2[s[a]] << 24) | (s[a] << 16) | (s[a] << 8) | m3[s[a]] for a in range(256))
+    tables = [te0]
+    for i in range(1, 4):
+        tables.append(tuple(((w >> (8 * i)) | (w << (32 - 8 * i))) & 0xFFFFFFFF for w in te0))
+    return tuple(tables)
+
+
+# ---------- single blocks ----------
+
+
+def sub_bytes(state: Block) -> list[int]:
+    s = sbox()
+    return [s[b] for b in state]
+
+
+def shift_rows(state: Block) -> list[int]:
+    return [state[i] for i in SHIFT_ROWS]
+
+
+def mix_columns(state: Block) -> list[int]:
+    m2, m3 = _mul_table(2), _mul_table(3)
+    out = []
+    for c in range(0, BLOCK_SIZE, 4):
+        a0, a1, a2, a3 = state[c : c + 4]
+        out += [
+            m2[a0] ^ m3[a1] ^ a2 ^ a3,
+            a0 ^ m2[a1] ^ m3[a2] ^ a3,
+            a0 ^ a1 ^ m2[a2] ^ m3[a3],
+            m3[a0] ^ a1 ^ a2 ^ m2[a3],
+        ]
+    return out
+
+
+def add_round_key(state: Block, round_key: Block) -> list[int]:
+    return [a ^ k for a, k in zip(state, round_key)]
+
+
+def _check_key(key: bytes) -> int:
+    if len(key) not in ROUNDS:
+        raise ValueError("AES keys are 16, 24 or 32 bytes")
+    return ROUNDS[len(key)]
+
+
+@lru_cache(maxsize=64)
+def expand_key(key: bytes) -> tuple[bytes, ...]:
+    """Round keys 0..Nr, 16 bytes each."""
+    rounds = _check_key(key)
+    nk = len(key) // 4
+    s = sbox()
+    words = [list(key[4 * i : 4 * i + 4]) for i in range(nk)]
+    rcon = 1
+    for i in range(nk, 4 * (rounds + 1)):
+        w = list(words[-1])
+        if i % nk == 0:
+            w = [s[b] for b in w[1:] + w[:1]]
+            w[0] ^= rcon
+            rcon = _mul_table(2)[rcon]
+        elif nk > 6 and i % nk == 4:
+            w = [s[b] for b in w]
+        words.append([a ^ b for a, b in zip(words[i - nk], w)])
+    return tuple(bytes(sum(words[4 * r : 4 * r + 4], [])) for r in range(rounds + 1))
+
+
+def _check_block(block: Block) -> None:
+    if len(block) != BLOCK_SIZE:
+        raise ValueError("AES blocks are 16 bytes")
+
+
+def encrypt_block_steps(block: Block, key: bytes) -> bytes:
+    """Encryption that applies each FIPS-197 step in turn (reference path)."""
+    _check_block(block)
+    round_keys = expand_key(bytes(key))
+    state = add_round_key(block, round_keys[0])
+    for r in range(1, len(round_keys)):
+        state = shift_rows(sub_bytes(state))
+        if r < len(round_keys) - 1:
+            state = mix_columns(state)
+        state = add_round_key(state, round_keys[r])
+    return bytes(state)
+
+
+def encrypt_block(block: Block, key: bytes) -> bytes:
+    """Encryption through the T-tables: 16 lookups per middle round."""
+    _check_block(block)
+    round_keys = expand_key(bytes(key))
+    te0, te1, te2, te3 = t_tables()
+    rk = [int.from_bytes(k, "big") for k in round_keys]
+    w = int.from_bytes(bytes(block), "big") ^ rk[0]
+    cols = [(w >> (96 - 32 * c)) & 0xFFFFFFFF for c in range(4)]
+    for r in range(1, len(rk) - 1):
+        key_r = rk[r]
+        cols = [
+            te0[cols[c] >> 24]
+            ^ te1[(cols[(c + 1) % 4] >> 16) & 0xFF]
+            ^ te2[(cols[(c + 2) % 4] >> 8) & 0xFF]
+            ^ te3[cols[(c + 3) % 4] & 0xFF]
+            ^ ((key_r >> (96 - 32 * c)) & 0xFFFFFFFF)
+            for c in range(4)
+        ]
+    state = [(cols[i // 4] >> (24 - 8 * (i % 4))) & 0xFF for i in range(BLOCK_SIZE)]
+    return bytes(add_round_key(shift_rows(sub_bytes(state)), round_keys[-1]))
+
+
+# ---------- batches ----------
+
+
+@lru_cache(maxsize=None)
+def _np_tables() -> dict[str, np.ndarray]:
+    return {
+        "sbox": np.array(sbox(), dtype=np.uint8),
+        "mul2": np.array(_mul_table(2), dtype=np.uint8),
+        "mul3": np.array(_mul_table(3), dtype=np.uint8),
+        "te": np.array(t_tables(), dtype=np.uint32),
+        "shift": np.array(SHIFT_ROWS),
+    }
+
+
+def _as_states(blocks) -> np.ndarray:
+    states = np.ascontiguousarray(blocks, dtype=np.uint8)
+    if states.ndim != 2 or states.shape[1] != BLOCK_SIZE:
+        raise ValueError("Blocks must be an (N, 16) array of bytes")
+    return states
+
+
+def batch_round(
+    states: np.ndarray, round_key: Block, final: bool = False, trace: Optional[dict] = None
+) -> np.ndarray:
+    """One full round (SubBytes, ShiftRows, MixColumns unless ``final``,
+    AddRoundKey) over every row of ``states``; intermediate states are stored
+    in ``trace`` under their step names when it is given."""
+    t = _np_tables()
+    out = t["sbox"][states]
+    if trace is not None:
+        trace["subBytes"] = out
+    out = out[:, t["shift"]]
+    if trace is not None:
+        trace["shiftRows"] = out
+    if not final:
+        cols = out.reshape(-1, 4, 4)
+        out = (
+            t["mul2"][cols]
+            ^ t["mul3"][np.roll(cols, -1, axis=2)]
+            ^ np.roll(cols, -2, axis=2)
+            ^ np.roll(cols, -3, axis=2)
+        ).reshape(-1, BLOCK_SIZE)
+        if trace is not None:
+            trace["mixColumns"] = out
+    out = out ^ np.frombuffer(bytes(round_key), dtype=np.uint8)
+    if trace is not None:
+        trace["addRoundKey"] = out
+    return out
+
+
+def _batch_t_round(words: np.ndarray, round_key: bytes, te: np.ndarray) -> np.ndarray:
+    rk = np.frombuffer(round_key, dtype=">u4").astype(np.uint32)
+    return (
+        te[0][words >> 24]
+        ^ te[1][np.roll(words, -1, axis=1) >> 16 & 0xFF]
+        ^ te[2][np.roll(words, -2, axis=1) >> 8 & 0xFF]
+        ^ te[3][np.roll(words, -3, axis=1) & 0xFF]
+        ^ rk
+    )
+
+
+def batch_encrypt(
+    blocks, key: bytes, rounds: Optional[int] = None, trace: bool = False
+) -> tuple[np.ndarray, list[dict[str, np.ndarray]]]:
+    """Run N blocks through the first ``rounds`` rounds (all by default).
+
+    Returns the states after the last round run and, with ``trace``, one dict
+    per round of the states after each step (round 0 only has addRoundKey).
+    Untraced middle rounds use the T-tables.
+    """
+    round_keys = expand_key(bytes(key))
+    total = len(round_keys) - 1
+    rounds = total if rounds is None else rounds
+    if not 0 <= rounds <= total:
+        raise ValueError(f"rounds must be between 0 and {total}")
+    states = _as_states(blocks) ^ np.frombuffer(round_keys[0], dtype=np.uint8)
+    steps: list[dict[str, np.ndarray]] = [{"addRoundKey": states}] if trace else []
+    # Middle rounds through the T-tables when nobody needs the steps
+    fast = 0 if trace else min(rounds, total - 1)
+    if fast:
+        te = _np_tables()["te"]
+        words = states.view(">u4").astype(np.uint32)
+        for r in range(1, fast + 1):
+            words = _batch_t_round(words, round_keys[r], te)
+        states = words.astype(">u4").view(np.uint8).reshape(-1, BLOCK_SIZE)
+    for r in range(fast + 1, rounds + 1):
+        record: Optional[dict] = {} if trace else None
+        states = batch_round(states, round_keys[r], final=r == total, trace=record)
+        if record is not None:
+            steps.append(record)
+    return states, steps
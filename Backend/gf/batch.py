@@ -0,0 +1,204 @@
+"""Vectorized GF(2^m) evaluation over NumPy arrays.
+
+Fields with m <= TABLE_MAX_M use log/antilog table gathers for every op.
+Up to WORD_MAX_M, elements fit one uint64 lane and ``add``, ``mul`` and
+``mod`` run on packed words: a carry-less product by one shift/XOR pass per
+bit of the multiplier (high half in a second array once 2m - 1 > 64), then a
+reduction that folds the bits above x^m back through byte tables
+fold[k][v] = v * x^(m + 8k) mod f, one gather per byte.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from .field import FIELD_CACHE_SIZE, GFConfig, poly_mod
+from .irreducible import check_field
+from .tables import TABLE_MAX_M, get_tables
+
+BATCH_OPS = ("add", "mul", "div", "inv", "pow", "mod")
+BINARY_OPS = ("add", "mul", "div", "pow")
+# Ops with a packed-word path above TABLE_MAX_M
+WORD_OPS = ("add", "mul", "mod")
+WORD_MAX_M = 64
+
+
+@lru_cache(maxsize=FIELD_CACHE_SIZE)
+def _np_tables(cfg: GFConfig) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    t = get_tables(cfg)
+    exp = np.asarray(t.exp, dtype=np.uint32)
+    log = np.asarray(t.log, dtype=np.int64)
+    # red[r] = r * x^m mod f, used to fold m-bit chunks in batch_mod
+    xm = poly_mod(1 << cfg.m, cfg.mod_poly)
+    r = np.arange(cfg.size, dtype=np.int64)
+    red = exp[log[r] + t.log[xm]] if xm else np.zeros(cfg.size, dtype=np.uint32)
+    red[0] = 0
+    return exp, log, red
+
+
+def _check(cfg: GFConfig) -> None:
+    if cfg.m > TABLE_MAX_M:
+        raise ValueError(f"Batch evaluation requires m <= {TABLE_MAX_M}")
+
+
+def _check_words(cfg: GFConfig) -> None:
+    if cfg.m > WORD_MAX_M:
+        raise ValueError(f"Batch add, mul and mod require m <= {WORD_MAX_M}")
+    # The table path rejects reducible moduli in get_tables; so must this one
+    check_field(cfg)
+
+
+# ---------- packed words (TABLE_MAX_M < m <= WORD_MAX_M) ----------
+
+
+@lru_cache(maxsize=FIELD_CACHE_SIZE)
+def _fold_tables(cfg: GFConfig) -> np.ndarray:
+    # Bits above x^m: at most m - 1 of them after a product, 64 - m after a
+    # 64-bit input to mod
+    chunks = (max(cfg.m - 1, 64 - cfg.m) + 7) // 8
+    out = np.zeros((chunks, 256), dtype=np.uint64)
+    for k in range(chunks):
+        for bit in range(8):
+            out[k, 1 << bit] = poly_mod(1 << (cfg.m + 8 * k + bit), cfg.mod_poly)
+        # Every byte is the XOR of its bits
+        for v in range(3, 256):
+            low = v & -v
+            if v != low:
+                out[k, v] = out[k, low] ^ out[k, v ^ low]
+    return out
+
+
+def _as_words(a: np.ndarray, cfg: GFConfig) -> np.ndarray:
+    return a.astype(np.uint64) & np.uint64(cfg.mask)
+
+
+def clmul_words(a: np.ndarray, b: np.ndarray, m: int) -> tuple[np.ndarray, np.ndarray | None]:
+    """Carry-less products of m-bit words as (low 64 bits, high bits or None when 2m - 1 <= 64)."""
+    lo = np.zeros_like(a)
+    hi = np.zeros_like(a) if 2 * m - 1 > 64 else None
+    one, zero = np.uint64(1), np.uint64(0)
+    t = np.empty_like(a)
+    for i in range(m):
+        # t = a where bit i of b is set, else 0
+        np.right_shift(b, np.uint64(i), out=t)
+        t &= one
+        np.subtract(zero, t, out=t)
+        t &= a
+        lo ^= t << np.uint64(i)
+        if hi is not None and i:
+            hi ^= t >> np.uint64(64 - i)
+    return lo, hi
+
+
+def _fold(lo: np.ndarray, hi: np.ndarray | None, cfg: GFConfig) -> np.ndarray:
+    # (hi : lo) mod f = (lo mod x^m) + sum_k fold[k][byte k of the bits above x^m]
+    m = cfg.m
+    if m == 64:
+        high, out = hi, lo.copy()
+    else:
+        high = lo >> np.uint64(m)
+        if hi is not None:
+            high |= hi << np.uint64(64 - m)
+        out = lo & np.uint64(cfg.mask)
+    if high is None:
+        return out
+    fold = _fold_tables(cfg)
+    for k in range(len(fold)):
+        out ^= fold[k][((high >> np.uint64(8 * k)) & np.uint64(0xFF)).astype(np.intp)]
+    return out
+
+
+def _word_mul(a: np.ndarray, b: np.ndarray, cfg: GFConfig) -> np.ndarray:
+    _check_words(cfg)
+    lo, hi = clmul_words(_as_words(a, cfg), _as_words(b, cfg), cfg.m)
+    return _fold(lo, hi, cfg)
+
+
+# ---------- tables (m <= TABLE_MAX_M) ----------
+
+
+def batch_mul(a: np.ndarray, b: np.ndarray, cfg: GFConfig) -> np.ndarray:
+    if cfg.m > TABLE_MAX_M:
+        return _word_mul(a, b, cfg)
+    exp, log, _ = _np_tables(cfg)
+    a = a.astype(np.int64) & cfg.mask
+    b = b.astype(np.int64) & cfg.mask
+    out = exp[log[a] + log[b]]
+    out[(a == 0) | (b == 0)] = 0
+    return out
+
+
+def batch_div(a: np.ndarray, b: np.ndarray, cfg: GFConfig) -> np.ndarray:
+    _check(cfg)
+    exp, log, _ = _np_tables(cfg)
+    a = a.astype(np.int64) & cfg.mask
+    b = b.astype(np.int64) & cfg.mask
+    if not b.all():
+        raise ZeroDivisionError("Division by zero in GF(2^m).")
+    out = exp[log[a] - log[b] + (cfg.size - 1)]
+    out[a == 0] = 0
+    return out
+
+
+def batch_inv(a: np.ndarray, cfg: GFConfig) -> np.ndarray:
+    _check(cfg)
+    exp, log, _ = _np_tables(cfg)
+    a = a.astype(np.int64) & cfg.mask
+    if not a.all():
+        raise ZeroDivisionError("Zero has no multiplicative inverse in GF(2^m).")
+    return exp[(cfg.size - 1) - log[a]]
+
+
+def batch_pow(a: np.ndarray, n: np.ndarray, cfg: GFConfig) -> np.ndarray:
+    _check(cfg)
+    exp, log, _ = _np_tables(cfg)
+    order = cfg.size - 1
+    a = a.astype(np.int64) & cfg.mask
+    # Reduce in the exponents' own dtype: uint64 exponents from 2^63 up would wrap as int64
+    if n.dtype.kind not in "iu":
+        n = n.astype(np.int64)
+    zero = a == 0
+    if (zero & (n < 0)).any():
+        raise ZeroDivisionError("Zero has no multiplicative inverse in GF(2^m).")
+    out = exp[(log[a] * (n % order).astype(np.int64)) % order]
+    # a^0 = 1 even if a = 0
+    out[zero] = (n[zero] == 0).astype(np.uint32)
+    return out
+
+
+def batch_mod(x: np.ndarray, cfg: GFConfig) -> np.ndarray:
+    if cfg.m > TABLE_MAX_M:
+        _check_words(cfg)
+        return _fold(x.astype(np.uint64), None, cfg)
+    _, _, red = _np_tables(cfg)
+    x = x.astype(np.uint64)
+    width = max(int(x.max()).bit_length(), 1) if x.size else 1
+    # Horner over m-bit chunks from the top: r <- r * x^m + chunk (mod f)
+    shift = ((width - 1) // cfg.m) * cfg.m
+    r = (x >> np.uint64(shift)).astype(np.int64)
+    while shift:
+        shift -= cfg.m
+        chunk = ((x >> np.uint64(shift)) & np.uint64(cfg.mask)).astype(np.int64)
+        r = red[r].astype(np.int64) ^ chunk
+    return r.astype(np.uint32)
+
+
+def batch_eval(op: str, a: np.ndarray, b: np.ndarray | None, cfg: GFConfig) -> np.ndarray:
+    if op not in BATCH_OPS:
+        raise ValueError(f"Unknown op '{op}'")
+    if op in BINARY_OPS:
+        if b is None or b.shape != a.shape:
+            raise ValueError(f"Op '{op}' needs operand arrays of equal length")
+    if op == "add":
+        if cfg.m > TABLE_MAX_M:
+            _check_words(cfg)
+            return _as_words(a, cfg) ^ _as_words(b, cfg)
+        return ((a.astype(np.uint32) ^ b.astype(np.uint32)) & cfg.mask).astype(np.uint32)
+    if op == "mul":
+        return batch_mul(a, b, cfg)
+    if op == "div":
+        return batch_div(a, b, cfg)
+    if op == "pow":
+        return batch_pow(a, b, cfg)
+    if op == "inv":
+        return batch_inv(a, cfg)
+    return batch_mod(a, cfg)
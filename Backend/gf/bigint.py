@@ -0,0 +1,117 @@
+"""Big-int GF(2^m) arithmetic for fields too large for tables (up to m = 571 and beyond).
+
+Products use a 4-bit windowed comb over the bytes of one operand, squaring
+spreads bits through a byte table, and reduction folds whole m-bit blocks
+using the low terms of the modulus, which is cheap for the trinomial and
+pentanomial moduli used by the NIST binary fields.
+"""
+from functools import lru_cache
+
+from .field import FIELD_CACHE_SIZE, GFConfig, poly_degree
+
+# Moduli with more low terms than this are folded with a windowed product
+_SPARSE_TERMS = 8
+
+
+def _spread(byte: int) -> int:
+    out = 0
+    for i in range(8):
+        if byte >> i & 1:
+            out |= 1 << (2 * i)
+    return out
+
+
+_SPREAD_BYTES = [_spread(i).to_bytes(2, "little") for i in range(256)]
+
+
+def clmul_window(a: int, b: int) -> int:
+    # Carry-less product, processing b four bits at a time from the top
+    if not a or not b:
+        return 0
+    tbl = [0] * 16
+    for u in range(1, 16):
+        tbl[u] = (tbl[u >> 1] << 1) ^ (a if u & 1 else 0)
+    r = 0
+    for byte in b.to_bytes((b.bit_length() + 7) // 8, "big"):
+        r = (r << 4) ^ tbl[byte >> 4]
+        r = (r << 4) ^ tbl[byte & 15]
+    return r
+
+
+def clsqr(a: int) -> int:
+    # Squaring over GF(2) interleaves zero bits between the coefficients
+    if not a:
+        return 0
+    raw = a.to_bytes((a.bit_length() + 7) // 8, "little")
+    return int.from_bytes(b"".join([_SPREAD_BYTES[x] for x in raw]), "little")
+
+
+class BigField:
+    __slots__ = ("cfg", "m", "mask", "low", "low_terms")
+
+    def __init__(self, cfg: GFConfig):
+        self.cfg = cfg
+        self.m = cfg.m
+        self.mask = cfg.mask
+        self.low = cfg.mod_poly & cfg.mask
+        terms = [i for i in range(self.m) if self.low >> i & 1]
+        self.low_terms = tuple(terms) if len(terms) <= _SPARSE_TERMS else None
+
+    def reduce(self, x: int) -> int:
+        m, mask, terms = self.m, self.mask, self.low_terms
+        hi = x >> m
+        while hi:
+            x &= mask
+            if terms is not None:
+                for k in terms:
+                    x ^= hi << k
+            else:
+                x ^= clmul_window(hi, self.low)
+            hi = x >> m
+        return x
+
+    def mul(self, a: int, b: int) -> int:
+        return self.reduce(clmul_window(a, b))
+
+    def sqr(self, a: int) -> int:
+        return self.reduce(clsqr(a))
+
+    def inv(self, a: int) -> int:
+        # Extended Euclid over GF(2)[x] on Python ints
+        if a == 0:
+            raise ZeroDivisionError("Zero has no multiplicative inverse in GF(2^m).")
+        u, v = a, self.cfg.mod_poly
+        g1, g2 = 1, 0
+        while u != 1:
+            if u == 0:
+                raise ValueError("gcd(a, mod_poly) != 1; inverse does not exist.")
+            shift = poly_degree(u) - poly_degree(v)
+            if shift < 0:
+                u, v = v, u
+                g1, g2 = g2, g1
+                shift = -shift
+            u ^= v << shift
+            g1 ^= g2 << shift
+        return self.reduce(g1)
+
+    def div(self, a: int, b: int) -> int:
+        if b == 0:
+            raise ZeroDivisionError("Division by zero in GF(2^m).")
+        return self.mul(a, self.inv(b))
+
+    def pow(self, a: int, n: int) -> int:
+        if n < 0:
+            a = self.inv(a)
+            n = -n
+        # By convention, a^0 = 1 even if a = 0
+        acc = 1
+        for bit in bin(n)[2:]:
+            acc = self.sqr(acc)
+            if bit == "1":
+                acc = self.mul(acc, a)
+        return acc
+
+
+@lru_cache(maxsize=FIELD_CACHE_SIZE)
+def get_big_field(cfg: GFConfig) -> BigField:
+    return BigField(cfg)
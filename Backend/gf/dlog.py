@@ -0,0 +1,182 @@
+"""Discrete logarithms in GF(2^m)*: brute force, baby-step giant-step, Pohlig-Hellman.
+
+``discrete_log(h, g, cfg)`` finds x with g^x = h, 0 <= x < ord(g). The method
+follows the factorization of ord(g), which divides 2^m - 1 (``factor_mersenne``):
+
+* small orders are searched power by power;
+* prime orders use baby-step giant-step, about 2 sqrt(n) multiplications;
+* composite orders use Pohlig-Hellman: one logarithm per prime-power factor
+  q^e, each found digit by digit in the subgroup of order q (by brute force or
+  BSGS), then combined with the CRT.
+
+Work is driven by the largest prime factor q of the order, so whole fields up to
+about m = 64 (2^64 - 1 has no factor above 2^23) are interactive, while e.g.
+m = 61 (2^61 - 1 is prime) is refused. Baby-step tables are cached per
+(field, base, order), bounded by entry count and by total steps; Pohlig-Hellman
+bases depend only on g, so repeated queries in a field with the same generator
+skip the precomputation.
+"""
+import threading
+from collections import OrderedDict
+from math import isqrt, prod
+from typing import Optional
+
+from .bigint import get_big_field
+from .field import GFConfig
+from .primitive import element_order, factor_mersenne
+from .tables import TABLE_MAX_M, get_tables
+
+DLOG_METHODS = ("brute-force", "bsgs", "pohlig-hellman")
+# Orders up to this are searched directly; forcing brute force stops at the limit
+BRUTE_FORCE_MAX = 1024
+BRUTE_FORCE_LIMIT = 1 << 20
+# Largest baby-step table: about 30 MB and a second or two to build
+BSGS_MAX_STEPS = 1 << 18
+DLOG_CACHE_SIZE = 16
+# Baby steps kept across all cached tables: two of the largest, about 60 MB
+DLOG_CACHE_STEPS = 1 << 19
+
+_tables: OrderedDict[tuple[GFConfig, int, int], tuple[dict[int, int], int]] = OrderedDict()
+_tables_lock = threading.Lock()
+
+
+def _field(cfg: GFConfig):
+    # Both expose mul / inv / pow on ints
+    return get_tables(cfg) if cfg.m <= TABLE_MAX_M else get_big_field(cfg)
+
+
+def _check_feasible(n: int) -> None:
+    if isqrt(n - 1) + 1 > BSGS_MAX_STEPS:
+        raise ValueError(f"Subgroup of order {n} is too large for baby-step giant-step")
+
+
+def brute_force(h: int, g: int, n: int, cfg: GFConfig) -> int:
+    """x in [0, n) with g^x = h, where g has order n."""
+    field = _field(cfg)
+    acc = 1
+    for x in range(n):
+        if acc == h:
+            return x
+        acc = field.mul(acc, g)
+    raise ValueError("h is not a power of g")
+
+
+def baby_steps(cfg: GFConfig, g: int, n: int) -> tuple[dict[int, int], int]:
+    """Table {g^j: j} for j < s = ceil(sqrt(n)) and the giant step g^-s, from
+    an LRU holding at most ``DLOG_CACHE_SIZE`` tables and ``DLOG_CACHE_STEPS``
+    steps in total."""
+    key = (cfg, g, n)
+    with _tables_lock:
+        entry = _tables.get(key)
+        if entry is not None:
+            _tables.move_to_end(key)
+            return entry
+    entry = _baby_steps(cfg, g, n)
+    with _tables_lock:
+        _tables[key] = entry
+        total = sum(len(table) for table, _ in _tables.values())
+        while len(_tables) > DLOG_CACHE_SIZE or total > DLOG_CACHE_STEPS:
+            table, _ = _tables.popitem(last=False)[1]
+            total -= len(table)
+    return entry
+
+
+def _baby_steps(cfg: GFConfig, g: int, n: int) -> tuple[dict[int, int], int]:
+    _check_feasible(n)
+    field = _field(cfg)
+    s = isqrt(n - 1) + 1
+    table = {}
+    acc = 1
+    for j in range(s):
+        table.setdefault(acc, j)
+        acc = field.mul(acc, g)
+    return table, field.inv(acc)
+
+
+def bsgs(h: int, g: int, n: int, cfg: GFConfig) -> int:
+    """x in [0, n) with g^x = h, where g has order n: h (g^-s)^i = g^j gives x = i s + j."""
+    table, giant = baby_steps(cfg, g, n)
+    field = _field(cfg)
+    s = len(table)
+    gamma = h
+    for i in range(s):
+        j = table.get(gamma)
+        if j is not None:
+            return (i * s + j) % n
+        gamma = field.mul(gamma, giant)
+    raise ValueError("h is not a power of g")
+
+
+def _prime_log(h: int, g: int, q: int, cfg: GFConfig) -> int:
+    return brute_force(h, g, q, cfg) if q <= BRUTE_FORCE_MAX else bsgs(h, g, q, cfg)
+
+
+def pohlig_hellman(h: int, g: int, n: int, factors: tuple[int, ...], cfg: GFConfig) -> int:
+    """x in [0, n) with g^x = h, where g has order n = prod(factors)."""
+    field = _field(cfg)
+    g_inv = field.inv(g)
+    x, modulus = 0, 1
+    for q in sorted(set(factors)):
+        e = factors.count(q)
+        # Base of order q, shared by every digit of this prime power
+        gamma = field.pow(g, n // q)
+        xq = 0
+        for k in range(e):
+            # Strip the digits found so far, then push into the subgroup of order q
+            hk = field.pow(field.mul(h, field.pow(g_inv, xq)), n // q ** (k + 1))
+            xq += _prime_log(hk, gamma, q, cfg) * q**k
+        # CRT: x = xq mod q^e
+        qe = q**e
+        x += modulus * ((xq - x) * pow(modulus, -1, qe) % qe)
+        modulus *= qe
+    if field.pow(g, x) != h:
+        raise ValueError("h is not a power of g")
+    return x
+
+
+def _order_factors(order: int, cfg: GFConfig) -> tuple[int, ...]:
+    # ord(g) divides 2^m - 1, so its factors come from that factorization
+    out = []
+    for p in factor_mersenne(cfg.m):
+        if order % (prod(out) * p) == 0:
+            out.append(p)
+    return tuple(out)
+
+
+def choose_method(order: int, factors: tuple[int, ...]) -> str:
+    if order <= BRUTE_FORCE_MAX:
+        return "brute-force"
+    if len(factors) == 1:
+        return "bsgs"
+    return "pohlig-hellman"
+
+
+def discrete_log(h: int, g: int, cfg: GFConfig, method: Optional[str] = None) -> tuple[int, int, str]:
+    """(x, ord(g), method) with g^x = h and 0 <= x < ord(g).
+
+    ``method`` forces one of ``DLOG_METHODS``; by default it follows the
+    factorization of ord(g). Raises ValueError when h is not a power of g or
+    the order has a prime factor too large for BSGS.
+    """
+    if method is not None and method not in DLOG_METHODS:
+        raise ValueError(f"Unknown method '{method}'")
+    g &= cfg.mask
+    h &= cfg.mask
+    if g == 0 or h == 0:
+        raise ValueError("Discrete logarithms are defined for nonzero elements only")
+    order = element_order(g, cfg)
+    factors = _order_factors(order, cfg)
+    method = method or choose_method(order, factors)
+    if _field(cfg).pow(h, order) != 1:
+        raise ValueError("h is not a power of g")
+    if method == "brute-force":
+        if order > BRUTE_FORCE_LIMIT:
+            raise ValueError(f"Order {order} is too large for brute force")
+        return brute_force(h, g, order, cfg), order, method
+    if method == "bsgs":
+        _check_feasible(order)
+        return bsgs(h, g, order, cfg), order, method
+    for q in set(factors):
+        if q > BRUTE_FORCE_MAX:
+            _check_feasible(q)
+    return pohlig_hellman(h, g, order, factors, cfg), order, method
@@ -0,0 +1,287 @@
+"""Elliptic curves y^2 + xy = x^3 + a x^2 + b over GF(2^m).
+
+Affine points are ``(x, y)`` tuples and the point at infinity is ``None``.
+Arithmetic runs in López-Dahab projective coordinates (X : Y : Z) with
+x = X / Z and y = Y / Z^2, where doubling and mixed addition need no inversion;
+only the final conversion back to affine divides, and ``batch_normalize``
+shares one inversion between any number of points (Montgomery's trick:
+invert the running product, then peel the single inverses off it).
+
+Scalar multiplication is the López-Dahab Montgomery ladder: it carries only
+the X and Z coordinates of kP and (k+1)P, one addition and one doubling per
+bit of k regardless of its value, and recovers y from their difference P at
+the end. ``batch_scalar_mul`` runs the ladders for many scalars and recovers
+all the results with a single inversion; ``scalar_mul_all`` does the same for
+any mix of points and curves over one field.
+"""
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from .bigint import BigField, get_big_field
+from .field import NIST_POLYS, GFConfig
+
+Point = Optional[tuple[int, int]]
+LDPoint = tuple[int, int, int]
+
+_LD_INFINITY: LDPoint = (1, 0, 0)
+
+
+@dataclass(frozen=True)
+class BinaryCurve:
+    cfg: GFConfig
+    a: int
+    b: int
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.a <= self.cfg.mask or not 0 <= self.b <= self.cfg.mask:
+            raise ValueError("Curve coefficients must be reduced field elements")
+        if self.b == 0:
+            raise ValueError("b must be nonzero (b = 0 gives a singular curve)")
+
+    @property
+    def field(self) -> BigField:
+        return get_big_field(self.cfg)
+
+    def contains(self, p: Point) -> bool:
+        if p is None:
+            return True
+        x, y = p
+        if not (0 <= x <= self.cfg.mask and 0 <= y <= self.cfg.mask):
+            return False
+        f = self.field
+        x2 = f.sqr(x)
+        return f.sqr(y) ^ f.mul(x, y) == f.mul(x2, x) ^ f.mul(self.a, x2) ^ self.b
+
+    def check(self, p: Point) -> None:
+        if not self.contains(p):
+            raise ValueError("Point is not on the curve")
+
+
+@dataclass(frozen=True)
+class NamedCurve:
+    curve: BinaryCurve
+    g: tuple[int, int]  # base point
+    n: int  # order of g
+    h: int  # cofactor
+
+
+def _nist(m: int, a: int, b: int, gx: int, gy: int, n: int, h: int) -> NamedCurve:
+    return NamedCurve(BinaryCurve(GFConfig(m, NIST_POLYS[m]), a, b), (gx, gy), n, h)
+
+
+# FIPS 186-4, D.1.3: Koblitz (K-) and pseudo-random (B-) curves
+NIST_CURVES: dict[str, NamedCurve] = {
+    "K-163": _nist(
+        163,
+        1,
+        1,
+        0x2FE13C0537BBC11ACAA07D793DE4E6D5E5C94EEE8,
+        0x289070FB05D38FF58321F2E800536D538CCDAA3D9,
+        0x4000000000000000000020108A2E0CC0D99F8A5EF,
+        2,
+    ),
+    "B-163": _nist(
+        163,
+        1,
+        0x20A601907B8C953CA1481EB10512F78744A3205FD,
+        0x3F0EBA16286A2D57EA0991168D4994637E8343E36,
+        0x0D51FBC6C71A0094FA2CDD545B11C5C0C797324F1,
+        0x40000000000000000000292FE77E70C12A4234C33,
+        2,
+    ),
+    "K-233": _nist(
+        233,
+        0,
+        1,
+        0x17232BA853A7E731AF129F22FF4149563A419C26BF50A4C9D6EEFAD6126,
+        0x1DB537DECE819B7F70F555A67C427A8CD9BF18AEB9B56E0C11056FAE6A3,
+        0x8000000000000000000000000000069D5BB915BCD46EFB1AD5F173ABDF,
+        4,
+    ),
+    "B-233": _nist(
+        233,
+        1,
+        0x066647EDE6C332C7F8C0923BB58213B333B20E9CE4281FE115F7D8F90AD,
+        0x0FAC9DFCBAC8313BB2139F1BB755FEF65BC391F8B36F8F8EB7371FD558B,
+        0x1006A08A41903350678E58528BEBF8A0BEFF867A7CA36716F7E01F81052,
+        0x1000000000000000000000000000013E974E72F8A6922031D2603CFE0D7,
+        2,
+    ),
+}
+
+
+# ---------- López-Dahab coordinates ----------
+
+
+def to_ld(p: Point) -> LDPoint:
+    return _LD_INFINITY if p is None else (p[0], p[1], 1)
+
+
+def ld_double(p: LDPoint, curve: BinaryCurve) -> LDPoint:
+    # Z3 = X1^2 Z1^2, X3 = X1^4 + b Z1^4, Y3 = b Z1^4 Z3 + X3 (a Z3 + Y1^2 + b Z1^4)
+    f = curve.field
+    x1, y1, z1 = p
+    if z1 == 0:
+        return _LD_INFINITY
+    x1_2, z1_2 = f.sqr(x1), f.sqr(z1)
+    z3 = f.mul(x1_2, z1_2)
+    if z3 == 0:
+        # x = 0: the point of order 2
+        return _LD_INFINITY
+    bz4 = f.mul(curve.b, f.sqr(z1_2))
+    x3 = f.sqr(x1_2) ^ bz4
+    inner = f.sqr(y1) ^ bz4
+    if curve.a:
+        inner ^= f.mul(curve.a, z3)
+    y3 = f.mul(bz4, z3) ^ f.mul(x3, inner)
+    return x3, y3, z3
+
+
+def ld_add(p: LDPoint, q: Point, curve: BinaryCurve) -> LDPoint:
+    """P + Q for P in López-Dahab and Q affine (mixed addition)."""
+    if q is None:
+        return p
+    x1, y1, z1 = p
+    if z1 == 0:
+        return to_ld(q)
+    f = curve.field
+    x2, y2 = q
+    z1_2 = f.sqr(z1)
+    a_ = f.mul(y2, z1_2) ^ y1
+    b_ = f.mul(x2, z1) ^ x1
+    if b_ == 0:
+        # Same x: Q = P or Q = -P
+        return ld_double(p, curve) if a_ == 0 else _LD_INFINITY
+    c = f.mul(z1, b_)
+    d = c if not curve.a else c ^ f.mul(curve.a, z1_2)
+    d = f.mul(f.sqr(b_), d)
+    z3 = f.sqr(c)
+    e = f.mul(a_, c)
+    x3 = f.sqr(a_) ^ d ^ e
+    g = f.mul(x2 ^ y2, f.sqr(z3))
+    y3 = f.mul(e ^ z3, x3 ^ f.mul(x2, z3)) ^ g
+    return x3, y3, z3
+
+
+def _batch_inv(values: list[int], f: BigField) -> list[int]:
+    # Montgomery's trick: one inversion and 3(n - 1) multiplications
+    prefix = []
+    acc = 1
+    for v in values:
+        prefix.append(acc)
+        acc = f.mul(acc, v)
+    inv = f.inv(acc) if values else 1
+    out = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        out[i] = f.mul(inv, prefix[i])
+        inv = f.mul(inv, values[i])
+    return out
+
+
+def batch_normalize(points: Sequence[LDPoint], curve: BinaryCurve) -> list[Point]:
+    """Affine forms of López-Dahab points, with a single field inversion."""
+    f = curve.field
+    finite = [i for i, p in enumerate(points) if p[2]]
+    out: list[Point] = [None] * len(points)
+    for i, z_inv in zip(finite, _batch_inv([points[i][2] for i in finite], f)):
+        x, y, _ = points[i]
+        out[i] = (f.mul(x, z_inv), f.mul(y, f.sqr(z_inv)))
+    return out
+
+
+def normalize(p: LDPoint, curve: BinaryCurve) -> Point:
+    return batch_normalize([p], curve)[0]
+
+
+# ---------- affine interface ----------
+
+
+def negate(p: Point) -> Point:
+    return None if p is None else (p[0], p[0] ^ p[1])
+
+
+def add(p: Point, q: Point, curve: BinaryCurve) -> Point:
+    return normalize(ld_add(to_ld(p), q, curve), curve)
+
+
+def double(p: Point, curve: BinaryCurve) -> Point:
+    return normalize(ld_double(to_ld(p), curve), curve)
+
+
+# ---------- Montgomery ladder ----------
+
+
+def _ladder(k: int, x: int, curve: BinaryCurve) -> tuple[int, int, int, int]:
+    # (X1, Z1, X2, Z2) of kP and (k+1)P for k >= 1 and x = x(P) != 0
+    f = curve.field
+    b = curve.b
+    x1, z1 = x, 1
+    z2 = f.sqr(x)
+    x2 = f.sqr(z2) ^ b
+    for i in range(k.bit_length() - 2, -1, -1):
+        # Madd: Z = (X1 Z2 + X2 Z1)^2, X = x Z + X1 Z2 X2 Z1; Mdouble: X^4 + b Z^4, X^2 Z^2
+        t1, t2 = f.mul(x1, z2), f.mul(x2, z1)
+        z_add = f.sqr(t1 ^ t2)
+        x_add = f.mul(x, z_add) ^ f.mul(t1, t2)
+        if k >> i & 1:
+            xx, zz = f.sqr(x2), f.sqr(z2)
+            x1, z1 = x_add, z_add
+            x2, z2 = f.sqr(xx) ^ f.mul(b, f.sqr(zz)), f.mul(xx, zz)
+        else:
+            xx, zz = f.sqr(x1), f.sqr(z1)
+            x2, z2 = x_add, z_add
+            x1, z1 = f.sqr(xx) ^ f.mul(b, f.sqr(zz)), f.mul(xx, zz)
+    return x1, z1, x2, z2
+
+
+def scalar_mul_all(jobs: Sequence[tuple[int, Point, BinaryCurve]]) -> list[Point]:
+    """[k P for (k, P, curve) in jobs], with one shared inversion for every y recovery.
+
+    The curves may differ but must share one field.
+    """
+    out: list[Point] = [None] * len(jobs)
+    pending = []  # (index, curve, P, X1, Z1, X2, Z2, negate)
+    for i, (k, p, curve) in enumerate(jobs):
+        curve.check(p)
+        neg = k < 0
+        k = -k if neg else k
+        if k == 0 or p is None:
+            continue
+        x = p[0]
+        if x == 0:
+            # P has order 2
+            out[i] = p if k & 1 else None
+            continue
+        x1, z1, x2, z2 = _ladder(k, x, curve)
+        if z1 == 0:
+            continue
+        if z2 == 0:
+            # (k+1)P = O, so kP = -P
+            out[i] = p if neg else negate(p)
+            continue
+        pending.append((i, curve, p, x1, z1, x2, z2, neg))
+    if not pending:
+        return out
+    if len({job[1].cfg for job in pending}) > 1:
+        raise ValueError("Batched curves must share one field")
+    f = pending[0][1].field
+    # y recovery, with inv = 1 / (x Z1 Z2): x_k = X1 / Z1 = X1 Z2 x inv and
+    # y_k = (x + x_k) [(X1 + x Z1)(X2 + x Z2) + (x^2 + y) Z1 Z2] inv + y
+    inverses = _batch_inv([f.mul(p[0], f.mul(z1, z2)) for _, _, p, _, z1, _, z2, _ in pending], f)
+    for (i, _, (x, y), x1, z1, x2, z2, neg), inv in zip(pending, inverses):
+        z12 = f.mul(z1, z2)
+        xk = f.mul(f.mul(f.mul(x1, z2), x), inv)
+        num = f.mul(x1 ^ f.mul(x, z1), x2 ^ f.mul(x, z2)) ^ f.mul(f.sqr(x) ^ y, z12)
+        yk = f.mul(f.mul(x ^ xk, num), inv) ^ y
+        out[i] = negate((xk, yk)) if neg else (xk, yk)
+    return out
+
+
+def batch_scalar_mul(scalars: Sequence[int], p: Point, curve: BinaryCurve) -> list[Point]:
+    """[k P for k in scalars], recovered with a single inversion."""
+    return scalar_mul_all([(k, p, curve) for k in scalars])
+
+
+def scalar_mul(k: int, p: Point, curve: BinaryCurve) -> Point:
+    """k P by the Montgomery ladder (negative k gives -(|k| P))."""
+    return scalar_mul_all([(k, p, curve)])[0]
@@ -0,0 +1,321 @@
+"""Compiled expressions over GF(2)[x] and GF(2^m).
+
+``(a·b⁻¹ + c)^5 mod f`` is lexed, parsed and compiled once into a flat
+register program (a DAG with common subexpressions merged and constant
+subtrees folded), then evaluated for any number of variable bindings. Compiled
+programs are memoized by the source text and by its token stream, so repeated
+expressions skip parsing entirely.
+
+Numeric literals (decimal, ``0x..``, ``0b..``) are field elements by their bit
+pattern, ``x`` is the indeterminate, other identifiers are variables, and a
+trailing ``mod <expr>`` picks the modulus. Without a modulus the expression is
+evaluated in GF(2)[x], where division and negative powers are undefined.
+"""
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Union
+
+from .bigint import clmul_window, clsqr
+from .fast import get_engine
+from .field import GFConfig, poly_degree, poly_mod
+from .notation import to_ascii
+from .tables import TABLE_MAX_M, get_tables
+
+EXPR_CACHE_SIZE = 1024
+# Largest degree materialized when evaluating or folding without a modulus
+MAX_POLY_DEGREE = 1 << 16
+
+_TOKEN = re.compile(
+    r"\s*(?:(?P<num>0[xX][0-9a-fA-F]+|0[bB][01]+|\d+)|(?P<name>[A-Za-z_][A-Za-z0-9_]*)|(?P<op>\*\*|[-+*/^()]))"
+)
+
+# Instruction opcodes; operands are earlier register indices
+CONST, VAR, ADD, MUL, DIV, POW = "const", "var", "add", "mul", "div", "pow"
+
+Instr = tuple[str, Union[int, str], int]
+
+
+def tokenize(source: str) -> tuple[str, ...]:
+    text = to_ascii(source)
+    tokens = []
+    pos = 0
+    while pos < len(text):
+        if text[pos:].isspace():
+            break
+        match = _TOKEN.match(text, pos)
+        if not match:
+            raise ValueError(f"Unexpected character '{text[pos:].strip()[0]}' in expression")
+        tok = match.group(match.lastgroup)
+        if match.lastgroup == "num":
+            tok = str(int(tok, 0))
+        elif tok == "**":
+            tok = "^"
+        tokens.append(tok)
+        pos = match.end()
+    if not tokens:
+        raise ValueError("Empty expression")
+    return tuple(tokens)
+
+
+def _poly_pow(a: int, n: int) -> int:
+    if n < 0:
+        raise ValueError("Negative powers need a modulus")
+    if a > 1 and poly_degree(a) * n > MAX_POLY_DEGREE:
+        raise ValueError(f"Result degree exceeds {MAX_POLY_DEGREE}; add a modulus")
+    acc = 1
+    for bit in bin(n)[2:]:
+        acc = clsqr(acc)
+        if bit == "1":
+            acc = clmul_window(acc, a)
+    return acc
+
+
+def _poly_mul(a: int, b: int) -> int:
+    if poly_degree(a) + poly_degree(b) > MAX_POLY_DEGREE:
+        raise ValueError(f"Result degree exceeds {MAX_POLY_DEGREE}; add a modulus")
+    return clmul_window(a, b)
+
+
+class _Builder:
+    """Emits instructions, merging identical nodes and folding constants."""
+
+    def __init__(self):
+        self.code: list[Instr] = []
+        self.index: dict[Instr, int] = {}
+
+    def emit(self, instr: Instr) -> int:
+        op, a, b = instr
+        if op in (ADD, MUL) and a > b:
+            instr = (op, b, a)  # commutative: canonical operand order
+        folded = self._fold(instr)
+        if folded is not None:
+            instr = (CONST, folded, 0)
+        if instr not in self.index:
+            self.index[instr] = len(self.code)
+            self.code.append(instr)
+        return self.index[instr]
+
+    def _const(self, reg: int) -> Optional[int]:
+        op, value, _ = self.code[reg]
+        return value if op == CONST else None
+
+    def _fold(self, instr: Instr) -> Optional[int]:
+        op, a, b = instr
+        if op in (CONST, VAR, DIV):
+            return None
+        ca = self._const(a)
+        if ca is None:
+            return None
+        try:
+            if op == POW:
+                return _poly_pow(ca, b) if b >= 0 else None
+            cb = self._const(b)
+            if cb is None:
+                return None
+            return ca ^ cb if op == ADD else _poly_mul(ca, cb)
+        except ValueError:
+            return None  # left for evaluation time, where a modulus may apply
+
+
+class _Parser:
+    def __init__(self, tokens: tuple[str, ...], builder: _Builder):
+        self.tokens = tokens
+        self.pos = 0
+        self.b = builder
+
+    def peek(self) -> Optional[str]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self, expected: Optional[str] = None) -> str:
+        tok = self.peek()
+        if tok is None or (expected is not None and tok != expected):
+            raise ValueError(f"Expected '{expected or 'operand'}' but found '{tok or 'end of input'}'")
+        self.pos += 1
+        return tok
+
+    def top(self) -> tuple[int, Optional[int]]:
+        body = self.sum()
+        modulus = None
+        if self.peek() == "mod":
+            self.take()
+            modulus = self.sum()
+        if self.peek() is not None:
+            raise ValueError(f"Unexpected '{self.peek()}'")
+        return body, modulus
+
+    def sum(self) -> int:
+        if self.peek() in ("+", "-"):
+            self.take()  # unary sign; -a = a in characteristic 2
+        reg = self.product()
+        while self.peek() in ("+", "-"):
+            self.take()  # subtraction is addition in characteristic 2
+            reg = self.b.emit((ADD, reg, self.product()))
+        return reg
+
+    def product(self) -> int:
+        reg = self.power()
+        while True:
+            tok = self.peek()
+            if tok in ("*", "/"):
+                self.take()
+                rhs = self.power()
+                reg = self.b.emit((MUL if tok == "*" else DIV, reg, rhs))
+            elif tok is not None and (tok == "(" or tok[0].isalnum() or tok[0] == "_") and tok != "mod":
+                # implicit multiplication: 3x, x(x + 1), (a)(b)
+                reg = self.b.emit((MUL, reg, self.power()))
+            else:
+                return reg
+
+    def power(self) -> int:
+        reg = self.atom()
+        while self.peek() == "^":
+            self.take()
+            sign = -1 if self.peek() == "-" else 1
+            if sign < 0:
+                self.take()
+            tok = self.take()
+            if not tok.isdigit():
+                raise ValueError("Exponents must be integer literals")
+            reg = self.b.emit((POW, reg, sign * int(tok)))
+        return reg
+
+    def atom(self) -> int:
+        tok = self.take()
+        if tok == "(":
+            reg = self.sum()
+            self.take(")")
+            return reg
+        if tok.isdigit():
+            return self.b.emit((CONST, int(tok), 0))
+        if tok == "x":
+            return self.b.emit((CONST, 0b10, 0))
+        if tok == "mod" or not (tok[0].isalpha() or tok[0] == "_"):
+            raise ValueError(f"Unexpected '{tok}'")
+        return self.b.emit((VAR, tok, 0))
+
+
+@dataclass(frozen=True)
+class CompiledExpr:
+    source: str  # canonical token text, the cache key
+    code: tuple[Instr, ...]
+    result: int
+    modulus: Optional[int]  # register holding the modulus, if any
+    result_plan: tuple[int, ...]  # registers the result depends on, in order
+    modulus_plan: tuple[int, ...]
+
+    @property
+    def variables(self) -> tuple[str, ...]:
+        return tuple(sorted({a for op, a, _ in self.code if op == VAR}))
+
+    def evaluate(
+        self, env: Optional[dict[str, int]] = None, cfg: Optional[GFConfig] = None, mode: str = "standard"
+    ) -> int:
+        """Evaluate with variable bindings; ``cfg`` is the field when there is no ``mod``.
+
+        ``mode`` picks the big-field algorithms (see ``fast.ENGINE_MODES``).
+        """
+        env = env or {}
+        values: list[int] = [0] * len(self.code)
+        for reg, (op, a, b) in enumerate(self.code):
+            if op == CONST:
+                values[reg] = a
+            elif op == VAR:
+                if a not in env:
+                    raise ValueError(f"No value for variable '{a}'")
+                if env[a] < 0:
+                    raise ValueError(f"Variable '{a}' must be a non-negative bit pattern")
+                values[reg] = env[a]
+        if self.modulus is not None:
+            mod_poly = self._run(values, None, self.modulus_plan, mode)
+            if mod_poly < 2:
+                raise ValueError("Modulus must have degree at least 1")
+            cfg = GFConfig(poly_degree(mod_poly), mod_poly)
+        return self._run(values, cfg, self.result_plan, mode)
+
+    def _run(self, values: list[int], cfg: Optional[GFConfig], plan: tuple[int, ...], mode: str) -> int:
+        ring = _ring(cfg, mode) if cfg else None
+        out = list(values)
+        for reg in plan:
+            op, a, b = self.code[reg]
+            if op in (CONST, VAR):
+                out[reg] = poly_mod(values[reg], cfg.mod_poly) if cfg else values[reg]
+            elif op == ADD:
+                out[reg] = out[a] ^ out[b]
+            elif ring is None:
+                if op == MUL:
+                    out[reg] = _poly_mul(out[a], out[b])
+                elif op == POW:
+                    out[reg] = _poly_pow(out[a], b)
+                else:
+                    raise ValueError("Division needs a modulus")
+            elif op == MUL:
+                out[reg] = ring.mul(out[a], out[b])
+            elif op == DIV:
+                out[reg] = ring.div(out[a], out[b])
+            else:
+                out[reg] = ring.pow(out[a], b)
+        return out[plan[-1]]
+
+
+def _ring(cfg: GFConfig, mode: str):
+    # Log tables need an irreducible modulus; big-int arithmetic works modulo anything
+    if cfg.m <= TABLE_MAX_M:
+        try:
+            return get_tables(cfg)
+        except ValueError:
+            pass
+    return get_engine(cfg, mode)
+
+
+def _plan(code: list[Instr], target: int) -> tuple[int, ...]:
+    needed = {target}
+    for reg in range(target, -1, -1):
+        if reg in needed:
+            op, a, b = code[reg]
+            if op in (ADD, MUL, DIV):
+                needed.update((a, b))
+            elif op == POW:
+                needed.add(a)
+    return tuple(sorted(needed))
+
+
+def _compact(code: list[Instr], roots: list[int]) -> tuple[list[Instr], dict[int, int]]:
+    # Drop registers no root depends on (e.g. constants absorbed by folding)
+    live: set[int] = set()
+    for root in roots:
+        live.update(_plan(code, root))
+    remap: dict[int, int] = {}
+    out: list[Instr] = []
+    for reg in sorted(live):
+        op, a, b = code[reg]
+        if op in (ADD, MUL, DIV):
+            a, b = remap[a], remap[b]
+        elif op == POW:
+            a = remap[a]
+        remap[reg] = len(out)
+        out.append((op, a, b))
+    return out, remap
+
+
+@lru_cache(maxsize=EXPR_CACHE_SIZE)
+def _compile_tokens(tokens: tuple[str, ...]) -> CompiledExpr:
+    builder = _Builder()
+    result, modulus = _Parser(tokens, builder).top()
+    roots = [result] if modulus is None else [result, modulus]
+    code, remap = _compact(builder.code, roots)
+    result = remap[result]
+    modulus = remap[modulus] if modulus is not None else None
+    return CompiledExpr(
+        source=" ".join(tokens),
+        code=tuple(code),
+        result=result,
+        modulus=modulus,
+        result_plan=_plan(code, result),
+        modulus_plan=_plan(code, modulus) if modulus is not None else (),
+    )
+
+
+@lru_cache(maxsize=EXPR_CACHE_SIZE)
+def compile_expr(source: str) -> CompiledExpr:
+    return _compile_tokens(tokenize(source))
@@ -0,0 +1,167 @@
+"""Factorization over GF(2): square-free, distinct-degree, equal-degree.
+
+Polynomials are ints (bit i = coefficient of x^i), as everywhere in ``gf``.
+``factor`` runs the classic pipeline:
+
+1. square-free decomposition with gcd(f, f'), taking square roots of the
+   p-th power part (f' = 0 means f is a square in characteristic 2);
+2. distinct-degree factorization: gcd(x^(2^i) - x, f) collects the product of
+   all irreducible factors of degree i;
+3. equal-degree splitting (Cantor-Zassenhaus): for random r the trace
+   r + r^2 + ... + r^(2^(d-1)) is 0 or 1 in each factor's residue field, so
+   gcd(trace, f) separates factors with probability about 1/2.
+
+Arithmetic modulo f reuses ``BigField``. Every loop checks an optional
+deadline so callers can bound the work; ``factor_many`` spreads a batch over a
+process pool (the grading pool, ``grading.worker.get_pool``), one time budget
+per polynomial.
+"""
+import random
+import time
+from concurrent.futures import Executor
+from functools import partial
+from typing import Optional
+
+from .bigint import BigField
+from .field import GFConfig, poly_degree
+from .gcd import gcd as poly_gcd
+
+_X = 0b10
+
+Factorization = list[tuple[int, int]]
+
+
+class FactorTimeout(TimeoutError):
+    pass
+
+
+def poly_divmod(a: int, b: int) -> tuple[int, int]:
+    if b == 0:
+        raise ZeroDivisionError("Division by the zero polynomial")
+    q = 0
+    len_b = b.bit_length()
+    len_a = a.bit_length()
+    while len_a >= len_b:
+        shift = len_a - len_b
+        q |= 1 << shift
+        a ^= b << shift
+        len_a = a.bit_length()
+    return q, a
+
+
+def poly_div(a: int, b: int) -> int:
+    return poly_divmod(a, b)[0]
+
+
+def derivative(f: int) -> int:
+    # d/dx x^i = i x^(i-1): only odd powers survive, each moving down by one
+    n = f.bit_length()
+    even_bits = ((1 << (n + n % 2)) - 1) // 3  # 0b0101...01
+    return (f >> 1) & even_bits
+
+
+def square_root(f: int) -> int:
+    """g with g^2 = f, for f whose odd coefficients are all zero."""
+    if not f:
+        return 0
+    return int(bin(f)[2:][::-1][::2][::-1], 2)
+
+
+def _check(deadline: Optional[float]) -> None:
+    if deadline is not None and time.monotonic() > deadline:
+        raise FactorTimeout("Factorization exceeded its time budget")
+
+
+def _ring(f: int) -> BigField:
+    return BigField(GFConfig(poly_degree(f), f))
+
+
+def square_free(f: int) -> Factorization:
+    """Pairs (g, e) with g square-free, pairwise coprime and f = prod g^e."""
+    out: Factorization = []
+    c = poly_gcd(f, derivative(f))
+    w = poly_div(f, c)
+    i = 1
+    while w != 1:
+        y = poly_gcd(w, c)
+        z = poly_div(w, y)
+        if z != 1:
+            out.append((z, i))
+        i += 1
+        w = y
+        c = poly_div(c, y)
+    if c != 1:
+        # What is left only has even exponents: c = s^2
+        out.extend((g, 2 * e) for g, e in square_free(square_root(c)))
+    return out
+
+
+def distinct_degree(f: int, deadline: Optional[float] = None) -> list[tuple[int, int]]:
+    """Pairs (g, d): g is the product of all degree-d irreducible factors of square-free f."""
+    out = []
+    ring = _ring(f)
+    h = _X
+    d = 1
+    while poly_degree(f) >= 2 * d:
+        _check(deadline)
+        h = ring.sqr(h)
+        g = poly_gcd(h ^ _X, f)
+        if g != 1:
+            out.append((g, d))
+            f = poly_div(f, g)
+            if f == 1:
+                return out
+            ring = _ring(f)
+            h = ring.reduce(h)
+        d += 1
+    if f != 1:
+        out.append((f, poly_degree(f)))
+    return out
+
+
+def equal_degree(f: int, d: int, rng: random.Random, deadline: Optional[float] = None) -> list[int]:
+    """Irreducible factors of f, a product of distinct degree-d irreducibles."""
+    n = poly_degree(f)
+    if n == d:
+        return [f]
+    ring = _ring(f)
+    while True:
+        _check(deadline)
+        r = rng.getrandbits(n) or 1
+        t = acc = r
+        for _ in range(d - 1):
+            t = ring.sqr(t)
+            acc ^= t
+        g = poly_gcd(acc, f)
+        if 0 < poly_degree(g) < n:
+            return equal_degree(g, d, rng, deadline) + equal_degree(poly_div(f, g), d, rng, deadline)
+
+
+def factor(f: int, deadline: Optional[float] = None, seed: int = 0) -> Factorization:
+    """Irreducible factors of f with multiplicities, sorted by (degree, value).
+
+    Raises ``FactorTimeout`` once ``time.monotonic()`` passes ``deadline``.
+    """
+    if f == 0:
+        raise ValueError("The zero polynomial has no factorization")
+    rng = random.Random(seed)
+    found: dict[int, int] = {}
+    for part, e in square_free(f):
+        for g, d in distinct_degree(part, deadline):
+            for p in equal_degree(g, d, rng, deadline):
+                found[p] = found.get(p, 0) + e
+    return sorted(found.items(), key=lambda pe: (poly_degree(pe[0]), pe[0]))
+
+
+def factor_with_budget(f: int, budget: float) -> Optional[Factorization]:
+    """``factor`` limited to ``budget`` seconds; None when it runs out."""
+    try:
+        return factor(f, time.monotonic() + budget)
+    except FactorTimeout:
+        return None
+
+
+def factor_many(polys: list[int], budget: float, pool: Executor) -> list[Optional[Factorization]]:
+    """Factor a batch in ``pool``'s worker processes; entries over budget come back as None."""
+    run = partial(factor_with_budget, budget=budget)
+    return list(pool.map(run, polys, chunksize=max(1, len(polys) // 64)))
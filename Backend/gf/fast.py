@@ -0,0 +1,209 @@
+"""Alternative big-field algorithms, selected per request with ``mode``.
+
+``standard`` is ``BigField``: extended Euclid for inversion and left-to-right
+square-and-multiply. ``fast`` changes exponentiation:
+
+* sliding windows over precomputed odd powers, each held as a byte comb so a
+  multiplication by it reads the other operand a byte at a time;
+* squaring is linear over GF(2), so runs of w squarings go through a
+  precomputed Frobenius map a -> a^(2^w), one table read per nibble of a.
+
+``itoh-tsujii`` additionally inverts with Itoh-Tsujii,
+a^-1 = (a^(2^(m-1) - 1))^2, following a precomputed addition chain for m - 1
+with table-driven multi-squarings: about log2(m) multiplications instead of a
+bit-by-bit Euclid. On CPython the Euclid loop runs on big-int shifts in C and
+stays ahead (see ``python -m Backend.utils.gf_bench``), so ``fast`` keeps it.
+
+``normal`` exponentiates through a normal basis of the field
+(``normal.NormalField``), where every squaring is a rotation.
+
+Frobenius tables cost about ``m / 4 * 16`` field elements each, so these
+fields are cached separately and fewer of them than in ``get_big_field``.
+"""
+from functools import lru_cache
+
+from .bigint import BigField, get_big_field
+from .field import GFConfig
+from .normal import get_normal_field
+
+ENGINE_MODES = ("standard", "fast", "itoh-tsujii", "normal")
+FAST_CACHE_SIZE = 8
+# Below this many squarings a multi-squaring table is not worth a lookup pass
+_MULTISQR_MIN = 4
+_NIBBLE = 4
+_COMB_MIN_M = 192
+
+
+def addition_chain(n: int) -> list[tuple[int, int]]:
+    """Binary addition chain for n as (i, j) steps: e_{i+j} from e_i and e_j.
+
+    Starting from e_1, each step doubles the current exponent or adds 1, so
+    the chain has about log2(n) + popcount(n) steps.
+    """
+    steps: list[tuple[int, int]] = []
+    cur = 1
+    for bit in bin(n)[3:]:
+        steps.append((cur, cur))
+        cur *= 2
+        if bit == "1":
+            steps.append((cur, 1))
+            cur += 1
+    return steps
+
+
+def _window(bits: int) -> int:
+    # Window width balancing the odd-power tables against multiplications saved
+    for w, limit in ((1, 16), (2, 48), (3, 160), (4, 448), (5, 1280)):
+        if bits <= limit:
+            return w
+    return 6
+
+
+def _comb(a: int) -> list[int]:
+    # Carry-less multiples of a by every byte value
+    tbl = [0] * 256
+    for u in range(1, 256):
+        tbl[u] = (tbl[u >> 1] << 1) ^ (a if u & 1 else 0)
+    return tbl
+
+
+def _comb_mul(comb: list[int], b: int) -> int:
+    r = 0
+    for byte in b.to_bytes((b.bit_length() + 7) // 8, "big"):
+        r = (r << 8) ^ comb[byte]
+    return r
+
+
+class FastField(BigField):
+    __slots__ = ("_linear",)
+
+    def __init__(self, cfg: GFConfig):
+        super().__init__(cfg)
+        self._linear: dict[int, list[list[int]]] = {}
+
+    def _table(self, k: int) -> list[list[int]]:
+        # Nibble tables of the GF(2)-linear map a -> a^(2^k)
+        table = self._linear.get(k)
+        if table is None:
+            # (x^i)^(2^k) = (x^(2^k))^i
+            root = 2
+            for _ in range(k):
+                root = self.sqr(root)
+            images = [1]
+            for _ in range(self.m - 1):
+                images.append(self.mul(images[-1], root))
+            images += [0] * (-self.m % 8)
+            table = []
+            for j in range(0, len(images), _NIBBLE):
+                row = [0] * 16
+                for v in range(1, 16):
+                    low = v & -v
+                    row[v] = row[v ^ low] ^ images[j + low.bit_length() - 1]
+                table.append(row)
+            self._linear[k] = table
+        return table
+
+    def frobenius(self, a: int, k: int = 1) -> int:
+        """a^(2^k) through the precomputed linear map."""
+        k %= self.m
+        if k < _MULTISQR_MIN:
+            for _ in range(k):
+                a = self.sqr(a)
+            return a
+        out = 0
+        table = self._table(k)
+        for j, byte in enumerate(a.to_bytes((self.m + 7) // 8, "little")):
+            if byte:
+                out ^= table[2 * j][byte & 15] ^ table[2 * j + 1][byte >> 4]
+        return out
+
+    def pow(self, a: int, n: int) -> int:
+        if n < 0:
+            a = self.inv(a)
+            n = -n
+        if n == 0:
+            return 1
+        w = _window(n.bit_length())
+        # combs[k] multiplies by a^(2k + 1) one byte of the other operand at a time
+        a2 = self.sqr(a)
+        odd = [a]
+        for _ in range((1 << (w - 1)) - 1):
+            odd.append(self.mul(odd[-1], a2))
+        # Byte combs only pay for their 255 shifts once operands span many bytes
+        combs = [_comb(x) for x in odd] if self.m >= _COMB_MIN_M else None
+        bits = bin(n)[2:]
+        acc = 1
+        pending = 0  # squarings owed to acc, applied in blocks of w via the Frobenius table
+        i = 0
+        while i < len(bits):
+            if bits[i] == "0":
+                pending += 1
+                i += 1
+                continue
+            # Longest window of at most w bits starting here and ending in a 1
+            end = min(i + w, len(bits))
+            while bits[end - 1] == "0":
+                end -= 1
+            acc = self._square_n(acc, pending + end - i, w)
+            pending = 0
+            k = int(bits[i:end], 2) >> 1
+            acc = self.reduce(_comb_mul(combs[k], acc)) if combs else self.mul(acc, odd[k])
+            i = end
+        return self._square_n(acc, pending, w)
+
+    def _square_n(self, a: int, n: int, block: int) -> int:
+        if a == 1:
+            return a
+        if block >= _MULTISQR_MIN and self.m >= _COMB_MIN_M:
+            while n >= block:
+                a = self.frobenius(a, block)
+                n -= block
+        for _ in range(n):
+            a = self.sqr(a)
+        return a
+
+
+class ItohTsujiiField(FastField):
+    __slots__ = ("chain",)
+
+    def __init__(self, cfg: GFConfig):
+        super().__init__(cfg)
+        self.chain = addition_chain(self.m - 1) if self.m > 1 else []
+
+    def inv(self, a: int) -> int:
+        if a == 0:
+            raise ZeroDivisionError("Zero has no multiplicative inverse in GF(2^m).")
+        # beta holds a^(2^e - 1) for each exponent e reached along the chain
+        beta = {1: a}
+        cur = 1
+        for i, j in self.chain:
+            cur = i + j
+            beta[cur] = self.mul(self.frobenius(beta[i], j), beta[j])
+        result = self.sqr(beta[cur])
+        if self.mul(result, a) != 1:
+            # Only possible when mod_poly is reducible
+            raise ValueError("gcd(a, mod_poly) != 1; inverse does not exist.")
+        return result
+
+
+@lru_cache(maxsize=FAST_CACHE_SIZE)
+def get_fast_field(cfg: GFConfig) -> FastField:
+    return FastField(cfg)
+
+
+@lru_cache(maxsize=FAST_CACHE_SIZE)
+def get_itoh_tsujii_field(cfg: GFConfig) -> ItohTsujiiField:
+    return ItohTsujiiField(cfg)
+
+
+def get_engine(cfg: GFConfig, mode: str = "standard") -> BigField:
+    """Big-field engine for ``mode`` (one of ``ENGINE_MODES``)."""
+    if mode == "standard":
+        return get_big_field(cfg)
+    if mode == "fast":
+        return get_fast_field(cfg)
+    if mode == "itoh-tsujii":
+        return get_itoh_tsujii_field(cfg)
+    if mode == "normal":
+        return get_normal_field(cfg)
+    raise ValueError(f"Unknown engine mode '{mode}'")
@@ -0,0 +1,165 @@
+"""GF(2^m) field configuration and bitwise reference arithmetic.
+
+Elements are ints whose bits are polynomial coefficients over GF(2), the same
+encoding the calculator uses in ``Frontend/src/lib/gf2m.ts``.
+"""
+from dataclasses import dataclass
+
+# Mirrors IRRED_DEFAULTS in Frontend/src/lib/irreducibles.ts
+IRRED_DEFAULTS: dict[int, int] = {
+    2: 0x7,  # x^2 + x + 1
+    3: 0xB,  # x^3 + x + 1
+    4: 0x13,  # x^4 + x + 1
+    5: 0x25,  # x^5 + x^2 + 1
+    6: 0x43,  # x^6 + x + 1
+    7: 0x89,  # x^7 + x^3 + 1
+    8: 0x11B,  # AES: x^8 + x^4 + x^3 + x + 1
+}
+
+# Bounds every per-field lru_cache (tables, big-int contexts, ...)
+FIELD_CACHE_SIZE = 32
+
+# NIST binary-field reduction polynomials (FIPS 186-4, D.1.3)
+NIST_POLYS: dict[int, int] = {
+    163: (1 << 163) | (1 << 7) | (1 << 6) | (1 << 3) | 1,
+    233: (1 << 233) | (1 << 74) | 1,
+    283: (1 << 283) | (1 << 12) | (1 << 7) | (1 << 5) | 1,
+    409: (1 << 409) | (1 << 87) | 1,
+    571: (1 << 571) | (1 << 10) | (1 << 5) | (1 << 2) | 1,
+}
+
+
+def poly_degree(p: int) -> int:
+    # -1 for the zero polynomial
+    return p.bit_length() - 1
+
+
+@dataclass(frozen=True)
+class GFConfig:
+    m: int
+    mod_poly: int  # irreducible polynomial with top bit at x^m
+
+    def __post_init__(self) -> None:
+        if self.m < 1:
+            raise ValueError("m must be at least 1")
+        if poly_degree(self.mod_poly) != self.m:
+            raise ValueError("mod_poly must have degree m")
+
+    @property
+    def mask(self) -> int:
+        return (1 << self.m) - 1
+
+    @property
+    def size(self) -> int:
+        return 1 << self.m
+
+
+def default_config(m: int) -> GFConfig:
+    mod_poly = IRRED_DEFAULTS.get(m) or NIST_POLYS.get(m)
+    if mod_poly is None:
+        raise ValueError(f"No default irreducible polynomial for m={m}")
+    return GFConfig(m, mod_poly)
+
+
+def prime_factors(n: int) -> list[int]:
+    # Distinct prime factors by trial division; only meant for small n
+    factors = []
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            factors.append(p)
+            while n % p == 0:
+                n //= p
+        p += 1
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
+# ---------- GF(2)[x] helpers ----------
+
+def clmul(a: int, b: int) -> int:
+    # Carry-less (XOR) product of two polynomials, no reduction
+    prod = 0
+    while b:
+        if b & 1:
+            prod ^= a
+        a <<= 1
+        b >>= 1
+    return prod
+
+
+def poly_mod(x: int, mod_poly: int) -> int:
+    deg_mod = poly_degree(mod_poly)
+    if deg_mod < 0:
+        raise ValueError("Invalid mod_poly (zero).")
+    deg = poly_degree(x)
+    while deg >= deg_mod:
+        x ^= mod_poly << (deg - deg_mod)
+        deg = poly_degree(x)
+    return x
+
+
+def poly_gcd(a: int, b: int) -> int:
+    # bit_length() is inlined; this loop is hot in irreducibility testing
+    while b:
+        len_b = b.bit_length()
+        len_a = a.bit_length()
+        while len_a >= len_b:
+            a ^= b << (len_a - len_b)
+            len_a = a.bit_length()
+        a, b = b, a
+    return a
+
+
+# ---------- Bitwise field arithmetic (reference, no tables) ----------
+
+def mul_bitwise(a: int, b: int, cfg: GFConfig) -> int:
+    # Interleaved shift-and-add; iterates over the bits of b only
+    top = 1 << cfg.m
+    a &= cfg.mask
+    b &= cfg.mask
+    prod = 0
+    while b:
+        if b & 1:
+            prod ^= a
+        b >>= 1
+        a <<= 1
+        if a & top:
+            a ^= cfg.mod_poly
+    return prod
+
+
+def pow_bitwise(a: int, n: int, cfg: GFConfig) -> int:
+    if n < 0:
+        a = inv_bitwise(a, cfg)
+        n = -n
+    # By convention, a^0 = 1 even if a = 0
+    acc = 1
+    base = a & cfg.mask
+    while n:
+        if n & 1:
+            acc = mul_bitwise(acc, base, cfg)
+        base = mul_bitwise(base, base, cfg)
+        n >>= 1
+    return acc
+
+
+def inv_bitwise(a: int, cfg: GFConfig) -> int:
+    # Extended Euclid over GF(2)[x], same loop as gfInv in gf2m.ts
+    u = a & cfg.mask
+    if u == 0:
+        raise ZeroDivisionError("Zero has no multiplicative inverse in GF(2^m).")
+    v = cfg.mod_poly
+    g1, g2 = 1, 0
+    while u != 1:
+        if u == 0:
+            raise ValueError("gcd(a, mod_poly) != 1; inverse does not exist.")
+        shift = poly_degree(u) - poly_degree(v)
+        if shift < 0:
+            u, v = v, u
+            g1, g2 = g2, g1
+            shift = -shift
+        u ^= v << shift
+        g1 ^= g2 << shift
+    return poly_mod(g1, cfg.mod_poly)
@@ -0,0 +1,219 @@
+"""GCD and extended GCD in GF(2)[x], with a half-GCD above ``HGCD_MIN`` bits.
+
+Polynomials are ints (bit i = coefficient of x^i). Below the threshold the
+bitwise Euclid loop wins: every step is a shift and XOR on a Python int, which
+runs in C, so degree-10^4 gcds take milliseconds. Above it, ``half_gcd`` reduces (a, b) to the middle of the
+remainder sequence with two recursive calls on the top halves, so the whole gcd
+costs O(M(n) log n) for a multiplication cost M(n). Products come from
+``clmul``: the nibble-window product of ``bigint`` for small operands, and
+beyond ``FFT_MIN_BITS`` the parity of an exact floating-point convolution of
+the coefficient vectors, O(n log n); the four products of a 2x2 matrix step
+share their operand transforms.
+
+Matrices are tuples (m00, m01, m10, m11) acting on column vectors:
+(a', b') = (m00 a + m01 b, m10 a + m11 b). Signs vanish in characteristic 2.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from .bigint import clmul_window
+
+# Measured crossovers: a whole gcd by the C-speed Euclid loop stays ahead up
+# to about 10^5 bits; inside the recursion Euclid finishes blocks below
+# HGCD_LEAF bits; the nibble-window product wins below FFT_MIN_BITS
+HGCD_MIN = 1 << 17
+HGCD_LEAF = 1 << 14
+FFT_MIN_BITS = 1 << 12
+# Convolution sums stay exact in float64 far beyond this
+FFT_MAX_BITS = 1 << 24
+
+Matrix = tuple[int, int, int, int]
+_IDENTITY: Matrix = (1, 0, 0, 1)
+
+
+# ---------- products ----------
+
+
+@lru_cache(maxsize=256)
+def _fft_size(n: int) -> int:
+    # Smallest 2^i 3^j 5^k >= n: pocketfft is fast on these, and they pad less
+    best = 1 << (n - 1).bit_length()
+    p5 = 1
+    while p5 < best:
+        p35 = p5
+        while p35 < best:
+            size = p35
+            while size < n:
+                size *= 2
+            best = min(best, size)
+            p35 *= 3
+        p5 *= 5
+    return best
+
+
+def _spectrum(a: int, size: int) -> np.ndarray:
+    n = a.bit_length()
+    raw = np.frombuffer(a.to_bytes((n + 7) // 8, "little"), dtype=np.uint8)
+    return np.fft.rfft(np.unpackbits(raw, bitorder="little")[:n].astype(np.float64), size)
+
+
+def _from_spectrum(f: np.ndarray, size: int, length: int) -> int:
+    # Coefficients of the integer convolution, mod 2
+    conv = np.fft.irfft(f, size)[:length]
+    parity = (np.rint(conv).astype(np.int64) & 1).astype(np.uint8)
+    return int.from_bytes(np.packbits(parity, bitorder="little").tobytes(), "little")
+
+
+def clmul_fft(a: int, b: int) -> int:
+    """Carry-less product: the integer convolution of the bit vectors, mod 2."""
+    if not a or not b:
+        return 0
+    length = a.bit_length() + b.bit_length() - 1
+    size = _fft_size(length)
+    return _from_spectrum(_spectrum(a, size) * _spectrum(b, size), size, length)
+
+
+def _use_fft(a: int, b: int) -> bool:
+    return FFT_MIN_BITS <= min(a.bit_length(), b.bit_length()) and max(a.bit_length(), b.bit_length()) <= FFT_MAX_BITS
+
+
+def clmul(a: int, b: int) -> int:
+    if _use_fft(a, b):
+        return clmul_fft(a, b)
+    # The window loop runs over the bytes of its second operand
+    return clmul_window(a, b) if a.bit_length() >= b.bit_length() else clmul_window(b, a)
+
+
+def _mat_vec(rows: list[tuple[int, int]], cols: list[int]) -> list[int]:
+    # [x0 c0 + x1 c1 for (x0, x1) in rows], each operand transformed only once
+    pairs = [(x, c) for row in rows for x, c in zip(row, cols)]
+    if not all(_use_fft(x, c) for x, c in pairs):
+        return [clmul(x0, cols[0]) ^ clmul(x1, cols[1]) for x0, x1 in rows]
+    length = max(x.bit_length() + c.bit_length() - 1 for x, c in pairs)
+    size = _fft_size(length)
+    col_f = [_spectrum(c, size) for c in cols]
+    return [
+        _from_spectrum(_spectrum(x0, size) * col_f[0] + _spectrum(x1, size) * col_f[1], size, length)
+        for x0, x1 in rows
+    ]
+
+
+def _apply(m: Matrix, a: int, b: int) -> tuple[int, int]:
+    m00, m01, m10, m11 = m
+    a2, b2 = _mat_vec([(m00, m01), (m10, m11)], [a, b])
+    return a2, b2
+
+
+def _compose(m: Matrix, n: Matrix) -> Matrix:
+    # m * n: apply n first, then m
+    m00, m01, m10, m11 = m
+    n00, n01, n10, n11 = n
+    r00, r10 = _mat_vec([(m00, m01), (m10, m11)], [n00, n10])
+    r01, r11 = _mat_vec([(m00, m01), (m10, m11)], [n01, n11])
+    return r00, r01, r10, r11
+
+
+# ---------- Euclid ----------
+
+
+def _euclid(a: int, b: int, stop: int) -> tuple[Matrix, int, int]:
+    # Remainder steps while deg b >= stop, tracking the transformation matrix.
+    # Each quotient is built bit by bit, one shifted XOR per quotient term.
+    m00, m01, m10, m11 = _IDENTITY
+    len_b = b.bit_length()
+    while len_b > stop:
+        len_a = a.bit_length()
+        while len_a >= len_b:
+            s = len_a - len_b
+            a ^= b << s
+            m00 ^= m10 << s
+            m01 ^= m11 << s
+            len_a = a.bit_length()
+        a, b = b, a
+        m00, m01, m10, m11 = m10, m11, m00, m01
+        len_b = b.bit_length()
+    return (m00, m01, m10, m11), a, b
+
+
+def _degree(a: int) -> int:
+    return a.bit_length() - 1
+
+
+# ---------- half-GCD ----------
+
+
+def half_gcd(a: int, b: int) -> Matrix:
+    """M with (a', b') = M (a, b) consecutive remainders and deg b' < ceil(deg a / 2) <= deg a'.
+
+    Requires deg a > deg b.
+    """
+    n = _degree(a)
+    m = (n + 1) // 2
+    if _degree(b) < m:
+        return _IDENTITY
+    if n < HGCD_LEAF:
+        return _euclid(a, b, m)[0]
+    # The top halves share the first half of the quotient sequence
+    r = half_gcd(a >> m, b >> m)
+    a, b = _apply(r, a, b)
+    if _degree(b) < m:
+        return r
+    # One plain remainder step, then the second half on the new top parts
+    q_mat, a, b = _euclid(a, b, _degree(b))
+    r = _compose(q_mat, r)
+    if _degree(b) < m:
+        return r
+    k = 2 * m - _degree(a)
+    s = half_gcd(a >> k, b >> k)
+    return _compose(s, r)
+
+
+def _reduce(a: int, b: int) -> tuple[Matrix, int, int]:
+    # Drive (a, b) to (gcd, 0), half-GCD steps while the operands are large
+    if a.bit_length() < b.bit_length():
+        a, b = b, a
+        total: Matrix = (0, 1, 1, 0)
+    else:
+        total = _IDENTITY
+    while b.bit_length() > HGCD_MIN:
+        if a.bit_length() == b.bit_length():
+            step, a, b = _euclid(a, b, _degree(b))
+            total = _compose(step, total)
+            continue
+        step = half_gcd(a, b)
+        a, b = _apply(step, a, b)
+        total = _compose(step, total)
+        if b:
+            step, a, b = _euclid(a, b, _degree(b))
+            total = _compose(step, total)
+    step, a, b = _euclid(a, b, 0)
+    return _compose(step, total), a, b
+
+
+def gcd(a: int, b: int) -> int:
+    """Monic gcd of a and b (0 only when both are 0)."""
+    if a.bit_length() < b.bit_length():
+        a, b = b, a
+    # Without cofactors only the half-GCD matrices are ever multiplied
+    while b.bit_length() > HGCD_MIN:
+        if a.bit_length() == b.bit_length():
+            a, b = b, a ^ b
+            continue
+        a, b = _apply(half_gcd(a, b), a, b)
+        if b:
+            _, a, b = _euclid(a, b, _degree(b))
+    while b:
+        len_b = b.bit_length()
+        len_a = a.bit_length()
+        while len_a >= len_b:
+            a ^= b << (len_a - len_b)
+            len_a = a.bit_length()
+        a, b = b, a
+    return a
+
+
+def egcd(a: int, b: int) -> tuple[int, int, int]:
+    """(g, s, t) with s a + t b = g = gcd(a, b)."""
+    (m00, m01, _, _), g, _ = _reduce(a, b)
+    return g, m00, m01
@@ -0,0 +1,101 @@
+"""Irreducibility testing over GF(2) and trinomial/pentanomial search."""
+from functools import lru_cache
+
+from .bigint import BigField
+from .field import FIELD_CACHE_SIZE, GFConfig, poly_degree, poly_gcd, prime_factors
+
+# Ben-Or style checks gcd(x^(2^i) - x, f) over the first few squarings weed out
+# the vast majority of reducible inputs (they almost always have a small-degree
+# factor) before the full Rabin test pays for all deg(f) squarings. The
+# x^(2^i) - x terms are multiplied together and only gcd'd at powers of two.
+_BEN_OR_STEPS = 32
+
+# Pentanomials per degree kept by the search (there are ~C(m, 3) / m in total)
+PENTANOMIAL_LIMIT = 8
+
+_X = 0b10
+
+
+def is_irreducible(f: int) -> bool:
+    """Rabin's test: x^(2^n) = x mod f and gcd(x^(2^(n/p)) - x, f) = 1 for primes p | n."""
+    n = poly_degree(f)
+    if n < 1:
+        return False
+    if n == 1:
+        return True
+    if not f & 1:
+        return False  # divisible by x
+    if bin(f).count("1") % 2 == 0:
+        return False  # f(1) = 0, divisible by x + 1
+    field = BigField(GFConfig(n, f))
+    checkpoints = {n // p for p in prime_factors(n)}
+    early = min(_BEN_OR_STEPS, n // 2)
+    u = _X
+    acc = 1
+    for i in range(1, n + 1):
+        u = field.sqr(u)
+        if i <= early:
+            acc = field.mul(acc, u ^ _X)
+            if (i & (i - 1) == 0 or i == early) and poly_gcd(f, acc) != 1:
+                return False
+        if i in checkpoints and poly_gcd(f, u ^ _X) != 1:
+            return False
+    return u == _X
+
+
+@lru_cache(maxsize=FIELD_CACHE_SIZE)
+def _is_field(cfg: GFConfig) -> bool:
+    return is_irreducible(cfg.mod_poly)
+
+
+def check_field(cfg: GFConfig) -> None:
+    """Raise ValueError unless ``cfg.mod_poly`` is irreducible (cached per field)."""
+    if not _is_field(cfg):
+        raise ValueError("mod_poly is not irreducible")
+
+
+def trinomial(m: int, k: int) -> int:
+    return (1 << m) | (1 << k) | 1
+
+
+def pentanomial(m: int, a: int, b: int, c: int) -> int:
+    return (1 << m) | (1 << a) | (1 << b) | (1 << c) | 1
+
+
+def irreducible_trinomials(m: int) -> list[int]:
+    """All irreducible x^m + x^k + 1, ordered by k."""
+    if m < 2 or m % 8 == 0:
+        return []  # Swan: no irreducible trinomials when 8 | m
+    ks = set()
+    for k in range(1, m // 2 + 1):
+        if is_irreducible(trinomial(m, k)):
+            # the reciprocal x^m + x^(m-k) + 1 is irreducible too
+            ks.update((k, m - k))
+    return [trinomial(m, k) for k in sorted(ks)]
+
+
+def irreducible_pentanomials(m: int, limit: int = PENTANOMIAL_LIMIT) -> list[int]:
+    """The first ``limit`` irreducible x^m + x^a + x^b + x^c + 1, ordered by (a, b, c)."""
+    found: list[int] = []
+    for a in range(3, m):
+        for b in range(2, a):
+            for c in range(1, b):
+                f = pentanomial(m, a, b, c)
+                if is_irreducible(f):
+                    found.append(f)
+                    if len(found) >= limit:
+                        return found
+    return found
+
+
+def lowest_weight_irreducible(m: int) -> int:
+    """The irreducible of least weight with the lowest middle terms."""
+    if m == 1:
+        return 0b11
+    if m % 8:
+        for k in range(1, m // 2 + 1):
+            if is_irreducible(trinomial(m, k)):
+                return trinomial(m, k)
+    for f in irreducible_pentanomials(m, limit=1):
+        return f
+    raise ValueError(f"No irreducible trinomial or pentanomial of degree {m}")
@@ -0,0 +1,292 @@
+"""Linear algebra over GF(2^m): products, rank, inverses and linear solves.
+
+Matrices are lists of rows of field elements (ints, as everywhere in ``gf``).
+Gauss-Jordan elimination runs on one of three representations:
+
+* m = 1: every row packed into a single int (bit j = column j), so a row
+  operation is one XOR however wide the matrix is;
+* m <= TABLE_MAX_M: an int64 NumPy array; each pivot clears its column from
+  all other rows at once with log/antilog gathers (``batch._np_tables``);
+* larger m: ``BigField`` scalar arithmetic.
+
+``LinearMap`` and ``solution_map`` cover the GF(2)-linear maps of a field to
+itself (Frobenius powers, basis changes), applied through byte tables.
+"""
+from typing import Optional, Sequence
+
+import numpy as np
+
+from .batch import _np_tables
+from .bigint import get_big_field
+from .field import GFConfig
+from .tables import TABLE_MAX_M
+
+Matrix = list[list[int]]
+
+# GF(2) itself: x + 1 is the only degree-1 modulus
+GF2 = GFConfig(1, 0b11)
+
+
+def _shape(a: Sequence[Sequence[int]], cfg: GFConfig) -> tuple[int, int]:
+    if not a or not a[0]:
+        raise ValueError("Matrix must have at least one row and one column")
+    cols = len(a[0])
+    for row in a:
+        if len(row) != cols:
+            raise ValueError("Matrix rows must all have the same length")
+        for v in row:
+            if not 0 <= v <= cfg.mask:
+                raise ValueError(f"Matrix entries must be elements of GF(2^{cfg.m})")
+    return len(a), cols
+
+
+# ---------- representations ----------
+
+
+def _pack(a: Sequence[Sequence[int]]) -> list[int]:
+    bits = np.packbits(np.array(a, dtype=np.uint8), axis=1, bitorder="little")
+    return [int.from_bytes(row.tobytes(), "little") for row in bits]
+
+
+def _unpack(rows: list[int], cols: int) -> Matrix:
+    nbytes = (cols + 7) // 8
+    data = np.frombuffer(b"".join(r.to_bytes(nbytes, "little") for r in rows), dtype=np.uint8)
+    bits = np.unpackbits(data.reshape(len(rows), nbytes), axis=1, bitorder="little")
+    return bits[:, :cols].astype(np.int64).tolist()
+
+
+def _outer_mul(f: np.ndarray, row: np.ndarray, cfg: GFConfig) -> np.ndarray:
+    # f[i] * row[j] for every (i, j), through the field's exp/log tables
+    exp, log, _ = _np_tables(cfg)
+    out = exp[log[f][:, None] + log[row][None, :]]
+    out[(f == 0)[:, None] | (row == 0)[None, :]] = 0
+    return out.astype(np.int64)
+
+
+# ---------- elimination ----------
+
+
+def _rref_bits(rows: list[int], pivot_cols: int) -> list[int]:
+    pivots = []
+    rank = 0
+    for col in range(pivot_cols):
+        bit = 1 << col
+        for r in range(rank, len(rows)):
+            if rows[r] & bit:
+                break
+        else:
+            continue
+        rows[rank], rows[r] = rows[r], rows[rank]
+        pivot = rows[rank]
+        for r in range(len(rows)):
+            if r != rank and rows[r] & bit:
+                rows[r] ^= pivot
+        pivots.append(col)
+        rank += 1
+        if rank == len(rows):
+            break
+    return pivots
+
+
+def _rref_tables(arr: np.ndarray, pivot_cols: int, cfg: GFConfig) -> list[int]:
+    exp, log, _ = _np_tables(cfg)
+    order = cfg.size - 1
+    pivots = []
+    rank = 0
+    for col in range(pivot_cols):
+        nonzero = np.flatnonzero(arr[rank:, col])
+        if not nonzero.size:
+            continue
+        r = rank + int(nonzero[0])
+        arr[[rank, r]] = arr[[r, rank]]
+        # Scale the pivot row to a leading 1, then clear the column elsewhere
+        arr[rank] = _outer_mul(np.array([exp[order - log[arr[rank, col]]]]), arr[rank], cfg)[0]
+        factors = arr[:, col].copy()
+        factors[rank] = 0
+        arr ^= _outer_mul(factors, arr[rank], cfg)
+        pivots.append(col)
+        rank += 1
+        if rank == arr.shape[0]:
+            break
+    return pivots
+
+
+def _rref_big(rows: Matrix, pivot_cols: int, cfg: GFConfig) -> list[int]:
+    field = get_big_field(cfg)
+    pivots = []
+    rank = 0
+    for col in range(pivot_cols):
+        for r in range(rank, len(rows)):
+            if rows[r][col]:
+                break
+        else:
+            continue
+        rows[rank], rows[r] = rows[r], rows[rank]
+        inv = field.inv(rows[rank][col])
+        pivot = rows[rank] = [field.mul(inv, v) for v in rows[rank]]
+        for r, row in enumerate(rows):
+            f = row[col]
+            if r != rank and f:
+                rows[r] = [v ^ field.mul(f, p) for v, p in zip(row, pivot)]
+        pivots.append(col)
+        rank += 1
+        if rank == len(rows):
+            break
+    return pivots
+
+
+def _rref(a: Sequence[Sequence[int]], cfg: GFConfig, pivot_cols: int) -> tuple[list, list[int]]:
+    # Reduced rows stay in the working representation; _columns() reads them back
+    if cfg.m == 1:
+        rows = _pack(a)
+        return rows, _rref_bits(rows, pivot_cols)
+    if cfg.m <= TABLE_MAX_M:
+        arr = np.array(a, dtype=np.int64)
+        return arr, _rref_tables(arr, pivot_cols, cfg)
+    rows = [list(row) for row in a]
+    return rows, _rref_big(rows, pivot_cols, cfg)
+
+
+def _columns(rows: list, cfg: GFConfig, start: int, stop: int) -> Matrix:
+    if cfg.m == 1:
+        return _unpack([r >> start for r in rows], stop - start)
+    if cfg.m <= TABLE_MAX_M:
+        return rows[:, start:stop].tolist()
+    return [row[start:stop] for row in rows]
+
+
+def row_reduce(a: Sequence[Sequence[int]], cfg: GFConfig) -> tuple[Matrix, list[int]]:
+    """Reduced row echelon form of a and its pivot columns."""
+    _, cols = _shape(a, cfg)
+    rows, pivots = _rref(a, cfg, cols)
+    return _columns(rows, cfg, 0, cols), pivots
+
+
+def rank(a: Sequence[Sequence[int]], cfg: GFConfig) -> int:
+    _, cols = _shape(a, cfg)
+    return len(_rref(a, cfg, cols)[1])
+
+
+def inverse(a: Sequence[Sequence[int]], cfg: GFConfig) -> Matrix:
+    n, cols = _shape(a, cfg)
+    if n != cols:
+        raise ValueError("Only square matrices have inverses")
+    augmented = [list(row) + [int(i == j) for j in range(n)] for i, row in enumerate(a)]
+    rows, pivots = _rref(augmented, cfg, n)
+    if len(pivots) < n:
+        raise ValueError("Matrix is singular")
+    return _columns(rows, cfg, n, 2 * n)
+
+
+def solve(a: Sequence[Sequence[int]], b: Sequence[int], cfg: GFConfig) -> list[int]:
+    """One solution x of a x = b; free variables are set to 0.
+
+    Raises ValueError when the system is inconsistent.
+    """
+    n, cols = _shape(a, cfg)
+    if len(b) != n:
+        raise ValueError("Right-hand side must have one entry per row")
+    _shape([b], cfg)
+    rows, pivots = _rref([list(row) + [v] for row, v in zip(a, b)], cfg, cols)
+    rhs = [row[0] for row in _columns(rows, cfg, cols, cols + 1)]
+    if any(rhs[len(pivots) :]):
+        raise ValueError("System has no solution")
+    x = [0] * cols
+    for v, col in zip(rhs, pivots):
+        x[col] = v
+    return x
+
+
+def mat_mul(a: Sequence[Sequence[int]], b: Sequence[Sequence[int]], cfg: GFConfig) -> Matrix:
+    n, inner = _shape(a, cfg)
+    inner_b, cols = _shape(b, cfg)
+    if inner != inner_b:
+        raise ValueError(f"Cannot multiply {n}x{inner} by {inner_b}x{cols}")
+    if cfg.m == 1:
+        # Row i of the product is the XOR of the rows of b selected by row i of a
+        packed = _pack(b)
+        out = []
+        for row in a:
+            acc = 0
+            for k, v in enumerate(row):
+                if v:
+                    acc ^= packed[k]
+            out.append(acc)
+        return _unpack(out, cols)
+    if cfg.m <= TABLE_MAX_M:
+        left = np.array(a, dtype=np.int64)
+        right = np.array(b, dtype=np.int64)
+        out = np.zeros((n, cols), dtype=np.int64)
+        for k in range(inner):
+            out ^= _outer_mul(left[:, k], right[k], cfg)
+        return out.tolist()
+    field = get_big_field(cfg)
+    columns = list(zip(*b))
+    result = []
+    for row in a:
+        out_row = []
+        for column in columns:
+            acc = 0
+            for x, y in zip(row, column):
+                if x and y:
+                    acc ^= field.mul(x, y)
+            out_row.append(acc)
+        result.append(out_row)
+    return result
+
+
+# ---------- GF(2)-linear maps of m-bit vectors ----------
+
+
+class LinearMap:
+    """A GF(2)-linear map on m-bit vectors, given by the images of x^0..x^(m-1)."""
+
+    __slots__ = ("m", "images", "tables", "_np")
+
+    def __init__(self, images: list[int]):
+        self.m = len(images)
+        self.images = images
+        padded = images + [0] * (-self.m % 8)
+        self.tables: list[list[int]] = []
+        for j in range(0, len(padded), 8):
+            row = [0] * 256
+            for v in range(1, 256):
+                low = v & -v
+                row[v] = row[v ^ low] ^ padded[j + low.bit_length() - 1]
+            self.tables.append(row)
+        self._np: Optional[np.ndarray] = None
+
+    def __call__(self, a: int) -> int:
+        out = 0
+        for row, byte in zip(self.tables, a.to_bytes(len(self.tables), "little")):
+            if byte:
+                out ^= row[byte]
+        return out
+
+    def apply(self, a: np.ndarray) -> np.ndarray:
+        """The map on every element of a uint64 array (m <= 64)."""
+        if self._np is None:
+            self._np = np.array(self.tables, dtype=np.uint64)
+        a = a.astype(np.uint64)
+        out = np.zeros_like(a)
+        for k, row in enumerate(self._np):
+            out ^= row[((a >> np.uint64(8 * k)) & np.uint64(0xFF)).astype(np.intp)]
+        return out
+
+
+def solution_map(columns: list[int]) -> tuple[LinearMap, int]:
+    """(P, rank) for the m x m GF(2) matrix A with the given columns: A P c = c
+    for every c in the column space of A, so P is the inverse when rank = m."""
+    m = len(columns)
+    # Row r holds bit r of every column; bit m + r tags it, so the reduction
+    # records the row operations, which are P restricted to the pivot rows
+    rows = [sum((c >> r & 1) << i for i, c in enumerate(columns)) | (1 << (m + r)) for r in range(m)]
+    pivots = _rref_bits(rows, m)
+    images = [0] * m
+    for r, p in enumerate(pivots):
+        ops = rows[r] >> m
+        while ops:
+            low = ops & -ops
+            images[low.bit_length() - 1] |= 1 << p
+            ops ^= low
+    return LinearMap(images), len(pivots)
@@ -0,0 +1,255 @@
+"""Normal bases of GF(2^m) and a normal-basis exponentiation engine.
+
+A normal basis is beta, beta^2, beta^4, ..., beta^(2^(m-1)) for a normal
+element beta. In normal coordinates (bit i = coefficient of beta^(2^i))
+squaring is a cyclic rotation, and so is any run of squarings: a^(2^k) is a
+rotation by k.
+
+``get_normal_basis(cfg)`` finds beta once per field and caches both basis
+changes as byte tables (``matrix.LinearMap``). It prefers an optimal normal
+basis (ONB), whose multiplication table has the fewest possible terms,
+2m - 1, where one exists:
+
+* type 1 when p = m + 1 is prime and 2 is primitive mod p: beta is an
+  element of order p;
+* type 2 when p = 2m + 1 is prime and 2 is primitive mod p, or p = 3 mod 4
+  and 2 has order m: beta = gamma + 1/gamma for gamma of order p, taken in
+  GF(2^(2m)) = GF(2^m)[y] / (y^2 + y + delta) since gamma may lie outside
+  GF(2^m).
+
+Other fields get a normal element drawn from a generator seeded by mod_poly,
+so the basis is the same on every run (``complexity`` reports the size of its
+multiplication table). Low-degree elements make poor candidates: with a sparse
+mod_poly their traces vanish, and a normal element has trace 1.
+
+Products go through the polynomial basis, where the comb multiplier runs in
+C; ``mul_massey_omura`` is the textbook bit-parallel product on the
+multiplication table itself. Exponentiation is where the basis pays off:
+a^n is a product of rotations of a few precomputed odd powers of a, one
+per window of n, with no squarings at all. Engine mode ``normal``
+(``get_normal_field``) uses it for ``pow`` on polynomial-basis values.
+"""
+import random
+from functools import lru_cache
+from math import isqrt
+from typing import Optional
+
+from .bigint import BigField, get_big_field
+from .field import GFConfig
+from .irreducible import check_field
+from .matrix import LinearMap, solution_map
+from .quadratic import get_quadratic
+
+# Conversion tables cost 2 * m/8 * 256 field elements, as many as the Frobenius
+# tables of ``fast``
+NORMAL_CACHE_SIZE = 8
+
+
+def _is_prime(p: int) -> bool:
+    # p is at most 2m + 1: trial division is plenty
+    return p >= 2 and all(p % d for d in range(2, isqrt(p) + 1))
+
+
+def _order_of_two(p: int) -> int:
+    k, acc = 1, 2 % p
+    while acc != 1:
+        acc = acc * 2 % p
+        k += 1
+    return k
+
+
+def onb_type(m: int) -> Optional[int]:
+    """1 or 2 when GF(2^m) has an optimal normal basis of that type, else None."""
+    if m >= 2 and _is_prime(m + 1) and _order_of_two(m + 1) == m:
+        return 1
+    p = 2 * m + 1
+    if _is_prime(p):
+        k = _order_of_two(p)
+        if k == 2 * m or (p % 4 == 3 and k == m):
+            return 2
+    return None
+
+
+def _ext_mul(u: tuple[int, int], v: tuple[int, int], delta: int, f: BigField) -> tuple[int, int]:
+    # (u0 + u1 y)(v0 + v1 y) with y^2 = y + delta
+    t = f.mul(u[1], v[1])
+    return f.mul(u[0], v[0]) ^ f.mul(t, delta), f.mul(u[0], v[1]) ^ f.mul(u[1], v[0]) ^ t
+
+
+def _ext_pow(u: tuple[int, int], n: int, delta: int, f: BigField) -> tuple[int, int]:
+    acc = (1, 0)
+    for bit in bin(n)[2:]:
+        acc = _ext_mul(acc, acc, delta, f)
+        if bit == "1":
+            acc = _ext_mul(acc, u, delta, f)
+    return acc
+
+
+def _onb_element(cfg: GFConfig, kind: int) -> int:
+    f = get_big_field(cfg)
+    m = cfg.m
+    if kind == 1:
+        # p = m + 1 divides 2^m - 1; any element raised to (2^m - 1)/p has order 1 or p
+        p = m + 1
+        for z in range(2, cfg.size):
+            gamma = f.pow(z, (cfg.size - 1) // p)
+            if gamma != 1:
+                return gamma
+    p = 2 * m + 1
+    # y^2 + y + delta is irreducible over GF(2^m) when Tr(delta) = 1
+    trace = get_quadratic(cfg).trace
+    delta = next(d for d in range(1, cfg.size) if trace(d))
+    exponent = ((1 << (2 * m)) - 1) // p
+    for z0 in range(cfg.size):
+        gamma = _ext_pow((z0, 1), exponent, delta, f)
+        if gamma != (1, 0):
+            beta = _ext_pow(gamma, p - 1, delta, f)
+            beta = (beta[0] ^ gamma[0], beta[1] ^ gamma[1])
+            # gamma + gamma^-1 is fixed by the Frobenius of GF(2^m), so it lies in GF(2^m)
+            assert beta[1] == 0
+            return beta[0]
+    raise AssertionError("no element of order 2m + 1")
+
+
+def _window(bits: int) -> int:
+    # Each window costs one product, each odd power one more
+    return min(range(1, 9), key=lambda w: bits / (w + 1) + (1 << (w - 1)))
+
+
+class NormalBasis:
+    __slots__ = ("cfg", "m", "mask", "field", "beta", "onb_type", "to_normal", "from_normal", "_table")
+
+    def __init__(self, cfg: GFConfig):
+        check_field(cfg)
+        self.cfg = cfg
+        self.m = m = cfg.m
+        self.mask = cfg.mask
+        self.field = f = get_big_field(cfg)
+        self.onb_type = onb_type(m)
+        if self.onb_type:
+            candidates = iter([_onb_element(cfg, self.onb_type)])
+        else:
+            # At least a quarter of all elements are normal
+            rng = random.Random(cfg.mod_poly)
+            candidates = (rng.getrandbits(m) for _ in range(1000))
+        for beta in candidates:
+            conjugates = [beta]
+            for _ in range(m - 1):
+                conjugates.append(f.sqr(conjugates[-1]))
+            to_normal, rank = solution_map(conjugates)
+            if rank == m:
+                break
+        else:
+            raise AssertionError("GF(2^m) has no normal element")
+        self.beta = beta
+        self.from_normal = LinearMap(conjugates)
+        self.to_normal = to_normal
+        self._table: Optional[list[tuple[int, int]]] = None
+
+    def rotate(self, a: int, k: int) -> int:
+        """a^(2^k) for a in normal coordinates."""
+        k %= self.m
+        return ((a << k) | (a >> (self.m - k))) & self.mask
+
+    def sqr(self, a: int) -> int:
+        return self.rotate(a, 1)
+
+    def mul(self, a: int, b: int) -> int:
+        f = self.field
+        return self.to_normal(f.mul(self.from_normal(a), self.from_normal(b)))
+
+    def inv(self, a: int) -> int:
+        # Euclid on the polynomial form beats Itoh-Tsujii on CPython even with free squarings
+        return self.to_normal(self.field.inv(self.from_normal(a)))
+
+    @property
+    def multiplication_table(self) -> list[tuple[int, int]]:
+        """Pairs (i, j) with coefficient 0 of beta^(2^i) beta^(2^j) equal to 1.
+
+        Coefficient k of a product is the same table shifted by k, which is
+        what ``mul_massey_omura`` evaluates.
+        """
+        if self._table is None:
+            # beta^(2^i) beta^(2^j) = (beta beta^(2^(j-i)))^(2^i): one product per difference
+            m = self.m
+            rows = [self.to_normal(self.field.mul(self.beta, self.from_normal(1 << d))) for d in range(m)]
+            self._table = [(i, (i + d) % m) for d in range(m) for i in range(m) if rows[d] >> (-i % m) & 1]
+        return self._table
+
+    @property
+    def complexity(self) -> int:
+        """Number of terms in the multiplication table; 2m - 1 exactly for an ONB."""
+        return len(self.multiplication_table)
+
+    def mul_massey_omura(self, a: int, b: int) -> int:
+        # c_k = sum over the table of a_(i+k) b_(j+k): every k at once on rotated words
+        m = self.m
+        a_rot = [self.rotate(a, -i) for i in range(m)]
+        b_rot = [self.rotate(b, -j) for j in range(m)]
+        out = 0
+        for i, j in self.multiplication_table:
+            out ^= a_rot[i] & b_rot[j]
+        return out
+
+    def pow_poly(self, a: int, n: int) -> int:
+        """a^n for a in normal coordinates, returned in the polynomial basis.
+
+        a^n is the product of (a^d)^(2^s) = rotate(a^d, s) over the windows d
+        of n at bit offsets s: one rotation, one basis change and one product
+        per window.
+        """
+        if n < 0:
+            a = self.inv(a)
+            n = -n
+        if n == 0:
+            return 1
+        f = self.field
+        w = _window(n.bit_length())
+        a_poly = self.from_normal(a)
+        a2 = f.sqr(a_poly)
+        odd = [a]
+        acc = a_poly
+        for _ in range((1 << (w - 1)) - 1):
+            acc = f.mul(acc, a2)
+            odd.append(self.to_normal(acc))
+        out = None
+        s = 0
+        while n:
+            if not n & 1:
+                # Skip to the next set bit
+                low = (n & -n).bit_length() - 1
+                n >>= low
+                s += low
+                continue
+            d = n & ((1 << w) - 1)
+            term = self.from_normal(self.rotate(odd[d >> 1], s))
+            out = term if out is None else f.mul(out, term)
+            n >>= w
+            s += w
+        return out
+
+    def pow(self, a: int, n: int) -> int:
+        return self.to_normal(self.pow_poly(a, n))
+
+
+@lru_cache(maxsize=NORMAL_CACHE_SIZE)
+def get_normal_basis(cfg: GFConfig) -> NormalBasis:
+    return NormalBasis(cfg)
+
+
+class NormalField(BigField):
+    """Engine mode ``normal``: ``BigField`` with exponentiation through the normal basis."""
+
+    __slots__ = ("basis",)
+
+    def __init__(self, cfg: GFConfig):
+        super().__init__(cfg)
+        self.basis = get_normal_basis(cfg)
+
+    def pow(self, a: int, n: int) -> int:
+        return self.basis.pow_poly(self.basis.to_normal(self.reduce(a)), n)
+
+
+@lru_cache(maxsize=NORMAL_CACHE_SIZE)
+def get_normal_field(cfg: GFConfig) -> NormalField:
+    return NormalField(cfg)
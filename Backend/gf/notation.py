@@ -0,0 +1,54 @@
+"""Parsing and printing of GF(2)[x] polynomials as written in assignments.
+
+Accepts the notations used across the platform: ``x⁴ + x² + 1``,
+``x^7 + x + 1``, ``x**3 + 1``, hex (``0x11B``) and binary (``0b1011``).
+"""
+import re
+
+SUPERSCRIPTS = str.maketrans("⁻⁰¹²³⁴⁵⁶⁷⁸⁹", "-0123456789")
+
+_TERM = re.compile(r"^(\d*)(?:x(?:(?:\^|\*\*)(\d+))?)?$")
+
+
+def to_ascii(text: str) -> str:
+    # Superscripts (including ⁻¹) become ^k and unicode operators become ASCII
+    text = re.sub(r"(⁻?[⁰¹²³⁴⁵⁶⁷⁸⁹]+)", lambda mt: "^" + mt.group(1).translate(SUPERSCRIPTS), text)
+    return text.replace("−", "-").replace("·", "*").replace("×", "*").replace("÷", "/")
+
+
+def normalize(text: str) -> str:
+    return re.sub(r"\s+", "", to_ascii(text).replace("X", "x"))
+
+
+def parse_poly(text: str) -> int:
+    """Parse a GF(2)[x] polynomial; coefficients are taken mod 2."""
+    src = normalize(text)
+    if not src:
+        raise ValueError("Empty polynomial")
+    if re.fullmatch(r"0[xX][0-9a-fA-F]+|0[bB][01]+", src):
+        return int(src, 0)
+    poly = 0
+    # subtraction is addition in characteristic 2
+    for term in re.split(r"[+-]", src.lstrip("+-")):
+        match = _TERM.match(term)
+        if not term or not match:
+            raise ValueError(f"Cannot parse term '{term}' in '{text}'")
+        coeff, exp = match.groups()
+        has_x = "x" in term
+        if not has_x and not coeff:
+            raise ValueError(f"Cannot parse term '{term}' in '{text}'")
+        if coeff and int(coeff) % 2 == 0:
+            continue
+        poly ^= 1 << (int(exp) if exp else int(has_x))
+    return poly
+
+
+def format_poly(poly: int) -> str:
+    """Same layout as asPolyString in irreducibles.ts (``x^4 + x + 1``)."""
+    if not poly:
+        return "0"
+    terms = []
+    for i in range(poly.bit_length() - 1, -1, -1):
+        if poly >> i & 1:
+            terms.append("1" if i == 0 else "x" if i == 1 else f"x^{i}")
+    return " + ".join(terms)
@@ -0,0 +1,51 @@
+"""Field operations matching gfAdd/gfMul/gfPow/gfInv/gfMod in gf2m.ts.
+
+Small fields go through the cached log/antilog tables; larger ones use the
+big-int engine in ``bigint.py``, or one of the alternative algorithms in
+``fast.py`` picked by ``mode``.
+"""
+from .bigint import get_big_field
+from .fast import get_engine
+from .field import GFConfig, poly_mod
+from .tables import TABLE_MAX_M, get_tables
+
+
+def gf_add(a: int, b: int) -> int:
+    # Field addition in characteristic 2 = bitwise XOR
+    return a ^ b
+
+
+def gf_mod(x: int, cfg: GFConfig) -> int:
+    if cfg.m <= TABLE_MAX_M:
+        return poly_mod(x, cfg.mod_poly)
+    return get_big_field(cfg).reduce(x)
+
+
+def gf_mul(a: int, b: int, cfg: GFConfig) -> int:
+    a &= cfg.mask
+    b &= cfg.mask
+    if cfg.m <= TABLE_MAX_M:
+        return get_tables(cfg).mul(a, b)
+    return get_big_field(cfg).mul(a, b)
+
+
+def gf_div(a: int, b: int, cfg: GFConfig, mode: str = "standard") -> int:
+    a &= cfg.mask
+    b &= cfg.mask
+    if cfg.m <= TABLE_MAX_M:
+        return get_tables(cfg).div(a, b)
+    return get_engine(cfg, mode).div(a, b)
+
+
+def gf_inv(a: int, cfg: GFConfig, mode: str = "standard") -> int:
+    a &= cfg.mask
+    if cfg.m <= TABLE_MAX_M:
+        return get_tables(cfg).inv(a)
+    return get_engine(cfg, mode).inv(a)
+
+
+def gf_pow(a: int, n: int, cfg: GFConfig, mode: str = "standard") -> int:
+    a &= cfg.mask
+    if cfg.m <= TABLE_MAX_M:
+        return get_tables(cfg).pow(a, n)
+    return get_engine(cfg, mode).pow(a, n)
@@ -0,0 +1,335 @@
+"""Array-backed step traces and their binary wire format.
+
+A ``PackedTrace`` keeps one column per (step kind, field) plus a byte per step
+for the kind, instead of one dict per step. The wire format, decoded by
+``traceCodec.ts`` on the calculator side, is (all little-endian)::
+
+    header   magic "GFTR", u16 version, u16 m, u32 step count,
+             u32 count per kind (KINDS order)
+    widths   u16 byte width per polynomial column (FIELDS order) of every
+             kind with a nonzero count, then the result and mod_poly widths
+    mod_poly one value
+    order    u8 kind code per step
+    columns  per kind, per field (FIELDS order):
+               small field:  u8/u16 per step
+               polynomial:   2-bit selector per step (0 = stored, k = equal
+                             to reference k), then the stored values
+    result   one value
+
+Most polynomial values repeat or follow from a neighbour (``aAfter`` is
+``aBefore``, a step's ``pBefore`` is the previous ``pAfter``, a reduction's
+``after`` is ``before`` plus the shifted modulus, ...), so each polynomial
+field lists up to three references -- ``=f`` for field f of the same step,
+``<f`` for field f of the previous step of the same kind, ``=f+g*h`` for
+f + g*h in GF(2)[x], ``=f+mod<<g`` for f + mod_poly * x^g and ``=f%mod`` for
+f mod mod_poly -- and only values matching none of them are stored. Widths
+are 1, 2 or 4 bytes, or the exact byte count beyond that. Sections are not
+padded: on short traces alignment would cost more than the data.
+"""
+import struct
+import sys
+from array import array
+from typing import Iterable, Iterator, Optional, Union
+
+from .field import GFConfig, clmul, poly_mod
+from .trace import op_records
+
+MAGIC = b"GFTR"
+VERSION = 2
+KINDS = ("mul", "reduce", "mod", "add", "exp", "egcd")
+# (name, typecode, references); typecode "" marks a polynomial value
+FIELDS: dict[str, tuple[tuple[str, str, tuple[str, ...]], ...]] = {
+    "mul": (
+        ("i", "H", ()),
+        ("bBit", "B", ()),
+        ("aBefore", "", ("<aBefore",)),
+        ("aAfter", "", ("=aBefore",)),
+        ("pBefore", "", ("<pAfter",)),
+        ("pAfter", "", ("=pBefore",)),
+    ),
+    "reduce": (("carry", "H", ()), ("before", "", ("<after",)), ("after", "", ("=before+mod<<carry",))),
+    "mod": (("before", "", ()), ("after", "", ("=before%mod",))),
+    "add": (("op", "B", ()), ("a", "", ()), ("b", "", ()), ("result", "", ())),
+    "exp": (
+        ("bit", "B", ()),
+        ("baseBefore", "", ("<baseAfter",)),
+        ("baseAfter", "", ()),
+        ("accBefore", "", ("<accAfter",)),
+        ("accAfter", "", ("=accBefore",)),
+    ),
+    # r = a + b*q; the next step either keeps (r, b) or swaps them, and the
+    # cofactors (t0 + t1*q, t1) likewise
+    "egcd": (
+        ("a", "", ("<r", "<b")),
+        ("b", "", ("<b", "<r")),
+        ("q", "", ("<q",)),
+        ("r", "", ("=a+b*q",)),
+        ("t0", "", ("<t0+t1*q", "<t1")),
+        ("t1", "", ("<t1", "<t0+t1*q")),
+    ),
+}
+ADD_OPS = ("add", "sub")
+
+_HEADER = struct.Struct("<4sHHI" + "I" * len(KINDS))
+_CODES = {kind: code for code, kind in enumerate(KINDS)}
+_WORD = {1: "B", 2: "H", 4: "I"}
+
+Value = Union[int, str]
+
+
+class TraceTooLong(Exception):
+    """Raised by ``from_op`` past its step limit."""
+
+
+def _int(value: Value) -> int:
+    # Wide values arrive as hex strings from the tracers
+    return value if isinstance(value, int) else int(value, 16)
+
+
+def _little(column: array) -> array:
+    # array() uses native byte order; the wire format is little-endian
+    if sys.byteorder == "big":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column
+
+
+def _width(values: list[int]) -> int:
+    size = max(1, (max(values, default=0).bit_length() + 7) // 8)
+    return 4 if size == 3 else size
+
+
+def _resolve(ref: str, cols: dict, k: int, mod_poly: int) -> Optional[int]:
+    if ref[0] == "<":
+        if not k:
+            return None
+        k -= 1
+    if ref.endswith("%mod"):
+        return poly_mod(cols[ref[1:-4]][k], mod_poly)
+    if "+" not in ref:
+        return cols[ref[1:]][k]
+    f, rest = ref[1:].split("+")
+    if rest.startswith("mod<<"):
+        return cols[f][k] ^ (mod_poly << cols[rest[5:]][k])
+    g, h = rest.split("*")
+    return cols[f][k] ^ clmul(cols[g][k], cols[h][k])
+
+
+def _selectors(column: list[int], refs: tuple[str, ...], cols: dict, mod_poly: int) -> bytearray:
+    out = bytearray((len(column) + 3) // 4)
+    if not refs:
+        return out
+    for k, value in enumerate(column):
+        for sel, ref in enumerate(refs, 1):
+            if _resolve(ref, cols, k, mod_poly) == value:
+                out[k >> 2] |= sel << ((k & 3) * 2)
+                break
+    return out
+
+
+def _pack_values(values: list[int], width: int) -> bytes:
+    if width in _WORD:
+        return _little(array(_WORD[width], values)).tobytes()
+    return b"".join(v.to_bytes(width, "little") for v in values)
+
+
+class PackedTrace:
+    """Step columns of one trace; also the sink the ``trace.*_records`` tracers
+    write into, one method per step kind taking its fields in FIELDS order."""
+
+    __slots__ = ("m", "mod_poly", "order", "columns", "result")
+
+    def __init__(self, m: int, mod_poly: int):
+        self.m = m
+        self.mod_poly = mod_poly
+        self.order = bytearray()
+        self.columns: dict[str, dict[str, Union[array, list[int]]]] = {
+            kind: {name: array(code) if code else [] for name, code, _ in fields}
+            for kind, fields in FIELDS.items()
+        }
+        self.result = 0
+
+    @classmethod
+    def from_steps(cls, steps: Iterable[dict], m: int, mod_poly: int) -> "PackedTrace":
+        """Pack a ``stream_op`` trace; its trailing result record sets ``result``."""
+        trace = cls(m, mod_poly)
+        for step in steps:
+            trace.append(step)
+        return trace
+
+    @classmethod
+    def from_op(cls, op: str, a: int, b: int, cfg: GFConfig, max_steps: Optional[int] = None) -> "PackedTrace":
+        """Trace one calculator op straight into the columns, with no per-step
+        dicts or tuples; raises ``TraceTooLong`` past ``max_steps`` steps."""
+        trace = cls(cfg.m, cfg.mod_poly)
+        records = op_records(op, a, b, cfg, trace)
+        order = trace.order
+        while True:
+            try:
+                next(records)
+            except StopIteration as stop:
+                trace.result = stop.value
+                return trace
+            if max_steps is not None and len(order) > max_steps:
+                raise TraceTooLong(f"Trace longer than {max_steps} steps")
+
+    # ---------- sink ----------
+
+    def mul(self, i: int, b_bit: int, a_before: int, a_after: int, p_before: int, p_after: int) -> None:
+        self.order.append(_CODES["mul"])
+        cols = self.columns["mul"]
+        cols["i"].append(i)
+        cols["bBit"].append(b_bit)
+        cols["aBefore"].append(a_before)
+        cols["aAfter"].append(a_after)
+        cols["pBefore"].append(p_before)
+        cols["pAfter"].append(p_after)
+
+    def reduce(self, carry: int, before: int, after: int) -> None:
+        self.order.append(_CODES["reduce"])
+        cols = self.columns["reduce"]
+        cols["carry"].append(carry)
+        cols["before"].append(before)
+        cols["after"].append(after)
+
+    def mod(self, before: int, after: int) -> None:
+        self.order.append(_CODES["mod"])
+        cols = self.columns["mod"]
+        cols["before"].append(before)
+        cols["after"].append(after)
+
+    def add(self, op: str, a: int, b: int, result: int) -> None:
+        self.order.append(_CODES["add"])
+        cols = self.columns["add"]
+        cols["op"].append(ADD_OPS.index(op))
+        cols["a"].append(a)
+        cols["b"].append(b)
+        cols["result"].append(result)
+
+    def exp(self, bit: int, base_before: int, base_after: int, acc_before: int, acc_after: int) -> None:
+        self.order.append(_CODES["exp"])
+        cols = self.columns["exp"]
+        cols["bit"].append(bit)
+        cols["baseBefore"].append(base_before)
+        cols["baseAfter"].append(base_after)
+        cols["accBefore"].append(acc_before)
+        cols["accAfter"].append(acc_after)
+
+    def egcd(self, a: int, b: int, q: int, r: int, t0: int, t1: int) -> None:
+        self.order.append(_CODES["egcd"])
+        cols = self.columns["egcd"]
+        cols["a"].append(a)
+        cols["b"].append(b)
+        cols["q"].append(q)
+        cols["r"].append(r)
+        cols["t0"].append(t0)
+        cols["t1"].append(t1)
+
+    # ---------- dicts and bytes ----------
+
+    def append(self, step: dict) -> None:
+        kind = step["kind"]
+        if kind == "result":
+            self.result = _int(step["value"])
+            return
+        self.order.append(_CODES[kind])
+        cols = self.columns[kind]
+        for name, code, _ in FIELDS[kind]:
+            value = step[name]
+            if name == "op":
+                value = ADD_OPS.index(value)
+            cols[name].append(value if code else _int(value))
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def steps(self) -> Iterator[dict]:
+        # Materializes dicts one at a time (tests and JSON fallbacks only)
+        seen = dict.fromkeys(KINDS, 0)
+        for code in self.order:
+            kind = KINDS[code]
+            idx = seen[kind]
+            seen[kind] += 1
+            step: dict = {"kind": kind}
+            for name, _, _ in FIELDS[kind]:
+                value = self.columns[kind][name][idx]
+                step[name] = ADD_OPS[value] if name == "op" else value
+            yield step
+
+    def to_bytes(self) -> bytes:
+        counts = [self.order.count(code) for code in range(len(KINDS))]
+        buf = bytearray(_HEADER.pack(MAGIC, VERSION, self.m, len(self.order), *counts))
+        widths = [
+            _width(self.columns[kind][name])
+            for kind, count in zip(KINDS, counts)
+            if count
+            for name, code, _ in FIELDS[kind]
+            if not code
+        ]
+        widths += [_width([self.result]), _width([self.mod_poly])]
+        buf += struct.pack(f"<{len(widths)}H", *widths)
+        buf += _pack_values([self.mod_poly], widths[-1])
+        buf += self.order
+        col = 0
+        for kind, count in zip(KINDS, counts):
+            if not count:
+                continue
+            cols = self.columns[kind]
+            for name, code, refs in FIELDS[kind]:
+                column = cols[name]
+                if code:
+                    buf += _little(column).tobytes()
+                    continue
+                selectors = _selectors(column, refs, cols, self.mod_poly)
+                buf += selectors
+                stored = [v for k, v in enumerate(column) if not selectors[k >> 2] >> ((k & 3) * 2) & 3]
+                buf += _pack_values(stored, widths[col])
+                col += 1
+        buf += _pack_values([self.result], widths[-2])
+        return bytes(buf)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PackedTrace":
+        magic, version, m, total, *counts = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a packed step trace")
+        n_values = sum(not code for kind, count in zip(KINDS, counts) if count for _, code, _ in FIELDS[kind]) + 2
+        widths = struct.unpack_from(f"<{n_values}H", data, _HEADER.size)
+        pos = _HEADER.size + 2 * n_values
+        mod_poly = int.from_bytes(data[pos : pos + widths[-1]], "little")
+        pos += widths[-1]
+        trace = cls(m, mod_poly)
+        trace.order = bytearray(data[pos : pos + total])
+        pos += total
+        col = 0
+        for kind, count in zip(KINDS, counts):
+            if not count:
+                continue
+            cols = trace.columns[kind]
+            # (name, refs, selectors, offset of the stored values, width)
+            packed = []
+            for name, code, refs in FIELDS[kind]:
+                if code:
+                    column = array(code)
+                    column.frombytes(data[pos : pos + count * column.itemsize])
+                    cols[name] = _little(column)
+                    pos += count * column.itemsize
+                    continue
+                selectors = data[pos : pos + (count + 3) // 4]
+                pos += len(selectors)
+                stored = sum(not selectors[k >> 2] >> ((k & 3) * 2) & 3 for k in range(count))
+                packed.append((name, refs, selectors, pos, widths[col]))
+                pos += stored * widths[col]
+                col += 1
+            # Step by step: "<" references need the previous step of every column
+            cursors = [offset for _, _, _, offset, _ in packed]
+            for k in range(count):
+                for c, (name, refs, selectors, _, width) in enumerate(packed):
+                    sel = selectors[k >> 2] >> ((k & 3) * 2) & 3
+                    if sel:
+                        cols[name].append(_resolve(refs[sel - 1], cols, k, mod_poly))
+                    else:
+                        cols[name].append(int.from_bytes(data[cursors[c] : cursors[c] + width], "little"))
+                        cursors[c] += width
+        trace.result = int.from_bytes(data[pos : pos + widths[-2]], "little")
+        return trace
@@ -0,0 +1,166 @@
+"""Polynomials over GF(p), evaluated in bulk with NumPy.
+
+Polynomials are coefficient sequences, highest degree first, as in the
+``gf-eval`` template (``[3, 4, 2, 1]`` is 3x^3 + 4x^2 + 2x + 1) and in
+``numpy.polyval``. Residues live in int64 arrays; ``p < PRIME_MAX`` keeps every
+product of two residues below 2^63, so each Horner step is one multiply-add
+and one ``%`` over the whole batch.
+
+Inverses for ``p <= INV_TABLE_MAX_P`` come from a table built once per field
+(a vectorized Fermat power over 1..p-1); larger primes run that power on the
+batch itself.
+"""
+from functools import lru_cache
+from typing import Sequence
+
+import numpy as np
+
+from .field import FIELD_CACHE_SIZE, prime_factors
+from .prime_mul import convolve
+
+PRIME_MAX = 1 << 31
+INV_TABLE_MAX_P = 1 << 16
+
+Poly = list[int]
+
+
+def _trim(c: Sequence[int]) -> Poly:
+    # Drop leading zeros; the zero polynomial is []
+    out = [int(v) for v in c]
+    i = 0
+    while i < len(out) and out[i] == 0:
+        i += 1
+    return out[i:]
+
+
+def pad_coeffs(polys: Sequence[Sequence[int]]) -> np.ndarray:
+    """Stack polynomials of any degrees into one 2-D array, left-padded with zeros.
+
+    Leading zeros do not change a Horner evaluation, so the rows can be
+    evaluated together.
+    """
+    width = max((len(c) for c in polys), default=0)
+    out = np.zeros((len(polys), max(width, 1)), dtype=np.int64)
+    for row, c in zip(out, polys):
+        if len(c):
+            row[width - len(c) :] = c
+    return out
+
+
+class PrimeField:
+    __slots__ = ("p", "_inv")
+
+    def __init__(self, p: int):
+        if not 2 <= p < PRIME_MAX or prime_factors(p) != [p]:
+            raise ValueError(f"p must be a prime below 2^31, got {p}")
+        self.p = p
+        self._inv: np.ndarray | None = None
+
+    def residues(self, a) -> np.ndarray:
+        return np.asarray(a, dtype=np.int64) % self.p
+
+    def batch_pow(self, a, n: int) -> np.ndarray:
+        """a^n for every entry of a (n >= 0), square-and-multiply on the whole array."""
+        base = self.residues(a)
+        out = np.ones_like(base)
+        while n:
+            if n & 1:
+                out = out * base % self.p
+            base = base * base % self.p
+            n >>= 1
+        return out
+
+    @property
+    def inv_table(self) -> np.ndarray:
+        """inv_table[a] = a^-1 mod p, with inv_table[0] = 0 (small p only)."""
+        if self._inv is None:
+            if self.p > INV_TABLE_MAX_P:
+                raise ValueError(f"Inverse tables are only built for p <= {INV_TABLE_MAX_P}")
+            table = self.batch_pow(np.arange(self.p), self.p - 2)
+            table[0] = 0  # 0^0 when p = 2
+            self._inv = table
+        return self._inv
+
+    def inv(self, a: int) -> int:
+        a %= self.p
+        if a == 0:
+            raise ZeroDivisionError(f"0 has no inverse mod {self.p}")
+        if self.p <= INV_TABLE_MAX_P:
+            return int(self.inv_table[a])
+        return pow(a, -1, self.p)
+
+    def batch_inv(self, a) -> np.ndarray:
+        a = self.residues(a)
+        if not a.all():
+            raise ZeroDivisionError(f"0 has no inverse mod {self.p}")
+        if self.p <= INV_TABLE_MAX_P:
+            return self.inv_table[a]
+        return self.batch_pow(a, self.p - 2)
+
+    # ---------- evaluation ----------
+
+    def horner(self, coeffs, xs) -> np.ndarray:
+        """Evaluate polynomials at points, pairing them by broadcasting.
+
+        ``coeffs`` has shape (..., n + 1) and ``xs`` broadcasts against
+        ``coeffs.shape[:-1]``: one polynomial at many points, many polynomials
+        at one point each, and so on.
+        """
+        c = self.residues(coeffs)
+        x = self.residues(xs)
+        acc = np.zeros(np.broadcast_shapes(c.shape[:-1], x.shape), dtype=np.int64)
+        for j in range(c.shape[-1]):
+            acc = (acc * x + c[..., j]) % self.p
+        return acc
+
+    def horner_grid(self, coeffs, xs) -> np.ndarray:
+        """Every polynomial (rows of ``coeffs``) at every point: shape (polys, points)."""
+        c = np.atleast_2d(self.residues(coeffs))
+        return self.horner(c[:, None, :], np.asarray(xs).reshape(1, -1))
+
+    def eval(self, coeffs: Sequence[int], x: int) -> int:
+        acc = 0
+        for c in coeffs:
+            acc = (acc * x + c) % self.p
+        return acc
+
+    # ---------- GF(p)[x] ----------
+
+    def poly_add(self, a: Sequence[int], b: Sequence[int]) -> Poly:
+        n = max(len(a), len(b))
+        out = np.zeros(n, dtype=np.int64)
+        out[n - len(a) :] += self.residues(a)
+        out[n - len(b) :] += self.residues(b)
+        return _trim(out % self.p)
+
+    def poly_sub(self, a: Sequence[int], b: Sequence[int]) -> Poly:
+        return self.poly_add(a, [-v for v in b])
+
+    def poly_mul(self, a: Sequence[int], b: Sequence[int]) -> Poly:
+        """Product in GF(p)[x]; ``prime_mul.convolve`` picks the algorithm by size."""
+        a, b = _trim(a), _trim(b)
+        if not a or not b:
+            return []
+        return _trim(convolve(self.residues(a), self.residues(b), self.p))
+
+    def poly_divmod(self, a: Sequence[int], b: Sequence[int]) -> tuple[Poly, Poly]:
+        b = _trim(self.residues(b))
+        if not b:
+            raise ZeroDivisionError("Division by the zero polynomial")
+        r = self.residues(_trim(a) or [0])
+        if len(r) < len(b):
+            return [], _trim(r)
+        lead = self.inv(b[0])
+        divisor = np.asarray(b, dtype=np.int64)
+        q = np.zeros(len(r) - len(b) + 1, dtype=np.int64)
+        for i in range(len(q)):
+            c = r[i] * lead % self.p
+            q[i] = c
+            if c:
+                r[i : i + len(b)] = (r[i : i + len(b)] - c * divisor) % self.p
+        return _trim(q), _trim(r[len(q) :])
+
+
+@lru_cache(maxsize=FIELD_CACHE_SIZE)
+def get_prime_field(p: int) -> PrimeField:
+    return PrimeField(p)
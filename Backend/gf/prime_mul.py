@@ -0,0 +1,215 @@
+"""Multiplication in GF(p)[x]: schoolbook, Karatsuba or NTT by size.
+
+All three compute the plain convolution of two coefficient arrays, so they
+work for either coefficient order. ``convolve`` picks one:
+
+* below ``KARATSUBA_MIN`` coefficients in the shorter factor, schoolbook --
+  one ``numpy.convolve`` when (p - 1)^2 * n cannot overflow int64, else four
+  on 16-bit halves of the residues;
+* from ``NTT_MIN`` on, when p - 1 has enough factors of two for the product
+  length (NTT-friendly primes such as 998244353 = 119 * 2^23 + 1), a
+  radix-2 number-theoretic transform;
+* from ``CRT_NTT_MIN`` on for any other p, the same transform modulo the three
+  NTT primes in ``CRT_PRIMES``, whose product (about 2^86) exceeds every
+  coefficient of the exact integer product; the three results are combined
+  by the Chinese remainder theorem (Garner's form) and reduced mod p;
+* Karatsuba otherwise (products longer than 2^23), recursing until
+  schoolbook wins.
+
+The thresholds come from ``python -m Backend.utils.prime_bench``.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from .field import prime_factors
+
+KARATSUBA_MIN = 512
+NTT_MIN = 1024
+CRT_NTT_MIN = 4096
+_INT64_MAX = (1 << 63) - 1
+_LIMB = 16
+# NTT primes below 2^30 with 2-adicity 23, 25 and 26
+CRT_PRIMES = (998244353, 167772161, 469762049)
+
+
+# ---------- schoolbook ----------
+
+
+def schoolbook(a: np.ndarray, b: np.ndarray, p: int) -> np.ndarray:
+    k = min(len(a), len(b))
+    if (p - 1) ** 2 * k <= _INT64_MAX:
+        return np.convolve(a, b) % p
+    # Split residues into 16-bit halves so every partial convolution fits int64
+    mask = (1 << _LIMB) - 1
+    a_lo, a_hi = a & mask, a >> _LIMB
+    b_lo, b_hi = b & mask, b >> _LIMB
+    lo = np.convolve(a_lo, b_lo) % p
+    hi = np.convolve(a_hi, b_hi) % p
+    mid = (np.convolve(a_lo, b_hi) + np.convolve(a_hi, b_lo)) % p
+    return (hi * pow(2, 2 * _LIMB, p) % p + (mid << _LIMB) % p + lo) % p
+
+
+# ---------- Karatsuba ----------
+
+
+def _add(x: np.ndarray, y: np.ndarray, p: int) -> np.ndarray:
+    if len(x) < len(y):
+        x, y = y, x
+    out = x.copy()
+    out[: len(y)] += y
+    return out % p
+
+
+def karatsuba(a: np.ndarray, b: np.ndarray, p: int) -> np.ndarray:
+    if len(a) < len(b):
+        a, b = b, a
+    n, k = len(a), len(b)
+    if k < KARATSUBA_MIN:
+        return schoolbook(a, b, p)
+    out = np.zeros(n + k - 1, dtype=np.int64)
+    if 2 * k <= n:
+        # Unbalanced: cut the long factor into k-sized blocks
+        for i in range(0, n, k):
+            part = karatsuba(a[i : i + k], b, p)
+            out[i : i + len(part)] += part
+        return out % p
+    h = n // 2
+    a0, a1 = a[:h], a[h:]
+    b0, b1 = b[:h], b[h:]
+    z0 = karatsuba(a0, b0, p)
+    z2 = karatsuba(a1, b1, p)
+    z1 = karatsuba(_add(a0, a1, p), _add(b0, b1, p), p)
+    z1[: len(z0)] -= z0
+    z1[: len(z2)] -= z2
+    out[: len(z0)] += z0
+    out[2 * h : 2 * h + len(z2)] += z2
+    out[h : h + len(z1)] += z1
+    return out % p
+
+
+# ---------- NTT ----------
+
+
+def _two_adicity(p: int) -> int:
+    return ((p - 1) & -(p - 1)).bit_length() - 1
+
+
+@lru_cache(maxsize=16)
+def _primitive_root(p: int) -> int:
+    cofactors = [(p - 1) // q for q in prime_factors(p - 1)]
+    g = 2
+    while any(pow(g, e, p) == 1 for e in cofactors):
+        g += 1
+    return g
+
+
+def ntt_friendly(p: int, length: int) -> bool:
+    """Whether GF(p) has a 2^k-th root of unity for a product of ``length`` coefficients."""
+    return p > 2 and (length - 1).bit_length() <= _two_adicity(p)
+
+
+@lru_cache(maxsize=16)
+def _plan(p: int, n: int, inverse: bool) -> tuple[np.ndarray, list[np.ndarray]]:
+    # Bit-reversal permutation and per-stage twiddles w^0..w^(h-1) for a size-n transform
+    bits = n.bit_length() - 1
+    rev = np.zeros(n, dtype=np.int64)
+    for b in range(bits):
+        rev |= ((np.arange(n) >> b) & 1) << (bits - 1 - b)
+    w = pow(_primitive_root(p), (p - 1) // n, p)
+    if inverse:
+        w = pow(w, -1, p)
+    powers = np.ones(1, dtype=np.uint64)
+    while len(powers) < n // 2:
+        powers = np.concatenate((powers, powers * np.uint64(pow(w, len(powers), p)) % np.uint64(p)))
+    twiddles = []
+    h = 1
+    while h < n:
+        twiddles.append(powers[:: n // (2 * h)][:h].copy())
+        h *= 2
+    return rev, twiddles
+
+
+def _transform(a: np.ndarray, p: int, inverse: bool) -> np.ndarray:
+    # Iterative radix-2 transform of every row of a, one pass over the batch per
+    # stage. Unsigned lanes let min(y, y - p) stand in for the final "% p" of
+    # each butterfly, since y - p wraps around whenever y < p.
+    rows, n = a.shape
+    rev, twiddles = _plan(p, n, inverse)
+    q = np.uint64(p)
+    a = a[:, rev].astype(np.uint64)
+    buf = np.empty_like(a)
+    tmp = np.empty_like(a)
+    h = 1
+    for tw in twiddles:
+        x = a.reshape(rows, -1, 2 * h)
+        y = buf.reshape(rows, -1, 2 * h)
+        u = x[..., :h]
+        v = x[..., h:] * tw
+        v %= q
+        np.add(u, v, out=y[..., :h])
+        np.subtract(u + q, v, out=y[..., h:])
+        np.subtract(buf, q, out=tmp)
+        np.minimum(buf, tmp, out=buf)
+        a, buf = buf, a
+        h *= 2
+    if inverse:
+        a = a * np.uint64(pow(n, -1, p)) % q
+    return a
+
+
+def _padded(a: np.ndarray, b: np.ndarray, n: int) -> np.ndarray:
+    both = np.zeros((2, n), dtype=np.int64)
+    both[0, : len(a)] = a
+    both[1, : len(b)] = b
+    return both
+
+
+def ntt(a: np.ndarray, b: np.ndarray, p: int) -> np.ndarray:
+    length = len(a) + len(b) - 1
+    if not ntt_friendly(p, length):
+        raise ValueError(f"p = {p} has no root of unity of order {length}")
+    n = 1 << (length - 1).bit_length()
+    fa, fb = _transform(_padded(a, b, n), p, False)
+    return _transform((fa * fb % np.uint64(p))[None, :], p, True)[0, :length].astype(np.int64)
+
+
+def crt_friendly(p: int, k: int, length: int) -> bool:
+    """Whether ``crt_ntt`` is exact for a product of ``length`` coefficients
+    whose shorter factor has ``k``."""
+    m1, m2, m3 = CRT_PRIMES
+    return k * (p - 1) ** 2 < m1 * m2 * m3 and all(ntt_friendly(q, length) for q in CRT_PRIMES)
+
+
+def crt_ntt(a: np.ndarray, b: np.ndarray, p: int) -> np.ndarray:
+    length = len(a) + len(b) - 1
+    if not crt_friendly(p, min(len(a), len(b)), length):
+        raise ValueError(f"Product of length {length} mod {p} is too large for the CRT primes")
+    n = 1 << (length - 1).bit_length()
+    both = _padded(a, b, n)
+    residues = []
+    for q in CRT_PRIMES:
+        fa, fb = _transform(both % q, q, False)
+        residues.append(_transform((fa * fb % np.uint64(q))[None, :], q, True)[0, :length].astype(np.int64))
+    r1, r2, r3 = residues
+    # Garner: x = r1 + m1 t1 + m1 m2 t2, every intermediate below 2^63
+    m1, m2, m3 = CRT_PRIMES
+    t1 = (r2 - r1) % m2 * pow(m1, -1, m2) % m2
+    x12 = r1 + m1 * t1
+    t2 = (r3 - x12 % m3) % m3 * pow(m1 * m2 % m3, -1, m3) % m3
+    return (x12 % p + (m1 * m2 % p) * t2) % p
+
+
+def convolve(a: np.ndarray, b: np.ndarray, p: int) -> np.ndarray:
+    """Product of two arrays of residues mod p (each below 2^31)."""
+    if not len(a) or not len(b):
+        return np.zeros(0, dtype=np.int64)
+    k = min(len(a), len(b))
+    length = len(a) + len(b) - 1
+    if k >= NTT_MIN and ntt_friendly(p, length):
+        return ntt(a, b, p)
+    if k >= CRT_NTT_MIN and crt_friendly(p, k, length):
+        return crt_ntt(a, b, p)
+    if k >= KARATSUBA_MIN:
+        return karatsuba(a, b, p)
+    return schoolbook(a, b, p)
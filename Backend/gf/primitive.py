@@ -0,0 +1,189 @@
+"""Element orders, generators and primitive polynomials for GF(2^m).
+
+Everything here reduces to a few exponentiations once the factorization of
+the group order 2^m - 1 is known, so factorizations are memoized per m and
+seeded from the precomputed ``MERSENNE_FACTORS`` table.
+"""
+import random
+from functools import lru_cache
+from math import gcd, prod
+
+from .field import GFConfig, poly_degree
+from .irreducible import irreducible_pentanomials, irreducible_trinomials, is_irreducible
+from .mersenne_factors import MERSENNE_FACTORS
+from .ops import gf_pow
+
+# Pollard-Brent iterations per factor before giving up on an unknown degree
+_RHO_BUDGET = 200_000
+_TRIAL_LIMIT = 10_000
+_X = 0b10
+
+
+def _is_probable_prime(n: int) -> bool:
+    if n < 2:
+        return False
+    for p in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37):
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    rng = random.Random(n)
+    for _ in range(24):
+        x = pow(rng.randrange(2, n - 1), d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _pollard_brent(n: int) -> int | None:
+    rng = random.Random(n)
+    y, c, step = rng.randrange(1, n), rng.randrange(1, n), 128
+    g = r = q = 1
+    x = ys = y
+    while g == 1:
+        x = y
+        for _ in range(r):
+            y = (y * y + c) % n
+        k = 0
+        while k < r and g == 1:
+            ys = y
+            for _ in range(min(step, r - k)):
+                y = (y * y + c) % n
+                q = q * abs(x - y) % n
+            g = gcd(q, n)
+            k += step
+        r *= 2
+        if r > _RHO_BUDGET:
+            return None
+    if g == n:
+        while True:
+            ys = (ys * ys + c) % n
+            g = gcd(abs(x - ys), n)
+            if g > 1:
+                break
+    return g if g != n else None
+
+
+def _factor(n: int, out: list[int]) -> None:
+    for p in range(2, _TRIAL_LIMIT):
+        if p * p > n:
+            break
+        while n % p == 0:
+            out.append(p)
+            n //= p
+    stack = [n] if n > 1 else []
+    while stack:
+        n = stack.pop()
+        if _is_probable_prime(n):
+            out.append(n)
+            continue
+        d = _pollard_brent(n)
+        if d is None:
+            raise ValueError("Factorization not available")
+        stack.extend((d, n // d))
+
+
+def factor_mersenne(m: int) -> tuple[int, ...]:
+    """Prime factors of 2^m - 1 with multiplicity, in ascending order."""
+    if m < 1:
+        raise ValueError("m must be at least 1")
+    factors = _factor_mersenne(m)
+    if factors is None:
+        raise ValueError(f"Factorization of 2^{m} - 1 is not available")
+    return factors
+
+
+@lru_cache(maxsize=None)
+def _factor_mersenne(m: int) -> tuple[int, ...] | None:
+    # None marks a degree whose rho budget ran out, so later calls fail at once
+    # instead of repeating the search
+    if m in MERSENNE_FACTORS:
+        return MERSENNE_FACTORS[m]
+    # Every prime factor of 2^d - 1 for d | m divides 2^m - 1; strip those using
+    # the (memoized) smaller factorizations and only factor what is left
+    remaining = (1 << m) - 1
+    factors: list[int] = []
+    known: set[int] = set()
+    for d in range(1, m):
+        if m % d == 0:
+            sub = _factor_mersenne(d)
+            if sub is None:
+                return None
+            known.update(sub)
+    for p in sorted(known):
+        while remaining % p == 0:
+            factors.append(p)
+            remaining //= p
+    try:
+        _factor(remaining, factors)
+    except ValueError:
+        return None
+    return tuple(sorted(factors))
+
+
+def _distinct(factors: tuple[int, ...]) -> list[int]:
+    return sorted(set(factors))
+
+
+def element_order(a: int, cfg: GFConfig) -> int:
+    a &= cfg.mask
+    if a == 0:
+        raise ValueError("Zero has no multiplicative order")
+    factors = factor_mersenne(cfg.m)
+    order = prod(factors)
+    for p in _distinct(factors):
+        while order % p == 0 and gf_pow(a, order // p, cfg) == 1:
+            order //= p
+    return order
+
+
+def is_generator(a: int, cfg: GFConfig) -> bool:
+    a &= cfg.mask
+    if a == 0:
+        return False
+    order = cfg.size - 1
+    return all(gf_pow(a, order // p, cfg) != 1 for p in _distinct(factor_mersenne(cfg.m)))
+
+
+def find_generators(cfg: GFConfig, limit: int = 1) -> list[int]:
+    """The ``limit`` smallest generators of GF(2^m)*."""
+    if not is_irreducible(cfg.mod_poly):
+        raise ValueError("mod_poly is not irreducible")
+    found = []
+    for g in range(1 if cfg.m == 1 else 2, cfg.size):
+        if is_generator(g, cfg):
+            found.append(g)
+            if len(found) >= limit:
+                break
+    return found
+
+
+def is_primitive(f: int) -> bool:
+    """Irreducible f of degree m whose root x generates GF(2^m)*."""
+    m = poly_degree(f)
+    if m < 1 or not is_irreducible(f):
+        return False
+    if m == 1:
+        return f == 0b11
+    return is_generator(_X, GFConfig(m, f))
+
+
+def primitive_polynomials(m: int, limit: int = 8) -> list[int]:
+    """Low-weight primitive polynomials: trinomials first, then pentanomials."""
+    found = [f for f in irreducible_trinomials(m) if is_primitive(f)][:limit]
+    if len(found) < limit:
+        # not every irreducible pentanomial is primitive, so over-fetch candidates
+        for f in irreducible_pentanomials(m, limit=4 * limit):
+            if is_primitive(f):
+                found.append(f)
+                if len(found) >= limit:
+                    break
+    return found
@@ -0,0 +1,131 @@
+"""Trace, half-trace, square roots and z^2 + z = c in GF(2^m).
+
+All four are GF(2)-linear (the trace is a linear functional), so each field
+gets them precomputed once (``get_quadratic``) and every evaluation is a few
+table lookups and XORs instead of m squarings:
+
+* Tr(a) = parity(a & trace_mask), with Tr(x^i) from Newton's identities on
+  the coefficients of mod_poly;
+* sqrt(a) = a^(2^(m-1)), from the images sqrt(x^i) = x^(i/2) or
+  sqrt(x) x^((i-1)/2);
+* z^2 + z = c has a root iff Tr(c) = 0, and then two, z and z + 1. One
+  elimination of [S + I | I] over GF(2) (S = squaring) gives a linear map P
+  with P(c)^2 + P(c) = c on that hyperplane. For odd m the half-trace
+  H(c) = sum c^(4^i), i <= (m-1)/2, is the classic choice: H(x^j) is the root
+  of z^2 + z = x^j + Tr(x^j) whose trace is (m+1)/2 Tr(x^j), which picks it out
+  of P's output.
+
+Linear maps are applied through byte tables (``matrix.LinearMap``): one
+lookup per byte of the input, on ints or, for m <= WORD_MAX_M, on whole
+uint64 arrays.
+"""
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+from .batch import WORD_MAX_M
+from .bigint import get_big_field
+from .field import FIELD_CACHE_SIZE, GFConfig, poly_mod
+from .irreducible import check_field
+from .matrix import LinearMap, solution_map
+
+
+def _trace_mask(cfg: GFConfig) -> int:
+    # Newton's identities in characteristic 2 for the power sums s_k = Tr(x^k):
+    # s_k = k c_(m-k) + sum_(j<k) c_(m-j) s_(k-j), where mod_poly = x^m + sum c_i x^i
+    m, f = cfg.m, cfg.mod_poly
+    terms = [j for j in range(1, m + 1) if f >> (m - j) & 1]
+    s = [m & 1]
+    for k in range(1, m):
+        acc = k & 1 & (f >> (m - k))
+        for j in terms:
+            if j >= k:
+                break
+            acc ^= s[k - j]
+        s.append(acc)
+    return sum(bit << i for i, bit in enumerate(s))
+
+
+class QuadraticField:
+    __slots__ = ("cfg", "trace_mask", "sqrt_map", "solve_map", "half_trace_map")
+
+    def __init__(self, cfg: GFConfig):
+        # Trace, square root and half-trace are only defined over a field
+        check_field(cfg)
+        self.cfg = cfg
+        m = cfg.m
+        self.trace_mask = _trace_mask(cfg)
+        field = get_big_field(cfg)
+        sqrt_x = 2
+        for _ in range(m - 1):
+            sqrt_x = field.sqr(sqrt_x)
+        self.sqrt_map = LinearMap(
+            [1 << (i // 2) if i % 2 == 0 else field.mul(sqrt_x, 1 << (i // 2)) for i in range(m)]
+        )
+        p, _ = solution_map([poly_mod(1 << (2 * i), cfg.mod_poly) ^ (1 << i) for i in range(m)])
+        if m % 2:
+            half = []
+            for i in range(m):
+                t = self.trace(1 << i)
+                z = p((1 << i) ^ t)
+                if self.trace(z) != ((m + 1) // 2 * t) & 1:
+                    z ^= 1
+                half.append(z)
+            self.half_trace_map: Optional[LinearMap] = LinearMap(half)
+            self.solve_map = self.half_trace_map
+        else:
+            self.half_trace_map = None
+            self.solve_map = p
+
+    def trace(self, a: int) -> int:
+        return (a & self.trace_mask).bit_count() & 1
+
+    def sqrt(self, a: int) -> int:
+        return self.sqrt_map(a & self.cfg.mask)
+
+    def half_trace(self, a: int) -> int:
+        if self.half_trace_map is None:
+            raise ValueError("The half-trace is only defined for odd m")
+        return self.half_trace_map(a & self.cfg.mask)
+
+    def solve(self, c: int) -> Optional[int]:
+        """A root z of z^2 + z = c (the other is z + 1), or None when Tr(c) = 1."""
+        c &= self.cfg.mask
+        if self.trace(c):
+            return None
+        return self.solve_map(c)
+
+    # ---------- batches (m <= WORD_MAX_M) ----------
+
+    def _words(self, a) -> np.ndarray:
+        if self.cfg.m > WORD_MAX_M:
+            raise ValueError(f"Batch trace, sqrt and quadratic solving require m <= {WORD_MAX_M}")
+        return np.asarray(a).astype(np.uint64) & np.uint64(self.cfg.mask)
+
+    def batch_trace(self, a) -> np.ndarray:
+        x = self._words(a) & np.uint64(self.trace_mask)
+        for shift in (32, 16, 8, 4, 2, 1):
+            x ^= x >> np.uint64(shift)
+        return (x & np.uint64(1)).astype(np.uint8)
+
+    def batch_sqrt(self, a) -> np.ndarray:
+        return self.sqrt_map.apply(self._words(a))
+
+    def batch_half_trace(self, a) -> np.ndarray:
+        if self.half_trace_map is None:
+            raise ValueError("The half-trace is only defined for odd m")
+        return self.half_trace_map.apply(self._words(a))
+
+    def batch_solve(self, c) -> tuple[np.ndarray, np.ndarray]:
+        """(roots, solvable): roots are 0 where Tr(c) = 1 and solvable is False."""
+        c = self._words(c)
+        solvable = self.batch_trace(c) == 0
+        roots = self.solve_map.apply(c)
+        roots[~solvable] = 0
+        return roots, solvable
+
+
+@lru_cache(maxsize=FIELD_CACHE_SIZE)
+def get_quadratic(cfg: GFConfig) -> QuadraticField:
+    return QuadraticField(cfg)
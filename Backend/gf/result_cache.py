@@ -0,0 +1,108 @@
+"""Shared cache of calculator results, keyed by the whole request.
+
+A result depends only on (op, a, b, m, mod_poly, trace), so it can be kept
+once for every user and identified by a strong ETag derived from that key:
+a client holding the ETag revalidates without the server computing anything.
+Entries hold the serialized response body, so a hit costs one dict lookup.
+
+The cache is a thread-safe LRU bounded both by entry count and by bytes;
+bodies larger than a quarter of the byte budget (long traces) are served but
+not stored.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from .field import GFConfig, poly_mod
+from .ops import gf_add, gf_div, gf_inv, gf_mod, gf_mul, gf_pow
+
+# (op, a, b, m, mod_poly, trace)
+CacheKey = tuple[str, int, int, int, int, bool]
+
+# Bump when the response body for a key changes, so old ETags stop matching
+_ETAG_VERSION = 1
+
+
+def compute(op: str, a: int, b: int, cfg: GFConfig) -> int:
+    """Result of one calculator op, with operands reduced as ``trace_op`` does.
+
+    For ``pow``, ``b`` is the exponent; ``mod`` reduces the raw ``a``.
+    """
+    if op == "mod":
+        return gf_mod(a, cfg)
+    a = poly_mod(a, cfg.mod_poly)
+    if op == "pow":
+        return gf_pow(a, b, cfg)
+    if op == "inv":
+        return gf_inv(a, cfg)
+    b = poly_mod(b, cfg.mod_poly)
+    if op in ("add", "sub"):
+        return gf_add(a, b)
+    if op == "mul":
+        return gf_mul(a, b, cfg)
+    if op == "div":
+        return gf_div(a, b, cfg)
+    raise ValueError(f"Unknown op '{op}'")
+
+
+def etag(key: CacheKey) -> str:
+    digest = hashlib.sha256(repr((_ETAG_VERSION, key)).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+class ResultCache:
+    def __init__(self, max_items: int, max_bytes: int):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._bytes = 0
+        self._entries: OrderedDict[CacheKey, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key: CacheKey, body: bytes) -> None:
+        if len(body) > self.max_bytes // 4:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._entries[key] = body
+            self._bytes += len(body)
+            while len(self._entries) > self.max_items or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def revalidated(self) -> None:
+        with self._lock:
+            self.revalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.revalidations = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_items": self.max_items,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+            }
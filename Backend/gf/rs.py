@@ -0,0 +1,204 @@
+"""Reed-Solomon codes over GF(2^8), batched over NumPy arrays of codewords.
+
+A code RS(n, k) has n <= 255 byte symbols per codeword, the first k of them
+the message (systematic), and corrects up to t = (n - k) // 2 symbol errors.
+Its generator is g(x) = prod (x + alpha^(fcr + j)), j < n - k, where alpha is
+the generator of the field's log/antilog tables (``get_tables``, shared with
+the calculator) and fcr the first consecutive root. Byte i of a codeword is
+the coefficient of x^(n-1-i).
+
+Encoding and syndromes are GF(2)-linear in the input bytes, so each code
+(``get_reed_solomon``, cached) precomputes one row table per input position:
+parity[i][v] = v x^(n-1-i) mod g(x) and syndrome[i][v] =
+(v alpha^((fcr + j)(n-1-i)))_j. A batch is then one row gather and XOR per
+position, on rows packed into uint64 words.
+
+Decoding only touches codewords with a nonzero syndrome, all of them at once:
+Berlekamp-Massey for the error locator, a Chien search over the n positions,
+and Forney's formula for the error values, each vectorized across the
+codewords. A decoded codeword is accepted only when its locator has as many
+roots as its degree (at most t) and the corrected word has a zero syndrome;
+otherwise it is reported as uncorrectable and left as received.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from .batch import _np_tables
+from .field import FIELD_CACHE_SIZE, GFConfig, default_config
+from .tables import get_tables
+
+RS_FIELD = default_config(8)
+# Row tables take 256 (n - k) bytes per input position: up to 16 MB a code
+RS_CACHE_SIZE = 8
+
+
+@lru_cache(maxsize=FIELD_CACHE_SIZE)
+def _mul_table(cfg: GFConfig) -> np.ndarray:
+    exp, log, _ = _np_tables(cfg)
+    out = np.zeros((cfg.size, cfg.size), dtype=np.uint8)
+    out[1:, 1:] = exp[log[1:, None] + log[None, 1:]]
+    return out
+
+
+def _row_table(mul: np.ndarray, coeffs: np.ndarray) -> np.ndarray:
+    # table[i * 256 + v] = v * coeffs[i] as uint64 words, zero-padded to whole words
+    rows, width = coeffs.shape
+    padded = np.zeros((rows, 256, -(-width // 8) * 8), dtype=np.uint8)
+    padded[:, :, :width] = mul[:, coeffs].transpose(1, 0, 2)
+    return padded.reshape(rows * 256, -1).view(np.uint64)
+
+
+def _xor_rows(table: np.ndarray, symbols: np.ndarray, width: int) -> np.ndarray:
+    # XOR over positions i of table[i * 256 + symbols[:, i]]
+    acc = np.zeros((len(symbols), table.shape[1]), dtype=np.uint64)
+    index = np.empty(len(symbols), dtype=np.intp)
+    for i in range(symbols.shape[1]):
+        np.add(symbols[:, i], np.intp(i * 256), out=index)
+        acc ^= table.take(index, axis=0)
+    return acc.view(np.uint8)[:, :width]
+
+
+class ReedSolomon:
+    __slots__ = (
+        "cfg", "n", "k", "nsym", "t", "fcr", "alpha", "generator",
+        "_exp", "_log", "_mul", "_inv", "_parity", "_syndrome", "_chien", "_x_fcr",
+    )
+
+    def __init__(self, n: int, k: int, cfg: GFConfig = RS_FIELD, fcr: int = 0):
+        if cfg.m != 8:
+            raise ValueError("Reed-Solomon codes are over GF(2^8)")
+        if not 0 < k < n <= 255:
+            raise ValueError("Need 0 < k < n <= 255")
+        tables = get_tables(cfg)
+        self.cfg = cfg
+        self.n, self.k = n, k
+        self.nsym = nsym = n - k
+        self.t = nsym // 2
+        self.fcr = fcr
+        self.alpha = tables.generator
+        exp, log, _ = _np_tables(cfg)
+        self._exp = exp.astype(np.uint8)
+        self._log = log
+        self._mul = mul = _mul_table(cfg)
+        self._inv = np.zeros(256, dtype=np.uint8)
+        self._inv[1:] = self._exp[255 - log[1:]]
+
+        # g(x), highest degree first
+        g = [1]
+        for j in range(nsym):
+            root = tables.exp[(fcr + j) % 255]
+            g = [a ^ tables.mul(b, root) for a, b in zip(g + [0], [0] + g)]
+        self.generator = g
+        # x^(n-1-i) mod g for message positions i, from x^(n-k) mod g = g - x^(n-k) upwards
+        rems = [g[1:]]
+        for _ in range(k - 1):
+            r = rems[-1]
+            rems.append([a ^ tables.mul(r[0], b) for a, b in zip(r[1:] + [0], g[1:])])
+        self._parity = _row_table(mul, np.array(rems[::-1], dtype=np.intp))
+
+        power = (n - 1 - np.arange(n))[:, None]
+        self._syndrome = _row_table(mul, self._exp[(power * (fcr + np.arange(nsym))) % 255].astype(np.intp))
+        # chien[j][v] = (v X_i^-j)_i with X_i = alpha^(n-1-i): evaluates polynomials at every X_i^-1
+        self._chien = _row_table(mul, self._exp[(-power.T * np.arange(nsym + 1)[:, None]) % 255].astype(np.intp))
+        self._x_fcr = (power[:, 0] * (1 - fcr)) % 255  # log of X_i^(1-fcr)
+
+    def _product(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        # Elementwise a * b (broadcasting) through the flat 64 KB table; faster than mul[a, b]
+        return self._mul.ravel().take((a.astype(np.intp) << 8) | b)
+
+    def _rows(self, data, width: int) -> np.ndarray:
+        rows = np.ascontiguousarray(data, dtype=np.uint8)
+        if rows.ndim != 2 or rows.shape[1] != width:
+            raise ValueError(f"Expected an (N, {width}) array of bytes")
+        return rows
+
+    def encode(self, messages) -> np.ndarray:
+        """(N, k) messages to (N, n) systematic codewords."""
+        messages = self._rows(messages, self.k)
+        return np.hstack([messages, _xor_rows(self._parity, messages, self.nsym)])
+
+    def syndromes(self, codewords) -> np.ndarray:
+        """(N, n - k) syndromes S_j = c(alpha^(fcr + j)); all zero for codewords."""
+        return _xor_rows(self._syndrome, self._rows(codewords, self.n), self.nsym)
+
+    def berlekamp_massey(self, synd: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Error locators (lowest degree first, (M, n - k + 1)) and their lengths L."""
+        nsym = self.nsym
+        count = len(synd)
+        lam = np.zeros((count, nsym + 1), dtype=np.uint8)
+        lam[:, 0] = 1
+        prev = lam.copy()
+        length = np.zeros(count, dtype=np.int64)
+        for r in range(nsym):
+            # Discrepancy d = sum Lambda_i S_(r-i)
+            d = np.bitwise_xor.reduce(self._product(lam[:, : r + 1], synd[:, r::-1]), axis=1)
+            # Lambda and B have degree at most r + 1 after this step
+            w = min(r + 2, nsym + 1)
+            shifted = np.zeros((count, w), dtype=np.uint8)
+            shifted[:, 1:] = prev[:, : w - 1]
+            nonzero = d != 0
+            grow = nonzero & (2 * length <= r)
+            # B <- Lambda / d where L grows, else x B; then Lambda <- Lambda + d x B
+            prev[:, :w] = np.where(grow[:, None], self._product(lam[:, :w], self._inv[d][:, None]), shifted)
+            lam[:, :w] ^= self._product(d[:, None], shifted)
+            length = np.where(grow, r + 1 - length, length)
+        return lam, length
+
+    def _evaluate(self, poly: np.ndarray) -> np.ndarray:
+        # (M, n) values of polynomials (lowest degree first) at every X_i^-1
+        used = np.flatnonzero(poly.any(axis=0))
+        return _xor_rows(self._chien, poly[:, : used[-1] + 1 if len(used) else 0], self.n)
+
+    def chien_search(self, lam: np.ndarray) -> np.ndarray:
+        """(M, n) mask of the positions i with Lambda(X_i^-1) = 0."""
+        return self._evaluate(lam) == 0
+
+    def forney(self, synd: np.ndarray, lam: np.ndarray, roots: np.ndarray) -> np.ndarray:
+        """(M, n) error values e_i = X_i^(1-fcr) Omega(X_i^-1) / Lambda'(X_i^-1) at
+        the positions set in ``roots``, zero elsewhere.
+
+        Omega = S Lambda mod x^(n-k). The value is also zero where the formula
+        breaks down, which only happens for uncorrectable words.
+        """
+        nsym = self.nsym
+        omega = np.zeros_like(synd)
+        for i in np.flatnonzero(lam[:, :nsym].any(axis=0)):
+            omega[:, i:] ^= self._product(lam[:, i, None], synd[:, : nsym - i])
+        # The formal derivative keeps the odd terms: Lambda' = sum Lambda_j x^(j-1), j odd
+        deriv = np.zeros_like(lam)
+        deriv[:, 0:-1:2] = lam[:, 1::2]
+        rows, positions = np.nonzero(roots)
+        num = self._evaluate(omega)[rows, positions]
+        den = self._evaluate(deriv)[rows, positions]
+        log = self._log
+        values = np.zeros(roots.shape, dtype=np.uint8)
+        found = self._exp[(log[num] - log[den] + self._x_fcr[positions]) % 255]
+        values[rows, positions] = np.where((num != 0) & (den != 0), found, 0)
+        return values
+
+    def decode(self, codewords) -> tuple[np.ndarray, np.ndarray]:
+        """(messages, corrected): the (N, k) decoded messages and, per codeword,
+        the number of symbols corrected or -1 when it is uncorrectable."""
+        words = self._rows(codewords, self.n).copy()
+        corrected = np.zeros(len(words), dtype=np.int64)
+        synd = self.syndromes(words)
+        bad = np.flatnonzero(synd.any(axis=1))
+        if len(bad):
+            received, synd = words[bad], synd[bad]
+            lam, length = self.berlekamp_massey(synd)
+            roots = self.chien_search(lam)
+            counts = roots.sum(axis=1)
+            values = self.forney(synd, lam, roots)
+            fixed = received ^ values
+            # Every root must carry a nonzero error value and clear the syndrome
+            ok = (counts == length) & (length <= self.t) & ((values != 0) == roots).all(axis=1)
+            ok &= ~self.syndromes(fixed).any(axis=1)
+            words[bad] = np.where(ok[:, None], fixed, received)
+            corrected[bad] = np.where(ok, counts, -1)
+        return words[:, : self.k], corrected
+
+
+@lru_cache(maxsize=RS_CACHE_SIZE)
+def get_reed_solomon(n: int, k: int, cfg: GFConfig = RS_FIELD, fcr: int = 0) -> ReedSolomon:
+    return ReedSolomon(n, k, cfg, fcr)
@@ -0,0 +1,74 @@
+"""Log/antilog tables for small GF(2^m) fields, cached per (m, mod_poly)."""
+from functools import lru_cache
+
+from .field import FIELD_CACHE_SIZE, GFConfig, mul_bitwise, pow_bitwise, prime_factors
+from .irreducible import is_irreducible
+
+# 2^16 entries per table is the largest field we materialize
+TABLE_MAX_M = 16
+
+
+def find_generator(cfg: GFConfig) -> int:
+    order = cfg.size - 1
+    if order == 1:
+        return 1
+    cofactors = [order // p for p in prime_factors(order)]
+    for g in range(2, cfg.size):
+        if all(pow_bitwise(g, e, cfg) != 1 for e in cofactors):
+            return g
+    raise ValueError("mod_poly is not irreducible")
+
+
+class FieldTables:
+    """exp/log tables for one field; exp is doubled so log sums need no mod."""
+
+    __slots__ = ("cfg", "generator", "order", "exp", "log")
+
+    def __init__(self, cfg: GFConfig):
+        if cfg.m > TABLE_MAX_M:
+            raise ValueError(f"Tables are only built for m <= {TABLE_MAX_M}")
+        if not is_irreducible(cfg.mod_poly):
+            raise ValueError("mod_poly is not irreducible")
+        self.cfg = cfg
+        self.generator = find_generator(cfg)
+        self.order = cfg.size - 1
+
+        exp = [0] * (2 * self.order)
+        log = [0] * cfg.size
+        x = 1
+        for i in range(self.order):
+            exp[i] = x
+            log[x] = i
+            x = mul_bitwise(x, self.generator, cfg)
+        exp[self.order:] = exp[: self.order]
+        self.exp = exp
+        self.log = log
+
+    def mul(self, a: int, b: int) -> int:
+        if a == 0 or b == 0:
+            return 0
+        return self.exp[self.log[a] + self.log[b]]
+
+    def div(self, a: int, b: int) -> int:
+        if b == 0:
+            raise ZeroDivisionError("Division by zero in GF(2^m).")
+        if a == 0:
+            return 0
+        return self.exp[self.log[a] - self.log[b] + self.order]
+
+    def inv(self, a: int) -> int:
+        if a == 0:
+            raise ZeroDivisionError("Zero has no multiplicative inverse in GF(2^m).")
+        return self.exp[self.order - self.log[a]]
+
+    def pow(self, a: int, n: int) -> int:
+        if a == 0:
+            if n < 0:
+                raise ZeroDivisionError("Zero has no multiplicative inverse in GF(2^m).")
+            return 1 if n == 0 else 0
+        return self.exp[(self.log[a] * n) % self.order]
+
+
+@lru_cache(maxsize=FIELD_CACHE_SIZE)
+def get_tables(cfg: GFConfig) -> FieldTables:
+    return FieldTables(cfg)
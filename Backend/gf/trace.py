@@ -0,0 +1,230 @@
+"""Lazy step traces for the calculator, same ``Step`` schema as gf2m.ts.
+
+Each ``trace_*`` function is a generator: it yields step dicts one at a time
+and returns the result value, so a caller can ``yield from`` it and stream the
+steps without ever holding the whole trace. Step values above 2^53 (which a
+JavaScript number cannot hold exactly) are sent as hex strings.
+
+Underneath, the ``*_records`` generators hand each step to a sink, one method
+per step kind (``mul``, ``reduce``, ``mod``, ``add``, ``exp``, ``egcd``) with
+the fields as ints in ``packed_trace.FIELDS`` order, and yield after each one.
+``PackedTrace`` is such a sink and appends straight into its columns;
+``StepDicts`` builds the dict of the latest step for the JSON paths.
+"""
+from typing import Any, Iterator, Union
+
+from .field import GFConfig, poly_degree, poly_mod
+
+TRACE_OPS = ("add", "sub", "mul", "div", "inv", "pow", "mod")
+# Largest integer a JavaScript number represents exactly
+_JS_SAFE = (1 << 53) - 1
+
+Step = dict[str, Union[int, str]]
+Trace = Iterator[Step]
+# StepDicts or PackedTrace: one method per step kind
+Sink = Any
+# Yields once per step handed to the sink, returns the result
+Records = Iterator[None]
+
+
+def _num(value: int) -> Union[int, str]:
+    return value if value <= _JS_SAFE else f"0x{value:X}"
+
+
+class StepDicts:
+    """Sink keeping the latest step as a ``Step`` dict."""
+
+    __slots__ = ("step",)
+
+    def mul(self, i: int, b_bit: int, a_before: int, a_after: int, p_before: int, p_after: int) -> None:
+        self.step = {
+            "kind": "mul",
+            "i": i,
+            "bBit": b_bit,
+            "aBefore": _num(a_before),
+            "aAfter": _num(a_after),
+            "pBefore": _num(p_before),
+            "pAfter": _num(p_after),
+        }
+
+    def reduce(self, carry: int, before: int, after: int) -> None:
+        self.step = {"kind": "reduce", "carry": carry, "before": _num(before), "after": _num(after)}
+
+    def mod(self, before: int, after: int) -> None:
+        self.step = {"kind": "mod", "before": _num(before), "after": _num(after)}
+
+    def add(self, op: str, a: int, b: int, result: int) -> None:
+        self.step = {"kind": "add", "op": op, "a": _num(a), "b": _num(b), "result": _num(result)}
+
+    def exp(self, bit: int, base_before: int, base_after: int, acc_before: int, acc_after: int) -> None:
+        self.step = {
+            "kind": "exp",
+            "bit": bit,
+            "baseBefore": _num(base_before),
+            "baseAfter": _num(base_after),
+            "accBefore": _num(acc_before),
+            "accAfter": _num(acc_after),
+        }
+
+    def egcd(self, a: int, b: int, q: int, r: int, t0: int, t1: int) -> None:
+        self.step = {
+            "kind": "egcd",
+            "a": _num(a),
+            "b": _num(b),
+            "q": _num(q),
+            "r": _num(r),
+            "t0": _num(t0),
+            "t1": _num(t1),
+        }
+
+
+def _steps(records: Records, out: StepDicts) -> Trace:
+    # The dict of every step; returns what the record generator returns
+    while True:
+        try:
+            next(records)
+        except StopIteration as stop:
+            return stop.value
+        yield out.step
+
+
+def mod_records(x: int, cfg: GFConfig, out: Sink) -> Records:
+    deg_mod = poly_degree(cfg.mod_poly)
+    r = original = x
+    deg = poly_degree(r)
+    while deg >= deg_mod:
+        shift = deg - deg_mod
+        before = r
+        r ^= cfg.mod_poly << shift
+        out.reduce(shift, before, r)
+        yield
+        deg = poly_degree(r)
+    value = r & cfg.mask
+    out.mod(original, value)
+    yield
+    return value
+
+
+def add_records(a: int, b: int, cfg: GFConfig, out: Sink, op: str = "add") -> Records:
+    result = a ^ b
+    out.add(op, a, b, result)
+    yield
+    return result
+
+
+def mul_records(a: int, b: int, cfg: GFConfig, out: Sink) -> Records:
+    # Schoolbook product, one step per bit of b, then reduction
+    a &= cfg.mask
+    b &= cfg.mask
+    prod = 0
+    for i in range(cfg.m):
+        bit = b >> i & 1
+        before = prod
+        if bit:
+            prod ^= a << i
+        out.mul(i, bit, a, a, before, prod)
+        yield
+    return (yield from mod_records(prod, cfg, out))
+
+
+def pow_records(a: int, n: int, cfg: GFConfig, out: Sink) -> Records:
+    # Right-to-left square and multiply; a^0 = 1 even if a = 0
+    if n < 0:
+        raise ValueError("Exponent must be non-negative")
+    acc = 1
+    base = a & cfg.mask
+    while n:
+        bit = n & 1
+        base_before, acc_before = base, acc
+        if bit:
+            acc = yield from mul_records(acc, base, cfg, out)
+        base = yield from mul_records(base, base, cfg, out)
+        out.exp(bit, base_before, base, acc_before, acc)
+        yield
+        n >>= 1
+    return acc & cfg.mask
+
+
+def inv_records(a: int, cfg: GFConfig, out: Sink) -> Records:
+    # Extended Euclid over GF(2)[x], same loop as inv_bitwise
+    u = a & cfg.mask
+    if u == 0:
+        raise ZeroDivisionError("Zero has no multiplicative inverse in GF(2^m).")
+    v = cfg.mod_poly
+    g1, g2 = 1, 0
+    while u != 1:
+        if u == 0:
+            raise ValueError("gcd(a, mod_poly) != 1; inverse does not exist.")
+        shift = poly_degree(u) - poly_degree(v)
+        if shift < 0:
+            u, v = v, u
+            g1, g2 = g2, g1
+            shift = -shift
+        before_u, before_v, before_g1, before_g2 = u, v, g1, g2
+        u ^= v << shift
+        g1 ^= g2 << shift
+        out.egcd(before_u, before_v, 1 << shift, u, before_g1, before_g2)
+        yield
+    return (yield from mod_records(g1, cfg, out))
+
+
+def op_records(op: str, a: int, b: int, cfg: GFConfig, out: Sink) -> Records:
+    """Steps of one calculator operation, as Calculator.tsx builds them, handed to ``out``.
+
+    Operands are reduced into the field first (untraced), except for ``mod``,
+    which traces the reduction of the raw ``a``. For ``pow``, ``b`` is the
+    exponent.
+    """
+    if op == "mod":
+        return (yield from mod_records(a, cfg, out))
+    a = poly_mod(a, cfg.mod_poly)
+    if op == "pow":
+        return (yield from pow_records(a, b, cfg, out))
+    if op == "inv":
+        return (yield from inv_records(a, cfg, out))
+    b = poly_mod(b, cfg.mod_poly)
+    if op in ("add", "sub"):
+        return (yield from add_records(a, b, cfg, out, op))
+    if op == "mul":
+        return (yield from mul_records(a, b, cfg, out))
+    if op == "div":
+        b_inv = yield from inv_records(b, cfg, out)
+        return (yield from mul_records(a, b_inv, cfg, out))
+    raise ValueError(f"Unknown op '{op}'")
+
+
+def trace_mod(x: int, cfg: GFConfig) -> Trace:
+    out = StepDicts()
+    return (yield from _steps(mod_records(x, cfg, out), out))
+
+
+def trace_add(a: int, b: int, cfg: GFConfig, op: str = "add") -> Trace:
+    out = StepDicts()
+    return (yield from _steps(add_records(a, b, cfg, out, op), out))
+
+
+def trace_mul(a: int, b: int, cfg: GFConfig) -> Trace:
+    out = StepDicts()
+    return (yield from _steps(mul_records(a, b, cfg, out), out))
+
+
+def trace_pow(a: int, n: int, cfg: GFConfig) -> Trace:
+    out = StepDicts()
+    return (yield from _steps(pow_records(a, n, cfg, out), out))
+
+
+def trace_inv(a: int, cfg: GFConfig) -> Trace:
+    out = StepDicts()
+    return (yield from _steps(inv_records(a, cfg, out), out))
+
+
+def trace_op(op: str, a: int, b: int, cfg: GFConfig) -> Trace:
+    """``op_records`` as step dicts."""
+    out = StepDicts()
+    return (yield from _steps(op_records(op, a, b, cfg, out), out))
+
+
+def stream_op(op: str, a: int, b: int, cfg: GFConfig) -> Trace:
+    """``trace_op`` steps followed by a final ``{"kind": "result", "value": ...}``."""
+    value = yield from trace_op(op, a, b, cfg)
+    yield {"kind": "result", "value": _num(value)}
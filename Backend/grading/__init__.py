@@ -0,0 +1 @@
+from .answers import CHECKERS, DEFAULT_PARAMS, answer_key, grade_answer
@@ -0,0 +1,200 @@
+"""Answer keys and answer checkers for the built-in polynomial templates.
+
+Everything here is pure (no DB access) so it can run in worker processes.
+Grades are on the 0-100 scale used by the instructor UI; a checker returns
+None when it cannot make sense of the answer, leaving it for manual grading.
+"""
+import re
+from typing import Callable, Optional
+
+from ..core.config import settings
+from ..gf import GFConfig, gf_mul
+from ..gf.ec import BinaryCurve, scalar_mul_all
+from ..gf.factor import Factorization, factor_with_budget
+from ..gf.field import clmul
+from ..gf.irreducible import is_irreducible
+from ..gf.notation import parse_poly, to_ascii
+from ..gf.prime import get_prime_field, pad_coeffs
+
+# Parameters of the fixed POLY_TEMPLATES descriptions in routers/assignment.py
+DEFAULT_PARAMS: dict[str, dict] = {
+    "gf-addition": {"pairs": [[0x15, 0x0E], [0x83, 0x64]]},
+    "gf-multiplication": {"a": 0b101, "b": 0b11, "m": 3, "mod_poly": 0xB},
+    "gf-irreducible": {"poly": 0x13},
+    "gf-eval": {"coeffs": [3, 4, 2, 1], "x": 7, "p": 5},
+    "ec-scalar-mul": {"m": 4, "mod_poly": 0x13, "a": 0x3, "b": 0x1, "point": [0x8, 0x5], "k": 5},
+}
+
+
+def answer_key(template_id: str, params: dict) -> dict:
+    if template_id == "gf-addition":
+        return {"sums": [a ^ b for a, b in params["pairs"]]}
+    if template_id == "gf-multiplication":
+        cfg = GFConfig(params["m"], params["mod_poly"])
+        return {"product": gf_mul(params["a"], params["b"], cfg)}
+    if template_id == "gf-irreducible":
+        return irreducible_key(params["poly"], factor_with_budget(params["poly"], settings.FACTOR_BUDGET_SECONDS))
+    if template_id == "gf-eval":
+        return {"value": get_prime_field(params["p"]).eval(params["coeffs"], params["x"])}
+    if template_id == "ec-scalar-mul":
+        return ec_keys([params])[0]
+    raise ValueError(f"Unknown template '{template_id}'")
+
+
+def irreducible_key(poly: int, factors: Optional[Factorization]) -> dict:
+    # factors is None when factoring ran out of time; answers are then verified directly
+    return {
+        "poly": poly,
+        "irreducible": is_irreducible(poly),
+        "factors": [list(pe) for pe in factors] if factors is not None else None,
+    }
+
+
+def _ec_job(params: dict) -> tuple[int, tuple[int, int], BinaryCurve]:
+    curve = BinaryCurve(GFConfig(params["m"], params["mod_poly"]), params["a"], params["b"])
+    return params["k"], tuple(params["point"]), curve
+
+
+def eval_keys(params_list: list[dict]) -> list[dict]:
+    """gf-eval keys for a whole class: one vectorized Horner pass per prime."""
+    keys: list[dict] = [{} for _ in params_list]
+    by_prime: dict[int, list[int]] = {}
+    for i, params in enumerate(params_list):
+        by_prime.setdefault(params["p"], []).append(i)
+    for p, idx in by_prime.items():
+        coeffs = pad_coeffs([params_list[i]["coeffs"] for i in idx])
+        xs = [params_list[i]["x"] for i in idx]
+        for i, value in zip(idx, get_prime_field(p).horner(coeffs, xs).tolist()):
+            keys[i] = {"value": value}
+    return keys
+
+
+def ec_keys(params_list: list[dict]) -> list[dict]:
+    """ec-scalar-mul keys for a whole class: one Montgomery ladder per student and
+    one shared inversion per field for all the results."""
+    keys: list[dict] = [{} for _ in params_list]
+    by_field: dict[tuple[int, int], list[int]] = {}
+    for i, params in enumerate(params_list):
+        by_field.setdefault((params["m"], params["mod_poly"]), []).append(i)
+    for idx in by_field.values():
+        points = scalar_mul_all([_ec_job(params_list[i]) for i in idx])
+        for i, point in zip(idx, points):
+            keys[i] = {"point": list(point) if point is not None else None}
+    return keys
+
+
+def _answer_polys(content: str) -> list[int]:
+    # One candidate per line: drop "1)" style numbering, keep what follows the last "="
+    found = []
+    for line in content.splitlines():
+        line = re.sub(r"^\s*\(?\d+[).:]\s*", "", line).rsplit("=", 1)[-1]
+        try:
+            found.append(parse_poly(line))
+        except ValueError:
+            continue
+    return found
+
+
+def _check_addition(key: dict, content: str) -> Optional[float]:
+    expected = key["sums"]
+    found = _answer_polys(content)
+    if not found:
+        return None
+    if len(found) == len(expected):
+        correct = sum(f == e for f, e in zip(found, expected))
+    else:
+        correct = sum(e in found for e in expected)
+    return 100.0 * correct / len(expected)
+
+
+def _check_multiplication(key: dict, content: str) -> Optional[float]:
+    found = _answer_polys(content)
+    if not found:
+        return None
+    return 100.0 if found[-1] == key["product"] else 0.0
+
+
+def _answer_factors(content: str) -> list[tuple[int, int]]:
+    # Parenthesized factors with optional exponents: (x^2 + x + 1)^2 (x + 1)
+    found = []
+    for body, exp in re.findall(r"\(([^()]+)\)\s*(?:\^\s*(\d+))?", to_ascii(content)):
+        try:
+            found.append((parse_poly(body), int(exp or 1)))
+        except ValueError:
+            continue
+    return found
+
+
+def _factorization_ok(key: dict, found: list[tuple[int, int]]) -> bool:
+    merged: dict[int, int] = {}
+    for p, e in found:
+        if p > 1:
+            merged[p] = merged.get(p, 0) + e
+    if key["factors"] is not None:
+        return sorted(merged.items()) == sorted(tuple(pe) for pe in key["factors"])
+    product = 1
+    for p, e in merged.items():
+        if not is_irreducible(p):
+            return False
+        for _ in range(e):
+            product = clmul(product, p)
+    return product == key["poly"]
+
+
+def _check_irreducible(key: dict, content: str) -> Optional[float]:
+    text = content.lower()
+    # "not irreducible" means reducible and "not reducible" irreducible; the rest is taken as written
+    negated = re.compile(r"\b(?:not|isn't)\s+(ir)?reducible\b")
+    flipped = {bool(match.group(1)) for match in negated.finditer(text)}
+    rest = negated.sub(" ", text)
+    says_reducible = True in flipped or bool(re.search(r"\breducible\b", rest))
+    says_irreducible = False in flipped or bool(re.search(r"\birreducible\b", rest))
+    if says_reducible == says_irreducible:
+        return None
+    if says_irreducible or key["irreducible"]:
+        return 100.0 if says_irreducible == key["irreducible"] else 0.0
+    # Correctly called reducible: the factorization is worth the other half
+    found = _answer_factors(content)
+    return 100.0 if found and _factorization_ok(key, found) else 50.0
+
+
+def _check_eval(key: dict, content: str) -> Optional[float]:
+    # "... = 0 (mod 5)": the first number after the last "=", else the last number
+    if "=" in content:
+        numbers = re.findall(r"-?\d+", content.rsplit("=", 1)[1])[:1]
+    else:
+        numbers = re.findall(r"-?\d+", content)[-1:]
+    if not numbers:
+        return None
+    return 100.0 if int(numbers[0]) == key["value"] else 0.0
+
+
+def _check_ec_point(key: dict, content: str) -> Optional[float]:
+    # The last "(x, y)" pair, coordinates as polynomials in α (or hex), else O / ∞
+    text = to_ascii(content).replace("α", "x")
+    pairs = re.findall(r"\(([^(),]+),([^(),]+)\)", text)
+    for x_text, y_text in reversed(pairs):
+        try:
+            found = [parse_poly(x_text), parse_poly(y_text)]
+        except ValueError:
+            continue
+        return 100.0 if found == key["point"] else 0.0
+    if re.search(r"(?<![\w(])(O|𝒪|∞|infinity)(?![\w)])", content, re.IGNORECASE):
+        return 100.0 if key["point"] is None else 0.0
+    return None
+
+
+CHECKERS: dict[str, Callable[[dict, str], Optional[float]]] = {
+    "gf-addition": _check_addition,
+    "gf-multiplication": _check_multiplication,
+    "gf-irreducible": _check_irreducible,
+    "gf-eval": _check_eval,
+    "ec-scalar-mul": _check_ec_point,
+}
+
+
+def grade_answer(template_id: str, key: dict, content: str) -> Optional[float]:
+    checker = CHECKERS.get(template_id)
+    if checker is None:
+        return None
+    return checker(key, content)
@@ -0,0 +1,145 @@
+"""Per-student variants of the POLY_TEMPLATES exercises.
+
+Parameters are drawn from a ``random.Random`` seeded with a hash of
+(assignment_id, user_id), so a student always gets the same variant and
+neighbours get different ones. Each template keeps the shape of its fixed
+description in routers/assignment.py (and of ``DEFAULT_PARAMS``); only the
+operands, moduli and evaluation points change.
+"""
+import hashlib
+import random
+import re
+
+from ..gf import GFConfig
+from ..gf.ec import BinaryCurve, add
+from ..gf.irreducible import is_irreducible
+from ..gf.notation import format_poly
+
+_SUPERSCRIPT = str.maketrans("0123456789", "⁰¹²³⁴⁵⁶⁷⁸⁹")
+_PRIMES = (5, 7, 11, 13)
+# ec-scalar-mul works in GF(2^4) = GF(2)[α]/(α^4 + α + 1), small enough by hand
+_EC_M, _EC_MOD = 4, 0x13
+_EC_MAX_K = 9
+
+
+def exercise_seed(assignment_id: int, user_id: int) -> int:
+    digest = hashlib.sha256(f"{assignment_id}:{user_id}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def _poly(rng: random.Random, low: int, high: int) -> int:
+    # Random polynomial with degree in [low, high]
+    degree = rng.randint(low, high)
+    return (1 << degree) | rng.getrandbits(degree) if degree else 1
+
+
+def _irreducible(rng: random.Random, m: int) -> int:
+    while True:
+        f = (1 << m) | rng.getrandbits(m) | 1
+        if is_irreducible(f):
+            return f
+
+
+def _ec_point(rng: random.Random, curve: BinaryCurve) -> tuple[list[int], int]:
+    # A random point of order at least 5 and that order
+    m = curve.cfg.m
+    points = [(x, y) for x in range(1, 1 << m) for y in range(1 << m) if curve.contains((x, y))]
+    while True:
+        p = rng.choice(points)
+        order, q = 1, p
+        while q is not None:
+            q = add(q, p, curve)
+            order += 1
+        if order >= 5:
+            return list(p), order
+
+
+def generate_params(template_id: str, assignment_id: int, user_id: int) -> dict:
+    rng = random.Random(exercise_seed(assignment_id, user_id))
+    if template_id == "gf-addition":
+        return {"pairs": [[_poly(rng, 3, 5), _poly(rng, 2, 5)], [_poly(rng, 5, 7), _poly(rng, 4, 7)]]}
+    if template_id == "gf-multiplication":
+        m = rng.randint(3, 6)
+        return {"a": _poly(rng, 1, m - 1), "b": _poly(rng, 1, m - 1), "m": m, "mod_poly": _irreducible(rng, m)}
+    if template_id == "gf-irreducible":
+        m = rng.randint(4, 7)
+        # About half the class gets an irreducible polynomial
+        if rng.random() < 0.5:
+            return {"poly": _irreducible(rng, m)}
+        while True:
+            f = (1 << m) | rng.getrandbits(m) | 1
+            if not is_irreducible(f):
+                return {"poly": f}
+    if template_id == "gf-eval":
+        p = rng.choice(_PRIMES)
+        coeffs = [rng.randrange(1, p)] + [rng.randrange(p) for _ in range(3)]
+        return {"coeffs": coeffs, "x": rng.randrange(p + 1, 3 * p), "p": p}
+    if template_id == "ec-scalar-mul":
+        curve = BinaryCurve(GFConfig(_EC_M, _EC_MOD), rng.randrange(1 << _EC_M), rng.randrange(1, 1 << _EC_M))
+        point, order = _ec_point(rng, curve)
+        k = rng.randint(2, min(order - 1, _EC_MAX_K))
+        return {"m": _EC_M, "mod_poly": _EC_MOD, "a": curve.a, "b": curve.b, "point": point, "k": k}
+    raise ValueError(f"Unknown template '{template_id}'")
+
+
+def pretty_poly(poly: int) -> str:
+    """``x⁴ + x + 1``: the notation of the template descriptions."""
+    return re.sub(r"\^(\d+)", lambda mt: mt.group(1).translate(_SUPERSCRIPT), format_poly(poly))
+
+
+def pretty_element(value: int) -> str:
+    """``α³ + 1``: GF(2^m) elements as polynomials in α, keeping x for coordinates."""
+    return pretty_poly(value).replace("x", "α")
+
+
+def _curve_equation(a: int, b: int) -> str:
+    terms = ["y² + xy = x³"]
+    if a:
+        coeff = "" if a == 1 else pretty_element(a) if a.bit_count() == 1 else f"({pretty_element(a)})"
+        terms.append(f"{coeff}x²")
+    terms.append(pretty_element(b))
+    return " + ".join(terms)
+
+
+def _prime_poly(coeffs: list[int]) -> str:
+    n = len(coeffs) - 1
+    terms = []
+    for i, c in enumerate(coeffs):
+        k = n - i
+        if not c:
+            continue
+        coeff = "" if c == 1 and k else str(c)
+        power = "" if k == 0 else "x" if k == 1 else "x" + str(k).translate(_SUPERSCRIPT)
+        terms.append(coeff + power)
+    return " + ".join(terms) or "0"
+
+
+def describe(template_id: str, params: dict) -> str:
+    """Exercise text for ``params``, worded like the template description."""
+    if template_id == "gf-addition":
+        lines = [f"{i}) {pretty_poly(a)}  +  {pretty_poly(b)}" for i, (a, b) in enumerate(params["pairs"], 1)]
+        return "Add the following polynomials over GF(2):\n" + "\n".join(lines)
+    if template_id == "gf-multiplication":
+        return (
+            f"Compute ({pretty_poly(params['a'])}) · ({pretty_poly(params['b'])}) over GF(2), "
+            f"then reduce modulo the irreducible polynomial {pretty_poly(params['mod_poly'])}."
+        )
+    if template_id == "gf-irreducible":
+        return (
+            f"Show whether {pretty_poly(params['poly'])} is irreducible over GF(2). "
+            "If reducible, factor it; if irreducible, justify briefly."
+        )
+    if template_id == "gf-eval":
+        return (
+            f"Evaluate f(x) = {_prime_poly(params['coeffs'])} at x = {params['x']} (mod {params['p']}). "
+            "Show intermediate steps."
+        )
+    if template_id == "ec-scalar-mul":
+        x, y = params["point"]
+        return (
+            f"On the elliptic curve {_curve_equation(params['a'], params['b'])} over GF(2{str(params['m']).translate(_SUPERSCRIPT)}) "
+            f"= GF(2)[α]/({pretty_element(params['mod_poly'])}), compute {params['k']}P for "
+            f"P = ({pretty_element(x)}, {pretty_element(y)}). "
+            "Give the result as an affine point (x, y), or O for the point at infinity."
+        )
+    raise ValueError(f"Unknown template '{template_id}'")
@@ -0,0 +1,206 @@
+"""Auto-grading jobs for template assignments.
+
+Jobs run as background tasks after the response is sent; parsing and checking
+answers happens in a shared process pool, and grades are written back to
+``Submission.grade`` in one commit per job.
+"""
+import json
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..core.config import settings
+from ..database import SessionLocal
+from ..gf.factor import factor_many
+from .answers import DEFAULT_PARAMS, answer_key, ec_keys, eval_keys, grade_answer, irreducible_key
+from .exercises import generate_params
+
+# Submissions per pool task; large enough to amortize pickling
+_CHUNK = 64
+# Finished jobs kept around for status polling
+_MAX_JOBS = 256
+
+_pool: Optional[ProcessPoolExecutor] = None
+_lock = Lock()
+
+
+@dataclass
+class AutogradeJob:
+    id: str
+    assignment_id: int
+    status: str = "queued"  # queued | running | done | failed
+    total: int = 0
+    graded: int = 0
+    skipped: int = 0  # answers the checker could not parse; left for manual grading
+    error: Optional[str] = None
+
+
+JOBS: "OrderedDict[str, AutogradeJob]" = OrderedDict()
+
+
+def get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=settings.AUTOGRADE_WORKERS)
+        return _pool
+
+
+def grade_chunk(items: list[tuple[int, str, dict, str]]) -> list[tuple[int, Optional[float]]]:
+    return [(sid, grade_answer(template_id, key, content)) for sid, template_id, key, content in items]
+
+
+def compute_keys(template_id: str, params_list: list[dict]) -> list[dict]:
+    """Answer keys for many parameter sets at once, computed in the worker pool.
+
+    Keys that need real work (factoring degree-64+ polynomials for
+    gf-irreducible) always run in the pool, in parallel, each within
+    FACTOR_BUDGET_SECONDS, never in the calling thread.
+    gf-eval keys are a single vectorized evaluation in this process, and
+    ec-scalar-mul keys share one field inversion across the class.
+    """
+    if template_id == "gf-eval":
+        return eval_keys(params_list)
+    if template_id == "ec-scalar-mul":
+        return ec_keys(params_list)
+    if template_id == "gf-irreducible":
+        polys = [params["poly"] for params in params_list]
+        factors = factor_many(polys, settings.FACTOR_BUDGET_SECONDS, get_pool())
+        return [irreducible_key(poly, f) for poly, f in zip(polys, factors)]
+    if len(params_list) == 1:
+        return [answer_key(template_id, params_list[0])]
+    chunksize = max(1, len(params_list) // (4 * settings.AUTOGRADE_WORKERS))
+    return list(get_pool().map(partial(answer_key, template_id), params_list, chunksize=chunksize))
+
+
+def ensure_keys(db: Session, assignment: models.Assignment, user_ids: list[int]) -> dict[int, models.AnswerKey]:
+    """Stored answer keys of a personalized assignment for ``user_ids``.
+
+    Students without one yet (new members, or everyone right after the
+    assignment is created) get their seeded variant generated and keyed in
+    one ``compute_keys`` batch; the rows are committed before returning.
+    """
+    user_ids = list(dict.fromkeys(user_ids))
+    rows = (
+        db.query(models.AnswerKey)
+        .filter(models.AnswerKey.assignment_id == assignment.id, models.AnswerKey.user_id.in_(user_ids))
+        .all()
+    )
+    found = {row.user_id: row for row in rows}
+    missing = [uid for uid in user_ids if uid not in found]
+    if not missing:
+        return found
+    params = [generate_params(assignment.template_id, assignment.id, uid) for uid in missing]
+    keys = compute_keys(assignment.template_id, params)
+    for uid, p, key in zip(missing, params, keys):
+        found[uid] = models.AnswerKey(assignment_id=assignment.id, user_id=uid, params=json.dumps(p), key=json.dumps(key))
+        db.add(found[uid])
+    try:
+        db.commit()
+    except IntegrityError:
+        # Another request stored some of the same keys first; theirs are identical
+        db.rollback()
+        return ensure_keys(db, assignment, user_ids)
+    return found
+
+
+def clear_keys(db: Session, assignment_id: int) -> None:
+    db.query(models.AnswerKey).filter(models.AnswerKey.assignment_id == assignment_id).delete()
+
+
+def _is_file_submission(content: str) -> bool:
+    return content.startswith(str(Path(settings.UPLOAD_DIR) / "submissions"))
+
+
+def latest_submissions(db: Session, assignment_id: int) -> list[models.Submission]:
+    submissions = (
+        db.query(models.Submission)
+        .filter(models.Submission.assignment_id == assignment_id)
+        .order_by(models.Submission.user_id, models.Submission.submitted_at.desc(), models.Submission.id.desc())
+        .all()
+    )
+    latest: dict[int, models.Submission] = {}
+    for sub in submissions:
+        if sub.user_id not in latest:
+            latest[sub.user_id] = sub
+    return list(latest.values())
+
+
+def create_job(assignment_id: int) -> AutogradeJob:
+    job = AutogradeJob(id=uuid.uuid4().hex, assignment_id=assignment_id)
+    with _lock:
+        JOBS[job.id] = job
+        while len(JOBS) > _MAX_JOBS:
+            JOBS.popitem(last=False)
+    return job
+
+
+def grade_submissions(assignment_id: int, submission_ids: list[int]) -> AutogradeJob:
+    """Grade new submissions as an unregistered job: nobody polls it, and a burst
+    of submissions must not evict batch jobs from ``JOBS``."""
+    job = AutogradeJob(id=uuid.uuid4().hex, assignment_id=assignment_id)
+    run_job(job, submission_ids)
+    return job
+
+
+def get_job(job_id: str) -> Optional[AutogradeJob]:
+    return JOBS.get(job_id)
+
+
+def run_job(job: AutogradeJob, submission_ids: Optional[list[int]] = None, overwrite: bool = False) -> None:
+    """Grade the given submissions, or every latest submission of the assignment."""
+    job.status = "running"
+    db = SessionLocal()
+    try:
+        assignment = db.query(models.Assignment).filter_by(id=job.assignment_id).first()
+        if not assignment or assignment.template_id not in DEFAULT_PARAMS:
+            raise ValueError("Assignment is not based on an auto-gradable template")
+        template_id = assignment.template_id
+
+        if submission_ids is None:
+            submissions = latest_submissions(db, assignment.id)
+        else:
+            submissions = (
+                db.query(models.Submission)
+                .filter(models.Submission.id.in_(submission_ids))
+                .all()
+            )
+        todo = {
+            sub.id: sub
+            for sub in submissions
+            if (overwrite or sub.grade is None) and not _is_file_submission(sub.content)
+        }
+        job.total = len(todo)
+        if assignment.personalized:
+            # Grading is a lookup of each student's stored key
+            stored = ensure_keys(db, assignment, [sub.user_id for sub in todo.values()])
+            keys = {uid: json.loads(row.key) for uid, row in stored.items()}
+            items = [(sub.id, template_id, keys[sub.user_id], sub.content) for sub in todo.values()]
+        else:
+            key = compute_keys(template_id, [DEFAULT_PARAMS[template_id]])[0]
+            items = [(sub.id, template_id, key, sub.content) for sub in todo.values()]
+        chunks = [items[i : i + _CHUNK] for i in range(0, len(items), _CHUNK)]
+        for results in get_pool().map(grade_chunk, chunks):
+            for sid, grade in results:
+                if grade is None:
+                    job.skipped += 1
+                    continue
+                todo[sid].grade = grade
+                job.graded += 1
+        db.commit()
+        job.status = "done"
+    except Exception as exc:
+        db.rollback()
+        job.status = "failed"
+        job.error = str(exc)
+    finally:
+        db.close()
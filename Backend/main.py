@@ -21,6 +21,7 @@ from .routers import (
     assignment,
     auth,
     classrooms,
+    gf,
     materials,
     instructor_requests,
     me,
@@ -66,6 +67,20 @@ def ensure_seed_admin() -> None:
 
 ensure_seed_admin()
 
+
+def ensure_assignment_columns() -> None:
+    # Older SQLite DBs predate attachment_url/template_id; every assignment query selects them
+    if not settings.DATABASE_URL.startswith("sqlite"):
+        return
+    db = SessionLocal()
+    try:
+        assignment._ensure_assignment_columns(db)
+    finally:
+        db.close()
+
+
+ensure_assignment_columns()
+
 app = FastAPI(title=settings.APP_NAME)
 
 app.add_middleware(
@@ -123,6 +138,7 @@ app.include_router(assignment.router)
 app.include_router(materials.router)
 app.include_router(quiz.router)
 app.include_router(submission.router)
+app.include_router(gf.router)
 app.include_router(admin.router)
 
 
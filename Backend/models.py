@@ -8,6 +8,7 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -133,6 +134,8 @@ class Assignment(Base):
     title = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     attachment_url = Column(String, nullable=True)
+    template_id = Column(String, nullable=True)  # POLY_TEMPLATES id, enables auto-grading
+    personalized = Column(Boolean, default=False, nullable=False)  # per-student variants in answer_keys
     classroom_id = Column(Integer, ForeignKey("classrooms.id"), nullable=False)
     due_date = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -155,6 +158,22 @@ class Submission(Base):
     user = relationship("User", back_populates="submissions")
 
 
+class AnswerKey(Base):
+    """Exercise variant and answer key of one student for a personalized assignment."""
+
+    __tablename__ = "answer_keys"
+
+    id = Column(Integer, primary_key=True)
+    assignment_id = Column(Integer, ForeignKey("assignments.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    params = Column(Text, nullable=False)  # JSON, as produced by grading.exercises
+    key = Column(Text, nullable=False)  # JSON, as produced by grading.answer_key
+
+    __table_args__ = (
+        UniqueConstraint("assignment_id", "user_id", name="uq_answer_key_assignment_user"),
+    )
+
+
 class Material(Base):
     __tablename__ = "materials"
 
@@ -166,3 +185,18 @@ class Material(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
     classroom = relationship("Classroom")
+
+
+class IrreduciblePoly(Base):
+    __tablename__ = "irreducible_polys"
+
+    id = Column(Integer, primary_key=True)
+    m = Column(Integer, nullable=False)
+    poly = Column(String, nullable=False)  # hex; too wide for an INTEGER column past m = 62
+    weight = Column(Integer, nullable=False)
+    is_lowest = Column(Boolean, default=False, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("m", "poly", name="uq_irreducible_m_poly"),
+        Index("ix_irreducible_polys_m_weight", "m", "weight"),
+    )
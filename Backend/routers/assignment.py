@@ -1,6 +1,7 @@
+import json
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, UploadFile, File
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
@@ -8,6 +9,8 @@ from .. import models, schemas
 from ..database import get_db
 from ..deps import get_current_user, require_instructor
 from ..core.config import settings
+from ..grading import DEFAULT_PARAMS, worker
+from ..grading.exercises import describe
 
 router = APIRouter(prefix="/assignments", tags=["Assignments"])
 
@@ -32,6 +35,15 @@ POLY_TEMPLATES: list[schemas.AssignmentTemplate] = [
         title="Evaluate Polynomial in GF(5)",
         description="Evaluate f(x) = 3x³ + 4x² + 2x + 1 at x = 7 (mod 5). Show intermediate steps.",
     ),
+    schemas.AssignmentTemplate(
+        id="ec-scalar-mul",
+        title="Scalar Multiplication on a Binary Elliptic Curve",
+        description=(
+            "On the elliptic curve y² + xy = x³ + (α + 1)x² + 1 over GF(2⁴) = GF(2)[α]/(α⁴ + α + 1), "
+            "compute 5P for P = (α³, α² + 1). Give the result as an affine point (x, y), "
+            "or O for the point at infinity."
+        ),
+    ),
 ]
 
 
@@ -76,13 +88,46 @@ def _store_attachment(assignment_id: int, filename: str, content: bytes) -> str:
     return f"/uploads/assignments/assignment_{assignment_id}/{safe_name}"
 
 
-def _ensure_attachment_column(db: Session) -> None:
-    # Adds attachment_url column on existing DBs that predate the change.
+def _ensure_assignment_columns(db: Session) -> None:
+    # Adds columns on existing DBs that predate the change.
     result = db.execute(text("PRAGMA table_info(assignments)")).fetchall()
-    has_col = any(row[1] == "attachment_url" for row in result)
-    if not has_col:
-        db.execute(text("ALTER TABLE assignments ADD COLUMN attachment_url TEXT"))
-        db.commit()
+    existing = {row[1] for row in result}
+    columns = {
+        "attachment_url": "TEXT",
+        "template_id": "TEXT",
+        "personalized": "BOOLEAN NOT NULL DEFAULT 0",
+    }
+    for column, ddl in columns.items():
+        if column not in existing:
+            db.execute(text(f"ALTER TABLE assignments ADD COLUMN {column} {ddl}"))
+            db.commit()
+
+
+def _ensure_template(template_id: str | None) -> None:
+    if template_id is not None and template_id not in {tpl.id for tpl in POLY_TEMPLATES}:
+        raise HTTPException(status_code=400, detail="Unknown assignment template")
+
+
+def _student_ids(db: Session, classroom_id: int) -> list[int]:
+    rows = db.query(models.ClassroomMember.user_id).filter_by(classroom_id=classroom_id).all()
+    return [row[0] for row in rows]
+
+
+def _exercise(assignment: models.Assignment, row: models.AnswerKey | None, with_key: bool) -> schemas.ExerciseOut:
+    if row is None:
+        params = DEFAULT_PARAMS[assignment.template_id]
+        key = worker.compute_keys(assignment.template_id, [params])[0] if with_key else None
+    else:
+        params = json.loads(row.params)
+        key = json.loads(row.key) if with_key else None
+    return schemas.ExerciseOut(
+        assignment_id=assignment.id,
+        template_id=assignment.template_id,
+        user_id=row.user_id if row is not None else None,
+        description=describe(assignment.template_id, params),
+        params=params,
+        key=key,
+    )
 
 
 @router.get("/classroom/{classroom_id}", response_model=list[schemas.AssignmentOut])
@@ -110,20 +155,26 @@ def list_assignment_templates():
     "/",
     response_model=schemas.AssignmentOut,
 )
-async def create_assignment(
+def create_assignment(
     payload: schemas.AssignmentCreate,
     db: Session = Depends(get_db),
     user=Depends(require_instructor),
 ):
-    _ensure_attachment_column(db)
+    _ensure_assignment_columns(db)
     classroom = db.query(models.Classroom).filter_by(id=payload.classroom_id).first()
     if not classroom:
         raise HTTPException(status_code=404, detail="Classroom not found")
     _ensure_can_manage(classroom, user)
+    _ensure_template(payload.template_id)
     assignment = models.Assignment(**payload.dict())
+    assignment.personalized = payload.personalized and payload.template_id is not None
     db.add(assignment)
     db.commit()
     db.refresh(assignment)
+    if assignment.personalized:
+        # Every current member's variant and key, computed in one batch
+        worker.ensure_keys(db, assignment, _student_ids(db, classroom.id))
+        db.refresh(assignment)
     return assignment
 
 
@@ -137,7 +188,7 @@ async def upload_assignment_attachment(
     db: Session = Depends(get_db),
     user=Depends(require_instructor),
 ):
-    _ensure_attachment_column(db)
+    _ensure_assignment_columns(db)
     assignment = _get_assignment(db, assignment_id)
     _ensure_can_manage(assignment.classroom, user)
     content = await file.read()
@@ -169,14 +220,27 @@ def update_assignment(
     db: Session = Depends(get_db),
     user=Depends(require_instructor),
 ):
-    _ensure_attachment_column(db)
+    _ensure_assignment_columns(db)
     assignment = _get_assignment(db, assignment_id)
     _ensure_can_manage(assignment.classroom, user)
-    for key, value in payload.dict().items():
+    _ensure_template(payload.template_id)
+    before = (assignment.template_id, assignment.personalized)
+    data = payload.dict()
+    # A PUT without these fields (a title edit, say) keeps the stored template and mode
+    for key in ("template_id", "personalized"):
+        if key not in payload.model_fields_set:
+            data[key] = getattr(assignment, key)
+    for key, value in data.items():
         setattr(assignment, key, value)
+    assignment.personalized = data["personalized"] and data["template_id"] is not None
+    if (assignment.template_id, assignment.personalized) != before:
+        worker.clear_keys(db, assignment.id)
     db.add(assignment)
     db.commit()
     db.refresh(assignment)
+    if assignment.personalized:
+        worker.ensure_keys(db, assignment, _student_ids(db, assignment.classroom_id))
+        db.refresh(assignment)
     return assignment
 
 
@@ -191,6 +255,76 @@ def delete_assignment(
 ):
     assignment = _get_assignment(db, assignment_id)
     _ensure_can_manage(assignment.classroom, user)
+    worker.clear_keys(db, assignment.id)
     db.delete(assignment)
     db.commit()
     return None
+
+
+@router.get("/{assignment_id}/exercise", response_model=schemas.ExerciseOut)
+def get_my_exercise(
+    assignment_id: int,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    """The caller's variant of a template assignment (the shared one for staff)."""
+    assignment = _get_assignment(db, assignment_id)
+    _ensure_membership(db, assignment.classroom_id, user)
+    if not assignment.template_id:
+        raise HTTPException(status_code=400, detail="Assignment is not based on a template")
+    row = None
+    if assignment.personalized and user.id in _student_ids(db, assignment.classroom_id):
+        row = worker.ensure_keys(db, assignment, [user.id])[user.id]
+    return _exercise(assignment, row, with_key=False)
+
+
+@router.get("/{assignment_id}/exercises", response_model=list[schemas.ExerciseOut])
+def list_exercises(
+    assignment_id: int,
+    db: Session = Depends(get_db),
+    user=Depends(require_instructor),
+):
+    """Every student's variant with its answer key."""
+    assignment = _get_assignment(db, assignment_id)
+    _ensure_can_manage(assignment.classroom, user)
+    if not assignment.template_id:
+        raise HTTPException(status_code=400, detail="Assignment is not based on a template")
+    if not assignment.personalized:
+        return [_exercise(assignment, None, with_key=True)]
+    rows = worker.ensure_keys(db, assignment, _student_ids(db, assignment.classroom_id))
+    return [_exercise(assignment, row, with_key=True) for row in rows.values()]
+
+
+@router.post(
+    "/{assignment_id}/autograde",
+    response_model=schemas.AutogradeJobOut,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def autograde_assignment(
+    assignment_id: int,
+    background_tasks: BackgroundTasks,
+    overwrite: bool = False,
+    db: Session = Depends(get_db),
+    user=Depends(require_instructor),
+):
+    _ensure_assignment_columns(db)
+    assignment = _get_assignment(db, assignment_id)
+    _ensure_can_manage(assignment.classroom, user)
+    if not assignment.template_id:
+        raise HTTPException(status_code=400, detail="Assignment is not based on a template")
+    job = worker.create_job(assignment.id)
+    background_tasks.add_task(worker.run_job, job, None, overwrite)
+    return job
+
+
+@router.get("/autograde-jobs/{job_id}", response_model=schemas.AutogradeJobOut)
+def get_autograde_job(
+    job_id: str,
+    db: Session = Depends(get_db),
+    user=Depends(require_instructor),
+):
+    job = worker.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    _ensure_can_manage(_get_assignment(db, job.assignment_id).classroom, user)
+    return job
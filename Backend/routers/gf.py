@@ -0,0 +1,724 @@
+import asyncio
+import json
+from typing import Iterator, Literal, Optional
+
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+from starlette.background import BackgroundTask
+
+from .. import schemas
+from ..core.config import settings
+from ..database import get_db
+from ..deps import get_current_user
+from ..grading import worker
+from ..gf import GFConfig, default_config, poly_degree
+from ..gf.field import poly_gcd, poly_mod
+from ..gf.aes import batch_encrypt, expand_key
+from ..gf.batch import BINARY_OPS, batch_eval
+from ..gf.dlog import discrete_log
+from ..gf.ec import NIST_CURVES, BinaryCurve, add as ec_add, batch_scalar_mul, double as ec_double
+from ..gf.expr import compile_expr
+from ..gf.gcd import egcd, gcd
+from ..gf.factor import factor_with_budget
+from ..gf.irreducible import is_irreducible
+from ..gf.matrix import GF2, inverse, mat_mul, rank, solve
+from ..gf.normal import get_normal_basis
+from ..gf.notation import parse_poly
+from ..gf.packed_trace import PackedTrace, TraceTooLong
+from ..gf.primitive import factor_mersenne, find_generators, is_primitive, primitive_polynomials
+from ..gf.quadratic import get_quadratic
+from ..gf.rs import get_reed_solomon
+from ..gf.result_cache import ResultCache, compute as compute_op, etag
+from ..gf.trace import TRACE_OPS, stream_op, trace_op
+from ..utils.irreducible_catalog import DegreePending, build_degree, get_catalog, poly_hex
+
+router = APIRouter(prefix="/gf", tags=["GF(2^m)"])
+
+OCTET_STREAM = "application/octet-stream"
+_DTYPES = {"uint16": np.dtype("<u2"), "uint32": np.dtype("<u4"), "uint64": np.dtype("<u8")}
+NDJSON = "application/x-ndjson"
+EVENT_STREAM = "text/event-stream"
+# Steps per write once the first step is out; one write per step is too chatty
+_TRACE_CHUNK = 256
+
+result_cache = ResultCache(settings.GF_RESULT_CACHE_ITEMS, settings.GF_RESULT_CACHE_BYTES)
+
+
+def _config(m: int, mod_poly: Optional[int]) -> GFConfig:
+    try:
+        return default_config(m) if mod_poly is None else GFConfig(m, mod_poly)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+def _parse_poly(value: str, max_degree: Optional[int] = None) -> int:
+    # Hex ("0x11B"), binary ("0b1011") or decimal
+    try:
+        poly = int(value.strip(), 0)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid polynomial '{value[:32]}'")
+    return _check_poly(poly, max_degree)
+
+
+def _check_poly(poly: int, max_degree: Optional[int] = None) -> int:
+    max_degree = settings.GF_MAX_M if max_degree is None else max_degree
+    if poly < 0:
+        raise HTTPException(status_code=400, detail="Polynomial must be non-negative")
+    if poly_degree(poly) > max_degree:
+        raise HTTPException(status_code=400, detail=f"Degree must be at most {max_degree}")
+    return poly
+
+
+def _check_size(count: int) -> None:
+    if count > settings.GF_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch too large (max {settings.GF_BATCH_MAX_ITEMS} items)",
+        )
+
+
+def _unpack(body: bytes, op: str, dtype: np.dtype) -> tuple[np.ndarray, Optional[np.ndarray]]:
+    if len(body) % dtype.itemsize:
+        raise HTTPException(status_code=400, detail="Body length is not a multiple of the element size")
+    values = np.frombuffer(body, dtype=dtype)
+    if op not in BINARY_OPS:
+        return values, None
+    if len(values) % 2:
+        raise HTTPException(status_code=400, detail="Body must hold two arrays of equal length")
+    half = len(values) // 2
+    return values[:half], values[half:]
+
+
+def _word_dtype(m: int) -> str:
+    return "uint16" if m <= 16 else "uint32" if m <= 32 else "uint64"
+
+
+def _json_operands(values: list[int]) -> np.ndarray:
+    # int64 keeps negative exponents; elements of GF(2^64) may need all 64 bits
+    try:
+        return np.asarray(values, dtype=np.int64)
+    except OverflowError:
+        return np.asarray(values, dtype=np.uint64)
+
+
+@router.post(
+    "/batch",
+    response_model=schemas.GFBatchOut,
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/json": {"schema": schemas.GFBatchIn.model_json_schema()},
+                OCTET_STREAM: {"schema": {"type": "string", "format": "binary"}},
+            }
+        }
+    },
+)
+async def batch(
+    request: Request,
+    m: Optional[int] = None,
+    mod_poly: Optional[int] = None,
+    op: Optional[schemas.GFOp] = None,
+    dtype: Literal["uint16", "uint32", "uint64"] = "uint16",
+    user=Depends(get_current_user),
+):
+    """Evaluate one op over whole operand arrays.
+
+    Above m = 16 only add, mul and mod are batched (packed uint64 words, up
+    to m = 64). JSON bodies follow ``GFBatchIn``. Binary bodies (``application/octet-stream``)
+    take ``m``, ``mod_poly``, ``op`` and ``dtype`` from the query string and hold
+    little-endian ``a`` followed by ``b`` (for add/mul/div/pow). Binary requests,
+    or requests that accept ``application/octet-stream``, get the results back as
+    a packed array of the same dtype.
+    """
+    body = await request.body()
+    binary_in = request.headers.get("content-type", "").startswith(OCTET_STREAM)
+    if binary_in:
+        if m is None or op is None:
+            raise HTTPException(status_code=400, detail="Binary batches need m and op query parameters")
+        a, b = _unpack(body, op, _DTYPES[dtype])
+    else:
+        try:
+            payload = schemas.GFBatchIn.model_validate_json(body)
+        except ValidationError as exc:
+            raise HTTPException(status_code=422, detail=exc.errors(include_url=False))
+        m, mod_poly, op = payload.m, payload.mod_poly, payload.op
+        try:
+            a = _json_operands(payload.a)
+            b = _json_operands(payload.b) if payload.b is not None else None
+        except OverflowError:
+            raise HTTPException(status_code=400, detail="Operands must fit in 64 bits")
+        if (a < 0).any() or (op != "pow" and b is not None and (b < 0).any()):
+            raise HTTPException(status_code=400, detail="Operands must be non-negative")
+    _check_size(len(a))
+    cfg = _config(m, mod_poly)
+    if binary_in and _DTYPES[dtype].itemsize * 8 < cfg.m:
+        raise HTTPException(status_code=400, detail=f"dtype {dtype} is narrower than m = {cfg.m} bits")
+
+    try:
+        result = batch_eval(op, a, b, cfg)
+    except (ValueError, ZeroDivisionError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    if binary_in or OCTET_STREAM in request.headers.get("accept", ""):
+        out_dtype = _DTYPES[dtype] if binary_in else _DTYPES[_word_dtype(cfg.m)]
+        return Response(content=result.astype(out_dtype).tobytes(), media_type=OCTET_STREAM)
+    return schemas.GFBatchOut(op=op, m=cfg.m, mod_poly=cfg.mod_poly, result=result.tolist())
+
+
+@router.get("/irreducibles/{m}", response_model=schemas.IrreducibleCatalogOut)
+def irreducible_catalog(
+    m: int,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    if not 2 <= m <= settings.GF_MAX_M:
+        raise HTTPException(status_code=400, detail=f"m must be between 2 and {settings.GF_MAX_M}")
+    try:
+        return get_catalog(db, m, settings.GF_CATALOG_LIVE_MAX_M)
+    except DegreePending as exc:
+        # Returned rather than raised: background tasks do not run after an HTTPException
+        return JSONResponse(
+            {"detail": f"{exc}; retry shortly"},
+            status_code=503,
+            headers={"Retry-After": "5"},
+            background=BackgroundTask(build_degree, m),
+        )
+
+
+@router.get("/is-irreducible", response_model=schemas.IrreducibilityOut)
+def check_irreducible(poly: str, user=Depends(get_current_user)):
+    value = _parse_poly(poly)
+    return schemas.IrreducibilityOut(
+        poly=poly_hex(value),
+        degree=poly_degree(value),
+        irreducible=is_irreducible(value),
+    )
+
+
+@router.get("/factor", response_model=schemas.FactorizationOut)
+async def factorize(poly: str, user=Depends(get_current_user)):
+    """Factor over GF(2) in the grading process pool, within FACTOR_BUDGET_SECONDS."""
+    value = _parse_poly(poly)
+    if value < 1:
+        raise HTTPException(status_code=400, detail="The zero polynomial has no factorization")
+    job = worker.get_pool().submit(factor_with_budget, value, settings.FACTOR_BUDGET_SECONDS)
+    factors = await asyncio.wrap_future(job)
+    if factors is None:
+        raise HTTPException(status_code=400, detail="Factorization exceeded the time budget")
+    return schemas.FactorizationOut(
+        poly=poly_hex(value),
+        degree=poly_degree(value),
+        irreducible=len(factors) == 1 and factors[0][1] == 1,
+        factors=[schemas.FactorOut(poly=poly_hex(p), exponent=e) for p, e in factors],
+    )
+
+
+@router.get("/primitive/{m}", response_model=schemas.PrimitiveOut)
+def primitive(
+    m: int,
+    limit: int = Query(8, ge=1, le=64),
+    user=Depends(get_current_user),
+):
+    if not 2 <= m <= settings.GF_MAX_M:
+        raise HTTPException(status_code=400, detail=f"m must be between 2 and {settings.GF_MAX_M}")
+    try:
+        factors = factor_mersenne(m)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return schemas.PrimitiveOut(
+        m=m,
+        order_factors=[str(p) for p in factors],
+        primitive_polys=[poly_hex(f) for f in primitive_polynomials(m, limit)],
+    )
+
+
+@router.get("/generators", response_model=schemas.GeneratorsOut)
+def generators(
+    m: int,
+    mod_poly: Optional[str] = None,
+    limit: int = Query(4, ge=1, le=64),
+    user=Depends(get_current_user),
+):
+    if m > settings.GF_MAX_M:
+        raise HTTPException(status_code=400, detail=f"m must be at most {settings.GF_MAX_M}")
+    cfg = _config(m, _parse_poly(mod_poly) if mod_poly is not None else None)
+    try:
+        found = find_generators(cfg, limit)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return schemas.GeneratorsOut(
+        m=cfg.m,
+        mod_poly=poly_hex(cfg.mod_poly),
+        primitive=is_primitive(cfg.mod_poly),
+        generators=[poly_hex(g) for g in found],
+    )
+
+
+@router.post("/gcd", response_model=schemas.GFGcdOut)
+def polynomial_gcd(payload: schemas.GFGcdIn, user=Depends(get_current_user)):
+    """gcd of two GF(2)[x] polynomials of degree up to ``GF_GCD_MAX_DEGREE``
+    (half-GCD for large inputs), with Bezout cofactors when ``extended``."""
+    a = _parse_poly(payload.a, settings.GF_GCD_MAX_DEGREE)
+    b = _parse_poly(payload.b, settings.GF_GCD_MAX_DEGREE)
+    if payload.extended:
+        g, s, t = egcd(a, b)
+        return schemas.GFGcdOut(gcd=poly_hex(g), degree=poly_degree(g), s=poly_hex(s), t=poly_hex(t))
+    g = gcd(a, b)
+    return schemas.GFGcdOut(gcd=poly_hex(g), degree=poly_degree(g))
+
+
+@router.get("/dlog", response_model=schemas.GFDlogOut)
+def dlog(
+    h: str,
+    g: Optional[str] = None,
+    m: int = 8,
+    mod_poly: Optional[str] = None,
+    method: Optional[schemas.GFDlogMethod] = None,
+    user=Depends(get_current_user),
+):
+    """x with g^x = h; g defaults to the smallest generator of GF(2^m)*."""
+    if m > settings.GF_MAX_M:
+        raise HTTPException(status_code=400, detail=f"m must be at most {settings.GF_MAX_M}")
+    cfg = _config(m, _parse_poly(mod_poly) if mod_poly is not None else None)
+    h_val = _parse_poly(h)
+    try:
+        g_val = _parse_poly(g) if g is not None else find_generators(cfg)[0]
+        x, order, used = discrete_log(h_val, g_val, cfg, method)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return schemas.GFDlogOut(
+        m=cfg.m,
+        mod_poly=poly_hex(cfg.mod_poly),
+        g=poly_hex(g_val),
+        h=poly_hex(h_val),
+        x=str(x),
+        order=str(order),
+        method=used,
+    )
+
+
+@router.get("/normal-basis", response_model=schemas.NormalBasisOut)
+def normal_basis(
+    m: int = 8,
+    mod_poly: Optional[str] = None,
+    values: list[str] = Query(default=[]),
+    user=Depends(get_current_user),
+):
+    """The cached normal basis of GF(2^m) (optimal when one exists), with ``values`` converted to it."""
+    if m > settings.GF_MAX_M:
+        raise HTTPException(status_code=400, detail=f"m must be at most {settings.GF_MAX_M}")
+    _check_size(len(values))
+    cfg = _config(m, _parse_poly(mod_poly) if mod_poly is not None else None)
+    try:
+        basis = get_normal_basis(cfg)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return schemas.NormalBasisOut(
+        m=cfg.m,
+        mod_poly=poly_hex(cfg.mod_poly),
+        beta=poly_hex(basis.beta),
+        onb_type=basis.onb_type,
+        complexity=basis.complexity,
+        values=[poly_hex(basis.to_normal(poly_mod(_parse_poly(v), cfg.mod_poly))) for v in values],
+    )
+
+
+@router.post("/quadratic", response_model=schemas.GFQuadraticOut)
+def quadratic(payload: schemas.GFQuadraticIn, user=Depends(get_current_user)):
+    """Trace, half-trace (odd m), square root, or a root of z^2 + z = c, for each value."""
+    _check_size(len(payload.values))
+    if payload.m > settings.GF_MAX_M:
+        raise HTTPException(status_code=400, detail=f"m must be at most {settings.GF_MAX_M}")
+    cfg = _config(payload.m, _parse_poly(payload.mod_poly) if payload.mod_poly is not None else None)
+    values = [poly_mod(_parse_poly(v), cfg.mod_poly) for v in payload.values]
+    op = payload.op
+    try:
+        q = get_quadratic(cfg)
+        if op == "half-trace":
+            results = [q.half_trace(v) for v in values]
+        elif op == "sqrt":
+            results = [q.sqrt(v) for v in values]
+        elif op == "solve":
+            results = [q.solve(v) for v in values]
+        else:
+            results = [q.trace(v) for v in values]
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return schemas.GFQuadraticOut(
+        op=op,
+        m=cfg.m,
+        mod_poly=poly_hex(cfg.mod_poly),
+        results=[poly_hex(r) if r is not None else None for r in results],
+    )
+
+
+def _ec_point(p: Optional[schemas.GFPoint]):
+    return None if p is None else (_parse_poly(p.x), _parse_poly(p.y))
+
+
+def _ec_curve(payload: schemas.GFECIn) -> tuple[BinaryCurve, Optional[tuple[int, int]]]:
+    # The curve and the default first operand (the base point of named curves)
+    if payload.curve is not None:
+        named = NIST_CURVES.get(payload.curve)
+        if named is None:
+            raise HTTPException(status_code=400, detail=f"Unknown curve '{payload.curve}'")
+        return named.curve, named.g
+    if payload.m is None:
+        raise HTTPException(status_code=400, detail="Give a named curve or m")
+    if payload.m > settings.GF_MAX_M:
+        raise HTTPException(status_code=400, detail=f"m must be at most {settings.GF_MAX_M}")
+    cfg = _config(payload.m, _parse_poly(payload.mod_poly) if payload.mod_poly is not None else None)
+    try:
+        return BinaryCurve(cfg, _parse_poly(payload.a), _parse_poly(payload.b)), None
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+@router.post("/ec", response_model=schemas.GFECOut)
+def elliptic_curve(payload: schemas.GFECIn, user=Depends(get_current_user)):
+    """Point addition, doubling, or k P for every k in ``scalars`` on y^2 + xy = x^3 + a x^2 + b."""
+    curve, base = _ec_curve(payload)
+    p = _ec_point(payload.p) if payload.p is not None else base
+    op = payload.op
+    try:
+        scalars = [int(k.strip(), 0) for k in payload.scalars]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Scalars must be decimal or hex integers")
+    if op == "mul":
+        _check_size(len(scalars))
+        if curve.cfg.m * sum(k.bit_length() for k in scalars) > settings.GF_EC_MAX_WORK:
+            raise HTTPException(status_code=413, detail="Too much ladder work for one request")
+    try:
+        curve.check(p)
+        if op == "add":
+            q = _ec_point(payload.q)
+            curve.check(q)
+            points = [ec_add(p, q, curve)]
+        elif op == "double":
+            points = [ec_double(p, curve)]
+        else:
+            points = batch_scalar_mul(scalars, p, curve)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return schemas.GFECOut(
+        op=op,
+        m=curve.cfg.m,
+        mod_poly=poly_hex(curve.cfg.mod_poly),
+        a=poly_hex(curve.a),
+        b=poly_hex(curve.b),
+        points=[schemas.GFPoint(x=poly_hex(pt[0]), y=poly_hex(pt[1])) if pt is not None else None for pt in points],
+    )
+
+
+def _matrix_work(op: str, a: list[list[int]], b: list, m: int) -> int:
+    # Field products of the op, weighted by their cost (roughly in ns): packed
+    # rows for GF(2), table gathers up to m = 16, BigField products above
+    rows, cols = len(a), max((len(row) for row in a), default=0)
+    if op == "mul":
+        products = rows * cols * max((len(row) for row in b), default=0)
+    else:
+        products = rows * cols * min(rows, cols) * (2 if op == "inverse" else 1)
+    weight = 1 if m == 1 else 8 if m <= 16 else 2000 + 50 * m
+    return products * weight
+
+
+@router.post("/matrix", response_model=schemas.GFMatrixOut)
+def matrix(payload: schemas.GFMatrixIn, user=Depends(get_current_user)):
+    """Matrix product, rank, inverse or linear solve over GF(2^m)."""
+    op, a, b = payload.op, payload.a, payload.b
+    _check_size(sum(len(row) for row in a) + sum(len(v) if isinstance(v, list) else 1 for v in b or []))
+    cfg = GF2 if payload.m == 1 and payload.mod_poly is None else _config(payload.m, payload.mod_poly)
+    if op == "mul" and not (b and all(isinstance(row, list) for row in b)):
+        raise HTTPException(status_code=400, detail="Op 'mul' needs a matrix b")
+    if op == "solve" and not (b and all(isinstance(v, int) for v in b)):
+        raise HTTPException(status_code=400, detail="Op 'solve' needs a vector b")
+    if _matrix_work(op, a, b, cfg.m) > settings.GF_MATRIX_MAX_WORK:
+        raise HTTPException(status_code=413, detail="Matrices too large for this field in one request")
+    try:
+        if op == "mul":
+            result = mat_mul(a, b, cfg)
+        elif op == "rank":
+            result = rank(a, cfg)
+        elif op == "inverse":
+            result = inverse(a, cfg)
+        else:
+            result = solve(a, b, cfg)
+    except (ValueError, ZeroDivisionError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return schemas.GFMatrixOut(op=op, m=cfg.m, mod_poly=cfg.mod_poly, result=result)
+
+
+def _hex_bytes(value: str, sizes: tuple[int, ...], what: str) -> bytes:
+    try:
+        data = bytes.fromhex(value.removeprefix("0x"))
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid hex {what}")
+    if len(data) not in sizes:
+        raise HTTPException(status_code=400, detail=f"{what.capitalize()}s are {' or '.join(map(str, sizes))} bytes")
+    return data
+
+
+def _hex_rows(states: np.ndarray) -> list[str]:
+    return [row.tobytes().hex() for row in states]
+
+
+@router.post("/aes", response_model=schemas.AESOut)
+def aes(payload: schemas.AESIn, user=Depends(get_current_user)):
+    """Run blocks through AES rounds, optionally returning every intermediate step."""
+    _check_size(len(payload.blocks) * (16 if payload.trace else 1))
+    key = _hex_bytes(payload.key, (16, 24, 32), "AES key")
+    blocks = np.frombuffer(b"".join(_hex_bytes(b, (16,), "AES block") for b in payload.blocks), dtype=np.uint8)
+    try:
+        states, steps = batch_encrypt(blocks.reshape(-1, 16), key, payload.rounds, payload.trace)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    trace = [{step: _hex_rows(s) for step, s in record.items()} for record in steps] if payload.trace else None
+    rounds = payload.rounds if payload.rounds is not None else len(expand_key(key)) - 1
+    return schemas.AESOut(rounds=rounds, states=_hex_rows(states), trace=trace)
+
+
+@router.post(
+    "/rs",
+    response_model=schemas.RSOut,
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/json": {"schema": schemas.RSIn.model_json_schema()},
+                OCTET_STREAM: {"schema": {"type": "string", "format": "binary"}},
+            }
+        }
+    },
+)
+async def reed_solomon(
+    request: Request,
+    op: Optional[schemas.RSOp] = None,
+    n: int = 255,
+    k: int = 223,
+    mod_poly: Optional[str] = None,
+    fcr: int = 0,
+    user=Depends(get_current_user),
+):
+    """Reed-Solomon encode or decode many blocks over GF(2^8).
+
+    JSON bodies follow ``RSIn``. Binary bodies (``application/octet-stream``)
+    take the code from the query string and hold the blocks back to back, k
+    bytes each to encode or n bytes each to decode; the response holds the
+    codewords or decoded messages the same way, followed when decoding by the
+    int16 little-endian count of corrected symbols per block (-1 when
+    uncorrectable).
+    """
+    body = await request.body()
+    binary_in = request.headers.get("content-type", "").startswith(OCTET_STREAM)
+    if not binary_in:
+        try:
+            payload = schemas.RSIn.model_validate_json(body)
+        except ValidationError as exc:
+            raise HTTPException(status_code=422, detail=exc.errors(include_url=False))
+        op, n, k, mod_poly, fcr = payload.op, payload.n, payload.k, payload.mod_poly, payload.fcr
+    elif op is None:
+        raise HTTPException(status_code=400, detail="Binary blocks need an op query parameter")
+    cfg = _config(8, _parse_poly(mod_poly) if mod_poly is not None else None)
+    try:
+        code = get_reed_solomon(n, k, cfg, fcr % 255)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    width = k if op == "encode" else n
+    if binary_in:
+        if len(body) % width:
+            raise HTTPException(status_code=400, detail=f"Body length is not a multiple of {width} bytes")
+        data = np.frombuffer(body, dtype=np.uint8)
+    else:
+        data = np.frombuffer(b"".join(_hex_bytes(b, (width,), "block") for b in payload.blocks), dtype=np.uint8)
+    _check_size(len(data))
+    blocks = data.reshape(-1, width)
+
+    corrected = None
+    if op == "encode":
+        out = code.encode(blocks)
+    else:
+        out, corrected = code.decode(blocks)
+    if binary_in:
+        tail = corrected.astype("<i2").tobytes() if corrected is not None else b""
+        return Response(content=out.tobytes() + tail, media_type=OCTET_STREAM)
+    return schemas.RSOut(
+        op=op,
+        n=n,
+        k=k,
+        mod_poly=poly_hex(cfg.mod_poly),
+        alpha=poly_hex(code.alpha),
+        blocks=_hex_rows(out),
+        corrected=corrected.tolist() if corrected is not None else None,
+    )
+
+
+@router.post("/eval", response_model=schemas.GFEvalOut)
+def evaluate(payload: schemas.GFEvalIn, user=Depends(get_current_user)):
+    _check_size(len(payload.envs))
+    cfg = None
+    if payload.m is not None:
+        mod_poly = _parse_poly(payload.mod_poly) if payload.mod_poly is not None else None
+        cfg = _config(payload.m, mod_poly)
+    try:
+        compiled = compile_expr(payload.expr)
+        results = []
+        for env in payload.envs:
+            values = {k: _check_poly(v if isinstance(v, int) else parse_poly(v)) for k, v in env.items()}
+            results.append(poly_hex(compiled.evaluate(values, cfg, payload.mode)))
+    except (ValueError, ZeroDivisionError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return schemas.GFEvalOut(expr=compiled.source, variables=list(compiled.variables), results=results)
+
+
+def _traced(op: str, a: int, b: int, cfg: GFConfig) -> tuple[int, list[dict]]:
+    steps = []
+    gen = trace_op(op, a, b, cfg)
+    while True:
+        try:
+            steps.append(next(gen))
+        except StopIteration as stop:
+            return stop.value, steps
+        if len(steps) > settings.GF_COMPUTE_MAX_STEPS:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Trace longer than {settings.GF_COMPUTE_MAX_STEPS} steps; stream it from /gf/trace",
+            )
+
+
+@router.get("/compute", response_model=schemas.GFComputeOut)
+def compute(
+    request: Request,
+    op: Literal[TRACE_OPS],
+    a: str,
+    b: str = "0",
+    m: int = 8,
+    mod_poly: Optional[str] = None,
+    trace: bool = False,
+    user=Depends(get_current_user),
+):
+    """One calculator operation, served from a cache shared by all users.
+
+    Results (with the step list when ``trace`` is set) are cached under
+    (op, a, b, m, mod_poly, trace) and carry a strong ETag derived from that
+    key; a request whose ``If-None-Match`` holds it gets 304 without any
+    computation. ``X-Cache`` says whether the body came from the cache. For
+    ``pow``, ``b`` is the exponent.
+    """
+    if m > settings.GF_MAX_M:
+        raise HTTPException(status_code=400, detail=f"m must be at most {settings.GF_MAX_M}")
+    cfg = _config(m, _parse_poly(mod_poly) if mod_poly is not None else None)
+    a_val, b_val = _parse_poly(a), _parse_poly(b)
+    divisor = {"inv": a_val, "div": b_val}.get(op)
+    if divisor is not None and poly_gcd(poly_mod(divisor, cfg.mod_poly), cfg.mod_poly) != 1:
+        raise HTTPException(status_code=400, detail="Operand has no inverse modulo mod_poly")
+    key = (op, a_val, b_val, cfg.m, cfg.mod_poly, trace)
+    tag = etag(key)
+    headers = {"ETag": tag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match.strip() == "*" or tag in (t.strip() for t in if_none_match.split(",")):
+        result_cache.revalidated()
+        return Response(status_code=304, headers=headers)
+
+    body = result_cache.get(key)
+    headers["X-Cache"] = "HIT" if body is not None else "MISS"
+    if body is None:
+        try:
+            if trace:
+                value, steps = _traced(op, a_val, b_val, cfg)
+            else:
+                value, steps = compute_op(op, a_val, b_val, cfg), None
+        except (ValueError, ZeroDivisionError) as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        body = schemas.GFComputeOut(
+            op=op,
+            m=cfg.m,
+            mod_poly=poly_hex(cfg.mod_poly),
+            a=poly_hex(a_val),
+            b=poly_hex(b_val),
+            result=poly_hex(value),
+            steps=steps,
+        ).model_dump_json(exclude_none=True).encode()
+        result_cache.put(key, body)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/compute/stats", response_model=schemas.GFCacheStatsOut)
+def compute_stats(user=Depends(get_current_user)):
+    return result_cache.stats()
+
+
+def _encode_trace(steps: Iterator[dict], sse: bool) -> Iterator[str]:
+    buf: list[str] = []
+    first = True
+    try:
+        for step in steps:
+            data = json.dumps(step, separators=(",", ":"))
+            if sse:
+                event = "result" if step["kind"] == "result" else "step"
+                buf.append(f"event: {event}\ndata: {data}\n\n")
+            else:
+                buf.append(data + "\n")
+            if first or len(buf) >= _TRACE_CHUNK:
+                yield "".join(buf)
+                buf.clear()
+                first = False
+    except (ValueError, ZeroDivisionError) as exc:
+        data = json.dumps({"kind": "error", "detail": str(exc)})
+        buf.append(f"event: error\ndata: {data}\n\n" if sse else data + "\n")
+    if buf:
+        yield "".join(buf)
+
+
+@router.get("/trace")
+def trace(
+    request: Request,
+    op: Literal[TRACE_OPS],
+    a: str,
+    b: str = "0",
+    m: int = 8,
+    mod_poly: Optional[str] = None,
+    format: Optional[Literal["ndjson", "sse", "binary"]] = None,
+    user=Depends(get_current_user),
+):
+    """Stream the step trace of one calculator operation.
+
+    Steps use the ``Step`` schema of gf2m.ts and are generated lazily, so the
+    first one is sent right away and memory does not grow with the trace. The
+    stream ends with ``{"kind": "result", "value": ...}``. NDJSON by default;
+    Server-Sent Events with ``format=sse`` or ``Accept: text/event-stream``.
+    For ``pow``, ``b`` is the exponent.
+
+    ``format=binary`` (or ``Accept: application/octet-stream``) returns the
+    whole trace in the packed struct-of-arrays format of ``gf/packed_trace.py``
+    instead, decoded on the client by ``traceCodec.ts``.
+    """
+    if m > settings.GF_MAX_M:
+        raise HTTPException(status_code=400, detail=f"m must be at most {settings.GF_MAX_M}")
+    cfg = _config(m, _parse_poly(mod_poly) if mod_poly is not None else None)
+    a_val, b_val = _parse_poly(a), _parse_poly(b)
+    # Fail before streaming rather than halfway through the trace
+    divisor = {"inv": a_val, "div": b_val}.get(op)
+    if divisor is not None and poly_gcd(poly_mod(divisor, cfg.mod_poly), cfg.mod_poly) != 1:
+        raise HTTPException(status_code=400, detail="Operand has no inverse modulo mod_poly")
+
+    accept = request.headers.get("accept", "")
+    if format == "binary" or (format is None and OCTET_STREAM in accept):
+        try:
+            packed = PackedTrace.from_op(op, a_val, b_val, cfg, settings.GF_COMPUTE_MAX_STEPS)
+        except TraceTooLong:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Trace longer than {settings.GF_COMPUTE_MAX_STEPS} steps; stream it as NDJSON or SSE",
+            )
+        except (ValueError, ZeroDivisionError) as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        return Response(content=packed.to_bytes(), media_type=OCTET_STREAM)
+
+    sse = format == "sse" or (format is None and EVENT_STREAM in accept)
+    return StreamingResponse(
+        _encode_trace(stream_op(op, a_val, b_val, cfg), sse),
+        media_type=EVENT_STREAM if sse else NDJSON,
+        headers={"Cache-Control": "no-cache"},
+    )
@@ -2,13 +2,14 @@ from datetime import datetime
 from pathlib import Path
 import re
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File
 from sqlalchemy.orm import Session
 
 from .. import models, schemas
 from ..database import get_db
 from ..deps import get_current_user, require_instructor
 from ..core.config import settings
+from ..grading import worker
 
 router = APIRouter(prefix="/submissions", tags=["Submissions"])
 
@@ -42,6 +43,7 @@ def _ensure_membership(
 @router.post("/", response_model=schemas.SubmissionOut)
 def create_submission(
     payload: schemas.SubmissionCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
@@ -55,6 +57,8 @@ def create_submission(
     db.add(submission)
     db.commit()
     db.refresh(submission)
+    if assignment.template_id:
+        background_tasks.add_task(worker.grade_submissions, assignment.id, [submission.id])
     return submission
 
 
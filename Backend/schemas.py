@@ -71,6 +71,8 @@ class AssignmentBase(BaseModel):
     classroom_id: int
     due_date: Optional[datetime] = None
     attachment_url: Optional[str] = None
+    template_id: Optional[str] = None
+    personalized: bool = False  # template assignments: one seeded variant per student
 
 
 class AssignmentCreate(AssignmentBase):
@@ -88,6 +90,25 @@ class AssignmentTemplate(BaseModel):
     description: Optional[str] = None
 
 
+class ExerciseOut(BaseModel):
+    assignment_id: int
+    template_id: str
+    user_id: Optional[int] = None  # None for the shared, non-personalized variant
+    description: str
+    params: dict
+    key: Optional[dict] = None  # instructors only
+
+
+class AutogradeJobOut(OrmBase):
+    id: str
+    assignment_id: int
+    status: Literal["queued", "running", "done", "failed"]
+    total: int
+    graded: int
+    skipped: int
+    error: Optional[str] = None
+
+
 class QuizBase(BaseModel):
     title: str
     description: Optional[str] = None
@@ -145,3 +166,233 @@ class MFAEnrollOut(BaseModel):
 class MFAVerifyIn(BaseModel):
     code: str
     mfa_token: str | None = None
+
+
+GFOp = Literal["add", "mul", "div", "inv", "pow", "mod"]
+# Big-field algorithms (m > 16), see gf/fast.py
+GFMode = Literal["standard", "fast", "itoh-tsujii", "normal"]
+
+
+class GFBatchIn(BaseModel):
+    m: int
+    mod_poly: Optional[int] = None  # defaults to the built-in polynomial for m
+    op: GFOp
+    a: list[int]
+    b: Optional[list[int]] = None  # second operand, or exponents for pow
+
+
+class GFBatchOut(BaseModel):
+    op: GFOp
+    m: int
+    mod_poly: int
+    result: list[int]
+
+
+GFMatrixOp = Literal["mul", "rank", "inverse", "solve"]
+
+
+class GFMatrixIn(BaseModel):
+    op: GFMatrixOp
+    m: int  # 1 is GF(2)
+    mod_poly: Optional[int] = None
+    a: list[list[int]]
+    b: Optional[list[list[int]] | list[int]] = None  # matrix for mul, right-hand side for solve
+
+
+class GFMatrixOut(BaseModel):
+    op: GFMatrixOp
+    m: int
+    mod_poly: int
+    result: list[list[int]] | list[int] | int
+
+
+class AESIn(BaseModel):
+    key: str  # 32, 48 or 64 hex digits
+    blocks: list[str]  # 32 hex digits each
+    rounds: Optional[int] = None  # stop after this many rounds; all by default
+    trace: bool = False
+
+
+class AESOut(BaseModel):
+    rounds: int
+    states: list[str]  # after the last round run
+    # per round, per step: the state of every block (hex), when traced
+    trace: Optional[list[dict[str, list[str]]]] = None
+
+
+RSOp = Literal["encode", "decode"]
+
+
+class RSIn(BaseModel):
+    op: RSOp
+    n: int = 255
+    k: int = 223
+    mod_poly: Optional[str] = None  # degree 8; the calculator's 0x11B by default
+    fcr: int = 0  # first consecutive root: g(x) = prod (x + alpha^(fcr + j))
+    blocks: list[str]  # hex; k bytes each to encode, n bytes each to decode
+
+
+class RSOut(BaseModel):
+    op: RSOp
+    n: int
+    k: int
+    mod_poly: str
+    alpha: str  # the field tables' generator, the code's primitive element
+    blocks: list[str]  # codewords, or decoded messages
+    # per block when decoding: symbols corrected, -1 when uncorrectable
+    corrected: Optional[list[int]] = None
+
+
+class GFEvalIn(BaseModel):
+    expr: str  # e.g. "(a·b⁻¹ + c)^5 mod f"
+    m: Optional[int] = None  # field used when expr has no "mod" clause
+    mod_poly: Optional[str] = None
+    # one binding per evaluation; ints are bit patterns, strings use polynomial notation
+    envs: list[dict[str, int | str]] = [{}]
+    mode: GFMode = "standard"
+
+
+class GFEvalOut(BaseModel):
+    expr: str  # canonical form, the compile-cache key
+    variables: list[str]
+    results: list[str]
+
+
+class GFComputeOut(BaseModel):
+    op: str
+    m: int
+    mod_poly: str
+    a: str
+    b: str  # exponent for pow
+    result: str
+    steps: Optional[list[dict[str, int | str]]] = None  # Step schema of gf2m.ts
+
+
+class GFCacheStatsOut(BaseModel):
+    entries: int
+    bytes: int
+    max_items: int
+    max_bytes: int
+    hits: int
+    misses: int
+    revalidations: int
+
+
+class IrreducibleCatalogOut(BaseModel):
+    m: int
+    lowest: str
+    trinomials: list[str]
+    pentanomials: list[str]
+
+
+class IrreducibilityOut(BaseModel):
+    poly: str
+    degree: int
+    irreducible: bool
+
+
+class FactorOut(BaseModel):
+    poly: str
+    exponent: int
+
+
+class FactorizationOut(BaseModel):
+    poly: str
+    degree: int
+    irreducible: bool
+    factors: list[FactorOut]
+
+
+class PrimitiveOut(BaseModel):
+    m: int
+    order_factors: list[str]  # prime factors of 2^m - 1, decimal
+    primitive_polys: list[str]
+
+
+GFDlogMethod = Literal["brute-force", "bsgs", "pohlig-hellman"]
+
+
+class GFGcdIn(BaseModel):
+    a: str  # hex ("0x...") or binary ("0b...") polynomial over GF(2)
+    b: str
+    extended: bool = False
+
+
+class GFGcdOut(BaseModel):
+    gcd: str
+    degree: int  # -1 for the zero polynomial
+    s: Optional[str] = None  # with extended: s a + t b = gcd
+    t: Optional[str] = None
+
+
+class GFDlogOut(BaseModel):
+    m: int
+    mod_poly: str
+    g: str
+    h: str
+    x: str  # decimal; may exceed 2^53
+    order: str  # multiplicative order of g, decimal
+    method: GFDlogMethod
+
+
+GFQuadraticOp = Literal["trace", "half-trace", "sqrt", "solve"]
+
+
+class GFQuadraticIn(BaseModel):
+    op: GFQuadraticOp
+    m: int
+    mod_poly: Optional[str] = None
+    values: list[str]  # field elements, hex ("0x...") or binary ("0b...")
+
+
+class GFQuadraticOut(BaseModel):
+    op: GFQuadraticOp
+    m: int
+    mod_poly: str
+    # "0x0"/"0x1" for trace; for solve one root z (the other is z + 1), None when Tr(c) = 1
+    results: list[Optional[str]]
+
+
+GFECOp = Literal["add", "double", "mul"]
+
+
+class GFPoint(BaseModel):
+    x: str
+    y: str
+
+
+class GFECIn(BaseModel):
+    op: GFECOp
+    curve: Optional[str] = None  # NIST name ("B-163"); otherwise m, mod_poly, a, b
+    m: Optional[int] = None
+    mod_poly: Optional[str] = None
+    a: str = "0x0"
+    b: str = "0x1"
+    p: Optional[GFPoint] = None  # None is the point at infinity; the base point on named curves
+    q: Optional[GFPoint] = None  # second operand of add
+    scalars: list[str] = []  # for mul, decimal or hex; negative allowed
+
+
+class GFECOut(BaseModel):
+    op: GFECOp
+    m: int
+    mod_poly: str
+    a: str
+    b: str
+    points: list[Optional[GFPoint]]  # None is the point at infinity
+
+
+class NormalBasisOut(BaseModel):
+    m: int
+    mod_poly: str
+    beta: str  # normal element, polynomial basis
+    onb_type: Optional[int] = None  # 1 or 2 for an optimal normal basis
+    complexity: int  # terms in the multiplication table; 2m - 1 for an ONB
+    values: list[str] = []  # the requested elements in normal coordinates (bit i: beta^(2^i))
+
+
+class GeneratorsOut(BaseModel):
+    m: int
+    mod_poly: str
+    primitive: bool  # x itself generates GF(2^m)*
+    generators: list[str]
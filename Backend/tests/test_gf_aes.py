@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from Backend.deps import get_current_user
+from Backend.gf.aes import (
+    batch_encrypt,
+    encrypt_block,
+    encrypt_block_steps,
+    expand_key,
+    inv_sbox,
+    mix_columns,
+    sbox,
+    shift_rows,
+)
+from Backend.routers import gf
+
+PLAIN = bytes.fromhex("00112233445566778899aabbccddeeff")
+# FIPS-197 Appendix C
+VECTORS = [
+    ("000102030405060708090a0b0c0d0e0f", "69c4e0d86a7b0430d8cdb78070b4c55a"),
+    ("000102030405060708090a0b0c0d0e0f1011121314151617", "dda97ca4864cdfe06eaf70a0ec0d7191"),
+    ("000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f", "8ea2b7ca516745bfeafc49904b496089"),
+]
+
+
+def test_sbox_from_field_inverse():
+    s = sbox()
+    assert (s[0x00], s[0x01], s[0x53], s[0xFF]) == (0x63, 0x7C, 0xED, 0x16)
+    assert sorted(s) == list(range(256))
+    assert all(inv_sbox()[s[a]] == a for a in range(256))
+
+
+def test_steps():
+    state = list(range(16))
+    assert shift_rows(state) == [0, 5, 10, 15, 4, 9, 14, 3, 8, 13, 2, 7, 12, 1, 6, 11]
+    # FIPS-197 5.1.3 example column
+    assert mix_columns([0xDB, 0x13, 0x53, 0x45] * 4)[:4] == [0x8E, 0x4D, 0xA1, 0xBC]
+    # FIPS-197 A.1: last round key of 2b7e1516...
+    assert expand_key(bytes.fromhex("2b7e151628aed2a6abf7158809cf4f3c"))[10].hex() == "d014f9a8c9ee2589e13f0cc8b6630ca6"
+
+
+@pytest.mark.parametrize("key, cipher", VECTORS)
+def test_known_answers(key, cipher):
+    key = bytes.fromhex(key)
+    assert encrypt_block(PLAIN, key).hex() == cipher
+    assert encrypt_block_steps(PLAIN, key).hex() == cipher
+    states, steps = batch_encrypt(np.frombuffer(PLAIN * 3, dtype=np.uint8).reshape(3, 16), key)
+    assert steps == [] and {row.tobytes().hex() for row in states} == {cipher}
+
+
+def test_batch_matches_single_blocks():
+    rng = np.random.default_rng(1)
+    blocks = rng.integers(0, 256, (200, 16), dtype=np.uint8)
+    key = rng.integers(0, 256, 16, dtype=np.uint8).tobytes()
+    fast, _ = batch_encrypt(blocks, key)
+    traced, steps = batch_encrypt(blocks, key, trace=True)
+    assert (fast == traced).all()
+    assert [row.tobytes() for row in fast] == [encrypt_block(row.tobytes(), key) for row in blocks]
+    assert len(steps) == 11 and list(steps[0]) == ["addRoundKey"]
+    assert list(steps[1]) == ["subBytes", "shiftRows", "mixColumns", "addRoundKey"]
+    assert "mixColumns" not in steps[10]
+    # Stopping early agrees with the trace
+    partial, _ = batch_encrypt(blocks, key, rounds=3)
+    assert (partial == steps[3]["addRoundKey"]).all()
+    with pytest.raises(ValueError):
+        batch_encrypt(blocks, key, rounds=11)
+
+
+def test_aes_endpoint():
+    app = FastAPI()
+    app.include_router(gf.router)
+    app.dependency_overrides[get_current_user] = lambda: object()
+    client = TestClient(app)
+    key, cipher = VECTORS[0]
+    res = client.post("/gf/aes", json={"key": key, "blocks": [PLAIN.hex()]})
+    assert res.json() == {"rounds": 10, "states": [cipher], "trace": None}
+    res = client.post("/gf/aes", json={"key": key, "blocks": [PLAIN.hex()], "rounds": 1, "trace": True})
+    body = res.json()
+    # FIPS-197 C.1, round[1].start and round[1].s_box
+    assert body["trace"][0]["addRoundKey"] == ["00102030405060708090a0b0c0d0e0f0"]
+    assert body["trace"][1]["subBytes"] == ["63cab7040953d051cd60e0e7ba70e18c"]
+    assert client.post("/gf/aes", json={"key": "00", "blocks": []}).status_code == 400
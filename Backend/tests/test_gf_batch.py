@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from Backend.deps import get_current_user
+from Backend.gf import GFConfig, default_config, gf_div, gf_inv, gf_mod, gf_mul, gf_pow
+from Backend.gf.batch import batch_eval
+from Backend.routers import gf
+
+F64 = 0x1000000000000001B
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(gf.router)
+    app.dependency_overrides[get_current_user] = lambda: object()
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("cfg", [default_config(3), default_config(8), GFConfig(16, 0x1002B)])
+def test_batch_matches_scalar(cfg):
+    rng = np.random.default_rng(cfg.m)
+    a = rng.integers(0, cfg.size, 500)
+    b = rng.integers(1, cfg.size, 500)
+    n = rng.integers(-50, 5000, 500)
+    x = rng.integers(0, 1 << 32, 500, dtype=np.uint64)
+    assert batch_eval("add", a, b, cfg).tolist() == [int(p) ^ int(q) for p, q in zip(a, b)]
+    assert batch_eval("mul", a, b, cfg).tolist() == [gf_mul(int(p), int(q), cfg) for p, q in zip(a, b)]
+    assert batch_eval("div", a, b, cfg).tolist() == [gf_div(int(p), int(q), cfg) for p, q in zip(a, b)]
+    assert batch_eval("inv", b, None, cfg).tolist() == [gf_inv(int(q), cfg) for q in b]
+    assert batch_eval("pow", b, n, cfg).tolist() == [gf_pow(int(q), int(k), cfg) for q, k in zip(b, n)]
+    assert batch_eval("mod", x, None, cfg).tolist() == [gf_mod(int(v), cfg) for v in x]
+
+
+@pytest.mark.parametrize("m, mod_poly", [(17, 0x20009), (32, 0x1000000AF), (33, (1 << 33) | (1 << 10) | 1), (64, F64)])
+def test_word_batches_match_scalar(m, mod_poly):
+    cfg = GFConfig(m, mod_poly)
+    rng = np.random.default_rng(m)
+    a = rng.integers(0, 1 << 63, 500, dtype=np.uint64) * np.uint64(2) + np.uint64(1) & np.uint64(cfg.mask)
+    b = rng.integers(0, 1 << 63, 500, dtype=np.uint64) * np.uint64(2) & np.uint64(cfg.mask)
+    x = rng.integers(0, 1 << 63, 500, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+    assert batch_eval("add", a, b, cfg).tolist() == [int(p) ^ int(q) for p, q in zip(a, b)]
+    assert batch_eval("mul", a, b, cfg).tolist() == [gf_mul(int(p), int(q), cfg) for p, q in zip(a, b)]
+    assert batch_eval("mod", x, None, cfg).tolist() == [gf_mod(int(v), cfg) for v in x]
+    with pytest.raises(ValueError, match="m <= 16"):
+        batch_eval("inv", a, None, cfg)
+
+
+def test_batch_json(client):
+    res = client.post("/gf/batch", json={"m": 8, "op": "mul", "a": [0x57, 0], "b": [0x83, 5]})
+    assert res.status_code == 200
+    assert res.json()["result"] == [0xC1, 0]
+    res = client.post("/gf/batch", json={"m": 8, "op": "inv", "a": [0]})
+    assert res.status_code == 400
+    # Exponents from 2^63 up arrive as uint64
+    res = client.post("/gf/batch", json={"m": 8, "op": "pow", "a": [3, 0], "b": [(1 << 63) + 5, 1 << 63]})
+    assert res.json()["result"] == [gf_pow(3, (1 << 63) + 5, default_config(8)), 0]
+
+
+def test_batch_binary(client):
+    a = np.array([0x57, 0x02, 0x53], dtype="<u2")
+    b = np.array([0x83, 0x87, 0xCA], dtype="<u2")
+    res = client.post(
+        "/gf/batch?m=8&op=mul",
+        content=a.tobytes() + b.tobytes(),
+        headers={"content-type": "application/octet-stream"},
+    )
+    assert res.status_code == 200
+    assert np.frombuffer(res.content, dtype="<u2").tolist() == [0xC1, 0x15, 0x01]
+
+
+def test_batch_words_json_and_binary(client):
+    # x^63 * x = x^64 = x^4 + x^3 + x + 1
+    res = client.post("/gf/batch", json={"m": 64, "mod_poly": F64, "op": "mul", "a": [1 << 63, 3], "b": [2, 1 << 63]})
+    assert res.status_code == 200
+    assert res.json()["result"] == [0x1B, (1 << 63) ^ 0x1B]
+    a = np.array([1 << 63, 5], dtype="<u8")
+    b = np.array([2, 7], dtype="<u8")
+    res = client.post(
+        f"/gf/batch?m=64&mod_poly={F64}&op=mul&dtype=uint64",
+        content=a.tobytes() + b.tobytes(),
+        headers={"content-type": "application/octet-stream"},
+    )
+    assert np.frombuffer(res.content, dtype="<u8").tolist() == [0x1B, 0b11011]
+    assert client.post("/gf/batch", json={"m": 65, "op": "mul", "a": [1], "b": [1]}).status_code == 400
+
+
+def test_batch_rejects_narrow_dtypes_and_reducible_moduli(client):
+    a = np.array([1 << 16], dtype="<u4")
+    b = np.array([3], dtype="<u4")
+    headers = {"content-type": "application/octet-stream"}
+    url = f"/gf/batch?m=17&mod_poly={0x20009}&op=mul"
+    res = client.post(url + "&dtype=uint16", content=a.astype("<u2").tobytes() * 2, headers=headers)
+    assert res.status_code == 400
+    res = client.post(url + "&dtype=uint32", content=a.tobytes() + b.tobytes(), headers=headers)
+    assert np.frombuffer(res.content, dtype="<u4").tolist() == [gf_mul(1 << 16, 3, GFConfig(17, 0x20009))]
+    # x^17 + 1 and x^8 + 1 are divisible by x + 1: the word path rejects them like the table path
+    for m, mod_poly in [(17, 0x20001), (8, 0x101)]:
+        res = client.post("/gf/batch", json={"m": m, "mod_poly": mod_poly, "op": "mul", "a": [3], "b": [5]})
+        assert res.status_code == 400
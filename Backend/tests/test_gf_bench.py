@@ -0,0 +1,26 @@
+from Backend.utils import gf_bench
+
+
+def test_bench_skips_table_modes_above_table_max():
+    rows = gf_bench.bench([8, 163], ["mul", "mod"], repeat=1)
+    assert [(r["m"], r["op"]) for r in rows] == [(8, "mul"), (8, "mod"), (163, "mul"), (163, "mod")]
+    assert all(us > 0 for us in rows[0]["us"].values())
+    assert set(rows[0]["us"]) == set(gf_bench.MODES)
+    assert rows[2]["us"]["table"] is None and rows[2]["us"]["batch"] is None
+    assert rows[2]["us"]["fast"] > 0
+
+
+def test_compare_reports_slowdowns_beyond_threshold():
+    baseline = [{"m": 163, "op": "inv", "us": {"standard": 10.0, "fast": 10.0, "table": None}}]
+    rows = [{"m": 163, "op": "inv", "us": {"standard": 12.0, "fast": 20.0, "table": None}}]
+    (r,) = gf_bench.compare(rows, baseline, threshold=0.5)
+    assert (r["mode"], r["ratio"]) == ("fast", 2.0)
+    # A machine twice as slow as the baseline's scales the baseline up
+    assert gf_bench.compare(rows, baseline, threshold=0.5, scale=2.0) == []
+    # Sub-noise differences never count
+    tiny = [{"m": 163, "op": "inv", "us": {"standard": 0.01}}]
+    assert gf_bench.compare([{"m": 163, "op": "inv", "us": {"standard": 0.1}}], tiny) == []
+    # Batch cells are per element: a 10x slowdown of a 0.01 us cell is a whole batch call slower
+    fast_batch = [{"m": 8, "op": "mul", "us": {"batch": 0.01}}]
+    (r,) = gf_bench.compare([{"m": 8, "op": "mul", "us": {"batch": 0.1}}], fast_batch)
+    assert (r["mode"], round(r["ratio"])) == ("batch", 10)
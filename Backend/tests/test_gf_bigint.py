@@ -0,0 +1,34 @@
+import random
+
+import pytest
+
+from Backend.gf import NIST_POLYS, GFConfig, default_config, gf_inv, gf_mul, gf_pow
+from Backend.gf.bigint import BigField, clmul_window, clsqr
+from Backend.gf.field import clmul, mul_bitwise, poly_mod
+
+
+@pytest.mark.parametrize("m", sorted(NIST_POLYS))
+def test_nist_fields_match_reference(m):
+    cfg = default_config(m)
+    rng = random.Random(m)
+    for _ in range(20):
+        a, b = rng.getrandbits(m), rng.getrandbits(m)
+        assert clmul_window(a, b) == clmul(a, b)
+        assert clsqr(a) == clmul(a, a)
+        assert gf_mul(a, b, cfg) == mul_bitwise(a, b, cfg) == poly_mod(clmul(a, b), cfg.mod_poly)
+        if a:
+            assert gf_mul(a, gf_inv(a, cfg), cfg) == 1
+    # Fermat: a^(2^m) = a
+    a = rng.getrandbits(m)
+    assert gf_pow(a, 1 << m, cfg) == a
+
+
+def test_dense_modulus_matches_reference():
+    # x^17 + x^16 + ... dense enough to take the windowed fold path
+    cfg = GFConfig(17, 0x3FFFF ^ 0x3E)
+    field = BigField(cfg)
+    assert field.low_terms is None
+    rng = random.Random(17)
+    for _ in range(50):
+        a, b = rng.getrandbits(17), rng.getrandbits(17)
+        assert field.mul(a, b) == mul_bitwise(a, b, cfg)
@@ -0,0 +1,95 @@
+import random
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from Backend.deps import get_current_user
+from Backend.gf import GFConfig, default_config, dlog, gf_pow
+from Backend.gf.dlog import DLOG_METHODS, baby_steps, discrete_log
+from Backend.gf.irreducible import lowest_weight_irreducible
+from Backend.gf.primitive import find_generators
+from Backend.routers import gf
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(gf.router)
+    app.dependency_overrides[get_current_user] = lambda: object()
+    return TestClient(app)
+
+
+def _field(m):
+    return GFConfig(m, lowest_weight_irreducible(m))
+
+
+@pytest.mark.parametrize(
+    "m, method",
+    [(4, "brute-force"), (8, "brute-force"), (13, "bsgs"), (16, "pohlig-hellman"), (31, "bsgs"), (64, "pohlig-hellman")],
+)
+def test_auto_method_follows_group_order(m, method):
+    cfg = _field(m)
+    g = find_generators(cfg)[0]
+    rng = random.Random(m)
+    for _ in range(3):
+        x = rng.randrange(cfg.size - 1)
+        assert discrete_log(gf_pow(g, x, cfg), g, cfg) == (x, cfg.size - 1, method)
+
+
+@pytest.mark.parametrize("method", DLOG_METHODS)
+def test_forced_methods_agree(method):
+    cfg = _field(12)
+    g = find_generators(cfg)[0]
+    for x in (0, 1, 2048, 4094):
+        assert discrete_log(gf_pow(g, x, cfg), g, cfg, method)[0] == x
+
+
+def test_subgroup_generators():
+    # 2^8 - 1 = 3 * 5 * 17: g^15 has order 17, and only its powers have logs
+    cfg = default_config(8)
+    g = gf_pow(find_generators(cfg)[0], 15, cfg)
+    assert discrete_log(gf_pow(g, 11, cfg), g, cfg) == (11, 17, "brute-force")
+    with pytest.raises(ValueError, match="not a power"):
+        discrete_log(find_generators(cfg)[0], g, cfg)
+    with pytest.raises(ValueError, match="nonzero"):
+        discrete_log(0, g, cfg)
+
+
+def test_baby_step_tables_are_reused():
+    cfg = _field(31)  # 2^31 - 1 is prime: BSGS over the whole group
+    g = find_generators(cfg)[0]
+    discrete_log(gf_pow(g, 12345, cfg), g, cfg)
+    table = baby_steps(cfg, g, cfg.size - 1)[0]
+    assert discrete_log(gf_pow(g, 987654321, cfg), g, cfg)[0] == 987654321
+    assert baby_steps(cfg, g, cfg.size - 1)[0] is table
+
+
+def test_baby_step_cache_is_bounded_by_steps(monkeypatch):
+    monkeypatch.setattr(dlog, "DLOG_CACHE_STEPS", 100)
+    cfg = _field(16)
+    g = find_generators(cfg)[0]
+    # 256 steps: over the budget, so rebuilt on every call
+    large = baby_steps(cfg, g, 65535)[0]
+    assert baby_steps(cfg, g, 65535)[0] is not large
+    # 16 steps, for the subgroup of order 255
+    h = gf_pow(g, 257, cfg)
+    small = baby_steps(cfg, h, 255)[0]
+    assert baby_steps(cfg, h, 255)[0] is small
+
+
+def test_large_prime_orders_are_refused():
+    with pytest.raises(ValueError, match="too large"):
+        discrete_log(5, 2, _field(61))
+
+
+def test_dlog_endpoint(client):
+    body = client.get("/gf/dlog", params={"h": "0xC1", "g": "0x03"}).json()
+    assert body["order"] == "255" and body["method"] == "brute-force"
+    cfg = default_config(8)
+    assert gf_pow(3, int(body["x"]), cfg) == 0xC1
+    # Default generator and a forced method
+    body = client.get("/gf/dlog", params={"h": "0x5C", "method": "bsgs"}).json()
+    assert body["method"] == "bsgs" and gf_pow(int(body["g"], 16), int(body["x"]), cfg) == 0x5C
+    assert client.get("/gf/dlog", params={"h": "0", "m": 8}).status_code == 400
+    assert client.get("/gf/dlog", params={"h": "5", "m": 61, "mod_poly": hex(lowest_weight_irreducible(61))}).status_code == 400
@@ -0,0 +1,167 @@
+import random
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from Backend.deps import get_current_user
+from Backend.gf import GFConfig, default_config
+from Backend.gf.ec import (
+    NIST_CURVES,
+    BinaryCurve,
+    add,
+    batch_normalize,
+    batch_scalar_mul,
+    double,
+    ld_add,
+    ld_double,
+    negate,
+    scalar_mul,
+    scalar_mul_all,
+    to_ld,
+)
+from Backend.gf.quadratic import get_quadratic
+from Backend.routers import gf
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(gf.router)
+    app.dependency_overrides[get_current_user] = lambda: object()
+    return TestClient(app)
+
+
+def _affine_add(p, q, curve):
+    # Textbook chord-and-tangent formulas, one inversion per call
+    f = curve.field
+    if p is None:
+        return q
+    if q is None:
+        return p
+    (x1, y1), (x2, y2) = p, q
+    if x1 == x2 and (y1 != y2 or x1 == 0):
+        return None
+    if p == q:
+        lam = x1 ^ f.div(y1, x1)
+        x3 = f.sqr(lam) ^ lam ^ curve.a
+        return x3, f.sqr(x1) ^ f.mul(lam, x3) ^ x3
+    lam = f.div(y1 ^ y2, x1 ^ x2)
+    x3 = f.sqr(lam) ^ lam ^ x1 ^ x2 ^ curve.a
+    return x3, f.mul(lam, x1 ^ x3) ^ x3 ^ y1
+
+
+def _random_point(curve, rng):
+    # y = x z with z^2 + z = x + a + b / x^2
+    f = curve.field
+    q = get_quadratic(curve.cfg)
+    while True:
+        x = rng.getrandbits(curve.cfg.m)
+        if x:
+            z = q.solve(x ^ curve.a ^ f.mul(curve.b, f.sqr(f.inv(x))))
+            if z is not None:
+                return x, f.mul(x, z)
+
+
+def _curves():
+    rng = random.Random(23)
+    for cfg in (default_config(3), default_config(4), default_config(8), GFConfig(13, 0b10000000011011)):
+        for a in (0, 1, rng.getrandbits(cfg.m)):
+            yield BinaryCurve(cfg, a, rng.getrandbits(cfg.m) or 1)
+
+
+@pytest.mark.parametrize("curve", list(_curves()))
+def test_ld_arithmetic_matches_affine(curve):
+    rng = random.Random(curve.b)
+    p, q = _random_point(curve, rng), _random_point(curve, rng)
+    assert curve.contains(p) and curve.contains(q)
+    assert add(p, q, curve) == _affine_add(p, q, curve)
+    assert double(p, curve) == _affine_add(p, p, curve)
+    assert add(p, negate(p), curve) is None
+    assert add(None, p, curve) == p
+    # Multiples by repeated mixed additions, normalized together
+    ld, multiples = to_ld(None), []
+    for _ in range(12):
+        ld = ld_add(ld, p, curve)
+        multiples.append(ld)
+    expected, acc = [], None
+    for _ in range(12):
+        acc = _affine_add(acc, p, curve)
+        expected.append(acc)
+    assert batch_normalize(multiples, curve) == expected
+    assert batch_normalize([ld_double(to_ld(p), curve)], curve) == [expected[1]]
+
+
+@pytest.mark.parametrize("curve", list(_curves()))
+def test_ladder_matches_repeated_addition(curve):
+    p = _random_point(curve, random.Random(curve.a))
+    expected, acc = [], None
+    for _ in range(40):
+        expected.append(acc)
+        acc = _affine_add(acc, p, curve)
+    assert batch_scalar_mul(range(40), p, curve) == expected
+    assert batch_scalar_mul([-k for k in range(40)], p, curve) == [negate(e) for e in expected]
+    assert scalar_mul(7, None, curve) is None
+
+
+def test_point_of_order_two():
+    curve = BinaryCurve(default_config(8), 1, 0x53)
+    t = (0, get_quadratic(curve.cfg).sqrt(curve.b))
+    assert curve.contains(t)
+    assert double(t, curve) is None
+    assert batch_scalar_mul([1, 2, 3, 4], t, curve) == [t, None, t, None]
+
+
+@pytest.mark.parametrize("name", sorted(NIST_CURVES))
+def test_nist_base_points(name):
+    named = NIST_CURVES[name]
+    curve, g = named.curve, named.g
+    assert curve.contains(g)
+    assert scalar_mul(named.n, g, curve) is None
+    assert scalar_mul(named.n + 1, g, curve) == g
+    k1, k2 = random.Random(name).getrandbits(curve.cfg.m), 12345
+    p1, p2 = batch_scalar_mul([k1, k2], g, curve)
+    assert add(p1, p2, curve) == scalar_mul(k1 + k2, g, curve)
+
+
+def test_scalar_mul_all_mixes_curves_of_one_field():
+    curves = list(_curves())[3:6]
+    rng = random.Random(5)
+    jobs = [(rng.randrange(1, 50), _random_point(c, rng), c) for c in curves]
+    assert scalar_mul_all(jobs) == [scalar_mul(k, p, c) for k, p, c in jobs]
+    with pytest.raises(ValueError):
+        scalar_mul_all([(3, _random_point(c, rng), c) for c in list(_curves())[:6]])
+
+
+def test_rejects_bad_curves_and_points():
+    with pytest.raises(ValueError):
+        BinaryCurve(default_config(4), 1, 0)
+    curve = BinaryCurve(default_config(4), 1, 1)
+    with pytest.raises(ValueError):
+        scalar_mul(3, (1, 1), curve)
+
+
+def test_ec_endpoint(client):
+    named = NIST_CURVES["B-163"]
+    resp = client.post("/gf/ec", json={"op": "mul", "curve": "B-163", "scalars": ["1", "2", hex(named.n)]})
+    assert resp.status_code == 200
+    points = resp.json()["points"]
+    g2 = double(named.g, named.curve)
+    assert points[0] == {"x": f"0x{named.g[0]:X}", "y": f"0x{named.g[1]:X}"}
+    assert points[1] == {"x": f"0x{g2[0]:X}", "y": f"0x{g2[1]:X}"}
+    assert points[2] is None
+
+    curve = BinaryCurve(default_config(4), 0x3, 0x1)
+    p, q = (0x8, 0x5), (0x6, 0x8)
+    body = {"op": "add", "m": 4, "a": "0x3", "b": "0x1", "p": {"x": "0x8", "y": "0x5"}, "q": {"x": "0x6", "y": "0x8"}}
+    resp = client.post("/gf/ec", json=body)
+    s = add(p, q, curve)
+    assert resp.json()["points"] == [{"x": f"0x{s[0]:X}", "y": f"0x{s[1]:X}"}]
+
+
+def test_ec_endpoint_errors(client):
+    assert client.post("/gf/ec", json={"op": "double", "curve": "P-256"}).status_code == 400
+    body = {"op": "double", "m": 4, "a": "0x3", "b": "0x1", "p": {"x": "0x1", "y": "0x1"}}
+    assert client.post("/gf/ec", json=body).status_code == 400
+    body = {"op": "mul", "curve": "B-233", "scalars": [str(1 << 233)] * 100}
+    assert client.post("/gf/ec", json=body).status_code == 413
@@ -0,0 +1,71 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from Backend.deps import get_current_user
+from Backend.gf import default_config, gf_inv, gf_mul, gf_pow
+from Backend.gf.expr import compile_expr, tokenize
+from Backend.routers import gf
+
+
+def test_notations_agree():
+    assert compile_expr("x⁴ + x² + 1").evaluate() == 0x15
+    assert compile_expr("x^7 + x + 1").evaluate() == 0x83
+    assert compile_expr("x**8 + x**4 + x**3 + x + 1").evaluate() == 0x11B
+
+
+def test_field_expression_matches_engine():
+    cfg = default_config(8)
+    expr = compile_expr("(a·b⁻¹ + c)^5 mod f")
+    assert expr.variables == ("a", "b", "c", "f")
+    a, b, c = 0x57, 0x83, 0x1F
+    expected = gf_pow(gf_mul(a, gf_inv(b, cfg), cfg) ^ c, 5, cfg)
+    assert expr.evaluate({"a": a, "b": b, "c": c, "f": 0x11B}) == expected
+    # without a mod clause the caller's field applies
+    assert compile_expr("a * b").evaluate({"a": 0x57, "b": 0x83}, cfg) == 0xC1
+
+
+def test_template_multiplication():
+    assert compile_expr("(x² + 1)(x + 1) mod x³ + x + 1").evaluate() == 0b100
+
+
+def test_common_subexpressions_and_constants_are_merged():
+    expr = compile_expr("x^4 + x^2 + 1 + (a*b)^2 + b*a")
+    ops = [op for op, _, _ in expr.code]
+    assert ops.count("mul") == 1
+    assert ops.count("const") == 1
+
+
+def test_compiled_programs_are_cached():
+    assert compile_expr("a*b + 1") is compile_expr("a * b + 1")
+    assert tokenize("0x11B") == ("283",)
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        compile_expr("a / b").evaluate({"a": 1, "b": 2})
+    with pytest.raises(ValueError):
+        compile_expr("(a + ")
+    with pytest.raises(ValueError):
+        compile_expr("a + b").evaluate({"a": 1})
+    with pytest.raises(ValueError):
+        compile_expr("a * b").evaluate({"a": -1, "b": 3}, default_config(8))
+
+
+def test_eval_endpoint():
+    app = FastAPI()
+    app.include_router(gf.router)
+    app.dependency_overrides[get_current_user] = lambda: object()
+    client = TestClient(app)
+    res = client.post(
+        "/gf/eval",
+        json={"expr": "a·b⁻¹ + 1", "m": 8, "envs": [{"a": 0x57, "b": 1}, {"a": "x^6 + x^4 + x^2 + x + 1", "b": "x"}]},
+    )
+    assert res.status_code == 200
+    body = res.json()
+    assert body["variables"] == ["a", "b"]
+    cfg = default_config(8)
+    assert body["results"] == ["0x56", f"0x{gf_mul(0x57, gf_inv(2, cfg), cfg) ^ 1:X}"]
+    assert client.post("/gf/eval", json={"expr": "a / b", "envs": [{"a": 1, "b": 1}]}).status_code == 400
+    for env in ({"a": -1, "b": 3}, {"a": 1 << 2000, "b": 3}, {"a": "x^2000", "b": 3}):
+        assert client.post("/gf/eval", json={"expr": "a * b", "m": 8, "envs": [env]}).status_code == 400
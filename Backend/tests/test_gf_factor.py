@@ -0,0 +1,72 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from Backend.deps import get_current_user
+from Backend.gf.factor import derivative, factor, factor_many, factor_with_budget, square_free, square_root
+from Backend.gf.field import clmul
+from Backend.gf.irreducible import is_irreducible
+from Backend.routers import gf
+
+
+def _expand(factors):
+    out = 1
+    for p, e in factors:
+        for _ in range(e):
+            out = clmul(out, p)
+    return out
+
+
+def test_helpers():
+    # d/dx (x^5 + x^2 + x + 1) = x^4 + 1
+    assert derivative(0b100111) == 0b10001
+    assert square_root(clmul(0b1011, 0b1011)) == 0b1011
+    # x^4 + x^2 + 1 = (x^2 + x + 1)^2
+    assert square_free(0b10101) == [(0b111, 2)]
+
+
+def test_small_cases():
+    assert factor(0x13) == [(0x13, 1)]
+    assert factor(0b10101) == [(0b111, 2)]
+    # x^16 - x splits into every irreducible of degree 1, 2 and 4
+    assert factor((1 << 16) | 0b10) == [(0b10, 1), (0b11, 1), (0b111, 1), (0x13, 1), (0x19, 1), (0x1F, 1)]
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_random_polynomials(seed):
+    rng = random.Random(seed)
+    for _ in range(25):
+        n = rng.randint(1, 96)
+        f = rng.getrandbits(n) | (1 << n)
+        if rng.random() < 0.4:
+            g = rng.getrandbits(6) | 64
+            f = clmul(clmul(f, g), g)
+        factors = factor(f)
+        assert _expand(factors) == f
+        assert all(is_irreducible(p) for p, _ in factors)
+        assert len({p for p, _ in factors}) == len(factors)
+
+
+def test_degree_64_and_budget():
+    f = clmul((1 << 64) | 0b11011, (1 << 33) | (1 << 13) | 1)
+    assert factor(f) == [((1 << 33) | (1 << 13) | 1, 1), ((1 << 64) | 0b11011, 1)]
+    assert factor_with_budget((1 << 900) | random.Random(3).getrandbits(900), 0.01) is None
+
+
+def test_factor_many_uses_pool():
+    polys = [0x13, 0b10101, (1 << 16) | 0b10]
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        assert factor_many(polys, budget=5.0, pool=pool) == [factor(f) for f in polys]
+
+
+def test_factor_endpoint():
+    app = FastAPI()
+    app.include_router(gf.router)
+    app.dependency_overrides[get_current_user] = lambda: object()
+    client = TestClient(app)
+    body = client.get("/gf/factor", params={"poly": "0x15"}).json()
+    assert body == {"poly": "0x15", "degree": 4, "irreducible": False, "factors": [{"poly": "0x7", "exponent": 2}]}
+    assert client.get("/gf/factor", params={"poly": "0"}).status_code == 400
@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from Backend.gf import NIST_POLYS, GFConfig, gf_inv, gf_pow
+from Backend.gf.bigint import get_big_field
+from Backend.gf.expr import compile_expr
+from Backend.gf.fast import ENGINE_MODES, addition_chain, get_engine
+
+FIELDS = [GFConfig(17, (1 << 17) | 0b1001), GFConfig(64, (1 << 64) | 0b11011)] + [
+    GFConfig(m, f) for m, f in NIST_POLYS.items()
+]
+
+
+@pytest.mark.parametrize("n", [1, 2, 7, 162, 570, 1000])
+def test_addition_chain_reaches_n(n):
+    reached = {1}
+    for i, j in addition_chain(n):
+        assert i in reached and j in reached
+        reached.add(i + j)
+    assert max(reached) == n
+
+
+@pytest.mark.parametrize("cfg", FIELDS, ids=lambda cfg: f"m{cfg.m}")
+def test_modes_agree(cfg):
+    rng = random.Random(cfg.m)
+    ref = get_big_field(cfg)
+    for mode in ENGINE_MODES:
+        field = get_engine(cfg, mode)
+        for _ in range(3):
+            a = rng.getrandbits(cfg.m) | 1
+            n = rng.getrandbits(cfg.m + 3)
+            assert field.inv(a) == ref.inv(a)
+            assert field.pow(a, n) == ref.pow(a, n)
+            assert field.pow(a, -5) == ref.pow(a, -5)
+        assert field.pow(a, 0) == 1
+
+
+def test_frobenius_tables():
+    cfg = GFConfig(571, NIST_POLYS[571])
+    field = get_engine(cfg, "fast")
+    a = random.Random(1).getrandbits(571)
+    for k in (1, 4, 9, 285):
+        assert field.frobenius(a, k) == get_big_field(cfg).pow(a, 1 << k)
+
+
+def test_mode_is_selectable_per_call():
+    cfg = GFConfig(163, NIST_POLYS[163])
+    a = 0x1234567890ABCDEF
+    assert gf_inv(a, cfg, mode="itoh-tsujii") == gf_inv(a, cfg)
+    assert gf_pow(a, 1 << 100, cfg, mode="fast") == gf_pow(a, 1 << 100, cfg)
+    expr = compile_expr("a^-1 * b^1000")
+    assert expr.evaluate({"a": a, "b": 3}, cfg, mode="fast") == expr.evaluate({"a": a, "b": 3}, cfg)
+    with pytest.raises(ValueError):
+        gf_inv(a, cfg, mode="turbo")
+
+
+def test_itoh_tsujii_rejects_reducible_modulus():
+    # x^17 + 1 = (x + 1)(...): x + 1 has no inverse
+    cfg = GFConfig(17, (1 << 17) | 1)
+    with pytest.raises(ValueError):
+        get_engine(cfg, "itoh-tsujii").inv(0b11)
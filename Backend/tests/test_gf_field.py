@@ -0,0 +1,41 @@
+import pytest
+
+from Backend.gf import IRRED_DEFAULTS, GFConfig, default_config, gf_inv, gf_mod, gf_mul, gf_pow, get_tables
+from Backend.gf.field import clmul, inv_bitwise, mul_bitwise, poly_mod, pow_bitwise
+
+
+def test_aes_examples():
+    cfg = default_config(8)
+    assert gf_mul(0x57, 0x83, cfg) == 0xC1
+    assert gf_inv(0x53, cfg) == 0xCA
+    assert gf_mod(clmul(0x57, 0x83), cfg) == 0xC1
+
+
+@pytest.mark.parametrize("m", sorted(IRRED_DEFAULTS))
+def test_tables_match_bitwise(m):
+    cfg = default_config(m)
+    for a in range(cfg.size):
+        for b in range(cfg.size):
+            assert gf_mul(a, b, cfg) == mul_bitwise(a, b, cfg) == poly_mod(clmul(a, b), cfg.mod_poly)
+        if a:
+            assert gf_inv(a, cfg) == inv_bitwise(a, cfg)
+            assert gf_mul(a, gf_inv(a, cfg), cfg) == 1
+        for n in (0, 1, 2, 5, 254, 1000):
+            assert gf_pow(a, n, cfg) == pow_bitwise(a, n, cfg)
+
+
+def test_tables_are_cached_per_field():
+    cfg = default_config(8)
+    assert get_tables(cfg) is get_tables(GFConfig(8, 0x11B))
+    # x is not a generator under 0x11B, so the tables pick another one
+    assert get_tables(cfg).generator != 2
+
+
+def test_errors():
+    cfg = default_config(4)
+    with pytest.raises(ZeroDivisionError):
+        gf_inv(0, cfg)
+    with pytest.raises(ValueError):
+        GFConfig(4, 0x7)
+    with pytest.raises(ValueError):
+        get_tables(GFConfig(4, 0x15))  # x^4 + x^2 + 1 = (x^2 + x + 1)^2
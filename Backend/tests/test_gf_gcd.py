@@ -0,0 +1,85 @@
+import random
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from Backend.deps import get_current_user
+from Backend.gf import gcd as gcd_module
+from Backend.gf.bigint import clmul_window
+from Backend.gf.field import poly_gcd
+from Backend.gf.gcd import clmul, clmul_fft, egcd, gcd, half_gcd
+from Backend.routers import gf
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(gf.router)
+    app.dependency_overrides[get_current_user] = lambda: object()
+    return TestClient(app)
+
+
+@pytest.fixture
+def small_thresholds(monkeypatch):
+    # Exercise the recursion and the FFT products on small inputs
+    monkeypatch.setattr(gcd_module, "HGCD_MIN", 16)
+    monkeypatch.setattr(gcd_module, "HGCD_LEAF", 8)
+    monkeypatch.setattr(gcd_module, "FFT_MIN_BITS", 32)
+
+
+def _pair(rng, n, k, common_bits):
+    c = rng.getrandbits(common_bits) | 1 << common_bits
+    return clmul_window(rng.getrandbits(n), c), clmul_window(rng.getrandbits(k), c)
+
+
+@pytest.mark.parametrize("n", [1, 64, 5000, 20000])
+def test_clmul_fft_matches_window(n):
+    rng = random.Random(n)
+    a, b = rng.getrandbits(n), rng.getrandbits(n // 2 + 1)
+    assert clmul_fft(a, b) == clmul_window(a, b) == clmul(b, a)
+    assert clmul_fft(0, b) == 0
+
+
+def test_half_gcd_stops_halfway(small_thresholds):
+    rng = random.Random(1)
+    for _ in range(100):
+        n = rng.randrange(20, 600)
+        a, b = rng.getrandbits(n) | 1 << n, rng.getrandbits(n)
+        m00, m01, m10, m11 = half_gcd(a, b)
+        a2 = clmul(m00, a) ^ clmul(m01, b)
+        b2 = clmul(m10, a) ^ clmul(m11, b)
+        assert b2.bit_length() - 1 < (n + 1) // 2 <= a2.bit_length() - 1
+        assert poly_gcd(a2, b2) == poly_gcd(a, b)
+
+
+def test_gcd_and_egcd_match_euclid(small_thresholds):
+    rng = random.Random(2)
+    for _ in range(200):
+        a, b = _pair(rng, rng.randrange(0, 500), rng.randrange(0, 500), rng.randrange(0, 80))
+        g = poly_gcd(a, b) if a.bit_length() >= b.bit_length() else poly_gcd(b, a)
+        assert gcd(a, b) == g
+        h, s, t = egcd(a, b)
+        assert h == g and clmul(s, a) ^ clmul(t, b) == g
+    assert gcd(0, 0) == 0 and egcd(0, 0) == (0, 1, 0)
+    assert egcd(0, 0b1011) == (0b1011, 0, 1)
+
+
+def test_large_gcd():
+    rng = random.Random(3)
+    a, b = _pair(rng, 135_000, 134_000, 500)
+    g = gcd(a, b)
+    assert g == poly_gcd(a, b) and g.bit_length() - 1 >= 500
+    h, s, t = egcd(a, b)
+    assert h == g and clmul(s, a) ^ clmul(t, b) == g
+
+
+def test_gcd_endpoint(client):
+    # (x + 1)(x^2 + x + 1) and (x + 1)^2 share x + 1
+    res = client.post("/gf/gcd", json={"a": "0b1001", "b": "0b101", "extended": True}).json()
+    assert (res["gcd"], res["degree"]) == ("0x3", 1)
+    assert clmul(int(res["s"], 16), 0b1001) ^ clmul(int(res["t"], 16), 0b101) == 0b11
+    res = client.post("/gf/gcd", json={"a": hex(1 << 5000 | 1), "b": "0x3"}).json()
+    assert res == {"gcd": "0x3", "degree": 1, "s": None, "t": None}
+    assert client.post("/gf/gcd", json={"a": "0xZZ", "b": "1"}).status_code == 400
+    assert client.post("/gf/gcd", json={"a": hex(1 << 2_000_000), "b": "1"}).status_code == 400
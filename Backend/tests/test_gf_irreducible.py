@@ -0,0 +1,76 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from Backend.database import Base, get_db
+from Backend.deps import get_current_user
+from Backend.gf import NIST_POLYS
+from Backend.gf.field import poly_mod
+from Backend.gf.irreducible import irreducible_trinomials, is_irreducible, lowest_weight_irreducible
+from Backend.models import IrreduciblePoly
+from Backend.routers import gf
+from Backend.utils import irreducible_catalog
+from Backend.utils.irreducible_catalog import get_catalog, poly_hex
+
+
+def _trial_division(f: int) -> bool:
+    deg = f.bit_length() - 1
+    return deg >= 1 and all(poly_mod(f, d) for d in range(2, 1 << (deg // 2 + 1)))
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def test_matches_trial_division():
+    for f in range(1 << 12):
+        assert is_irreducible(f) == _trial_division(f), hex(f)
+
+
+@pytest.mark.parametrize("m", sorted(NIST_POLYS))
+def test_lowest_weight_matches_nist(m):
+    assert lowest_weight_irreducible(m) == NIST_POLYS[m]
+
+
+def test_trinomials():
+    # x^7 + x + 1, x^7 + x^3 + 1 and their reciprocals
+    assert irreducible_trinomials(7) == [0x83, 0x89, 0x91, 0xC1]
+    assert irreducible_trinomials(8) == []
+
+
+def test_catalog_is_persisted(db):
+    catalog = get_catalog(db, 8)
+    assert catalog["trinomials"] == []
+    # no trinomials when 8 | m, and the first pentanomial is the AES modulus
+    assert catalog["lowest"] == catalog["pentanomials"][0] == "0x11B"
+    count = db.query(IrreduciblePoly).filter_by(m=8).count()
+    assert get_catalog(db, 8) == catalog
+    assert db.query(IrreduciblePoly).filter_by(m=8).count() == count
+
+
+def test_large_uncached_degrees_are_built_in_the_background(monkeypatch):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(irreducible_catalog, "SessionLocal", factory)
+    monkeypatch.setattr(gf.settings, "GF_CATALOG_LIVE_MAX_M", 16)
+    app = FastAPI()
+    app.include_router(gf.router)
+    app.dependency_overrides[get_current_user] = lambda: object()
+    db = factory()
+    app.dependency_overrides[get_db] = lambda: db
+    client = TestClient(app)
+
+    assert client.get("/gf/irreducibles/16").status_code == 200
+    resp = client.get("/gf/irreducibles/163")
+    assert resp.status_code == 503 and resp.headers["Retry-After"] == "5"
+    # The test client runs the background task before returning
+    assert client.get("/gf/irreducibles/163").json()["lowest"] == poly_hex(NIST_POLYS[163])
@@ -0,0 +1,91 @@
+import random
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from Backend.deps import get_current_user
+from Backend.gf import GFConfig, default_config
+from Backend.gf.matrix import GF2, inverse, mat_mul, rank, row_reduce, solve
+from Backend.routers import gf
+
+# AES MixColumns and its inverse (FIPS-197, 5.1.3 and 5.3.3)
+MIX = [[2, 3, 1, 1], [1, 2, 3, 1], [1, 1, 2, 3], [3, 1, 1, 2]]
+INV_MIX = [[14, 11, 13, 9], [9, 14, 11, 13], [13, 9, 14, 11], [11, 13, 9, 14]]
+
+
+def _identity(n):
+    return [[int(i == j) for j in range(n)] for i in range(n)]
+
+
+def test_aes_mix_columns():
+    cfg = default_config(8)
+    assert inverse(MIX, cfg) == INV_MIX
+    assert mat_mul(MIX, INV_MIX, cfg) == _identity(4)
+    # FIPS-197 test column db 13 53 45 -> 8e 4d a1 bc
+    assert mat_mul(MIX, [[0xDB], [0x13], [0x53], [0x45]], cfg) == [[0x8E], [0x4D], [0xA1], [0xBC]]
+    assert solve(MIX, [0x8E, 0x4D, 0xA1, 0xBC], cfg) == [0xDB, 0x13, 0x53, 0x45]
+
+
+@pytest.mark.parametrize("cfg", [GF2, default_config(4), GFConfig(16, 0x1002B), default_config(163)])
+def test_random_systems(cfg):
+    rng = random.Random(cfg.m)
+    n = 12 if cfg.m > 16 else 40
+    a = [[rng.getrandbits(cfg.m) for _ in range(n)] for _ in range(n)]
+    x = [rng.getrandbits(cfg.m) for _ in range(n)]
+    b = [row[0] for row in mat_mul(a, [[v] for v in x], cfg)]
+    if rank(a, cfg) == n:
+        assert mat_mul(a, inverse(a, cfg), cfg) == _identity(n)
+        assert solve(a, b, cfg) == x
+    # a rank-deficient system: duplicate a row
+    a[1] = a[0]
+    reduced, pivots = row_reduce(a, cfg)
+    assert len(pivots) == rank(a, cfg) < n
+    assert all(reduced[i][c] == 1 for i, c in enumerate(pivots))
+    sol = solve(a, [row[0] for row in mat_mul(a, [[v] for v in x], cfg)], cfg)
+    assert mat_mul(a, [[v] for v in sol], cfg) == mat_mul(a, [[v] for v in x], cfg)
+    with pytest.raises(ValueError):
+        inverse(a, cfg)
+    with pytest.raises(ValueError):
+        solve(a, [1] + [0] * (n - 1), cfg)
+
+
+def test_large_gf2_system():
+    rng = random.Random(7)
+    n = 1024
+    a = [[rng.getrandbits(1) for _ in range(n)] for _ in range(n)]
+    x = [rng.getrandbits(1) for _ in range(n)]
+    b = [sum(u & v for u, v in zip(row, x)) % 2 for row in a]
+    sol = solve(a, b, GF2)
+    assert [sum(u & v for u, v in zip(row, sol)) % 2 for row in a] == b
+
+
+def test_validation():
+    cfg = default_config(4)
+    with pytest.raises(ValueError):
+        rank([[1, 2], [3]], cfg)
+    with pytest.raises(ValueError):
+        rank([[16]], cfg)
+    with pytest.raises(ValueError):
+        mat_mul([[1, 2]], [[1, 2]], cfg)
+
+
+def test_matrix_endpoint(monkeypatch):
+    app = FastAPI()
+    app.include_router(gf.router)
+    app.dependency_overrides[get_current_user] = lambda: object()
+    client = TestClient(app)
+    res = client.post("/gf/matrix", json={"op": "inverse", "m": 8, "a": MIX})
+    assert res.json() == {"op": "inverse", "m": 8, "mod_poly": 0x11B, "result": INV_MIX}
+    res = client.post("/gf/matrix", json={"op": "rank", "m": 1, "a": [[1, 1], [1, 1]]})
+    assert res.json()["result"] == 1
+    assert client.post("/gf/matrix", json={"op": "solve", "m": 8, "a": MIX}).status_code == 400
+    assert client.post("/gf/matrix", json={"op": "inverse", "m": 1, "a": [[1, 1], [1, 1]]}).status_code == 400
+    # 64x64 over GF(2^163) is several seconds of BigField products; b counts toward the size cap
+    big = [[1] * 64 for _ in range(64)]
+    res = client.post("/gf/matrix", json={"op": "inverse", "m": 163, "a": big})
+    assert res.status_code == 413
+    assert client.post("/gf/matrix", json={"op": "rank", "m": 163, "a": [[1] * 16] * 16}).status_code == 200
+    monkeypatch.setattr(gf.settings, "GF_BATCH_MAX_ITEMS", 20)
+    res = client.post("/gf/matrix", json={"op": "mul", "m": 8, "a": [[1] * 4] * 4, "b": [[1] * 4] * 4})
+    assert res.status_code == 413
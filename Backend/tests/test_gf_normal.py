@@ -0,0 +1,88 @@
+import random
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from Backend.deps import get_current_user
+from Backend.gf import NIST_POLYS, GFConfig, default_config
+from Backend.gf.bigint import get_big_field
+from Backend.gf.fast import get_engine
+from Backend.gf.irreducible import lowest_weight_irreducible
+from Backend.gf.normal import NormalBasis, get_normal_basis, onb_type
+from Backend.routers import gf
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(gf.router)
+    app.dependency_overrides[get_current_user] = lambda: object()
+    return TestClient(app)
+
+
+def _field(m):
+    return GFConfig(m, NIST_POLYS.get(m) or lowest_weight_irreducible(m))
+
+
+def test_onb_types():
+    # m + 1 prime with 2 primitive, or 2m + 1 prime with 2 primitive (or p = 3 mod 4 and ord 2 = m)
+    assert [m for m in range(2, 40) if onb_type(m) == 1] == [2, 4, 10, 12, 18, 28, 36]
+    assert [m for m in range(2, 40) if onb_type(m) == 2] == [3, 5, 6, 9, 11, 14, 23, 26, 29, 30, 33, 35, 39]
+    assert onb_type(233) == 2 and onb_type(163) is None
+
+
+@pytest.mark.parametrize("m", [2, 3, 4, 7, 8, 10, 16, 23, 36, 64, 163, 233])
+def test_basis_arithmetic_matches_polynomial_basis(m):
+    cfg = _field(m)
+    basis = get_normal_basis(cfg)
+    f = get_big_field(cfg)
+    # beta^(2^i) is the i-th basis vector, and 1 = the sum of them all (Tr(beta) = 1)
+    assert basis.from_normal(1 << (m - 1)) == f.pow(basis.beta, 1 << (m - 1))
+    assert basis.to_normal(1) == cfg.mask
+    rng = random.Random(m)
+    for _ in range(10):
+        a, b = rng.getrandbits(m), rng.getrandbits(m)
+        na, nb = basis.to_normal(a), basis.to_normal(b)
+        assert basis.from_normal(na) == a
+        assert basis.from_normal(basis.sqr(na)) == f.sqr(a)
+        assert basis.from_normal(basis.rotate(na, 5)) == f.pow(a, 32)
+        assert basis.from_normal(basis.mul(na, nb)) == f.mul(a, b)
+        assert basis.mul_massey_omura(na, nb) == basis.mul(na, nb)
+        n = rng.getrandbits(m + 3)
+        assert basis.from_normal(basis.pow(na, n)) == f.pow(a, n)
+        if a:
+            assert basis.from_normal(basis.inv(na)) == f.inv(a)
+    if basis.onb_type:
+        assert basis.complexity == 2 * m - 1
+
+
+def test_basis_is_reproducible():
+    cfg = _field(163)
+    assert NormalBasis(cfg).beta == get_normal_basis(cfg).beta
+
+
+@pytest.mark.parametrize("m", [8, 64, 163, 571])
+def test_normal_engine_pow(m):
+    cfg = _field(m)
+    engine = get_engine(cfg, "normal")
+    f = get_big_field(cfg)
+    rng = random.Random(m)
+    for n in (0, 1, 2, 3, -1, -5, rng.getrandbits(m), cfg.size - 1):
+        a = rng.getrandbits(m) | 1
+        assert engine.pow(a, n) == f.pow(a, n)
+    assert engine.pow(0, 5) == 0
+    assert engine.pow(0, 0) == 1
+
+
+def test_normal_basis_endpoint(client):
+    resp = client.get("/gf/normal-basis", params={"m": 4, "values": ["0x1", "0x2"]})
+    assert resp.status_code == 200
+    data = resp.json()
+    basis = get_normal_basis(default_config(4))
+    assert data["onb_type"] == 1 and data["complexity"] == 7
+    assert data["beta"] == f"0x{basis.beta:X}"
+    assert data["values"] == ["0xF", f"0x{basis.to_normal(2):X}"]
+    assert client.get("/gf/normal-basis", params={"m": 9}).status_code == 400
+    # x^8 + 1 = (x + 1)^8 defines no field
+    assert client.get("/gf/normal-basis", params={"m": 8, "mod_poly": "0x101"}).status_code == 400
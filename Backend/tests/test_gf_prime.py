@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from Backend.gf import prime_mul
+from Backend.gf.prime import INV_TABLE_MAX_P, PrimeField, get_prime_field, pad_coeffs
+from Backend.grading.answers import answer_key, eval_keys
+
+
+@pytest.mark.parametrize("p", [2, 5, 257, 65537, 2147483647])
+def test_inverses(p):
+    field = get_prime_field(p)
+    a = np.random.default_rng(p).integers(1, p, 300)
+    inv = field.batch_inv(a)
+    assert (a * inv % p == 1).all()
+    assert [field.inv(int(v)) for v in a[:20]] == [pow(int(v), -1, p) for v in a[:20]]
+    if p <= INV_TABLE_MAX_P:
+        assert field.inv_table[0] == 0
+    with pytest.raises(ZeroDivisionError):
+        field.batch_inv([1, p])
+
+
+def test_rejects_composites():
+    for p in (1, 4, 91, 1 << 31):
+        with pytest.raises(ValueError):
+            PrimeField(p)
+
+
+@pytest.mark.parametrize("p", [5, 101, 2147483647])
+def test_horner_matches_scalar(p):
+    field = get_prime_field(p)
+    rng = np.random.default_rng(p)
+    polys = [rng.integers(0, p, rng.integers(1, 12)).tolist() for _ in range(40)]
+    xs = rng.integers(0, p, 25)
+    grid = field.horner_grid(pad_coeffs(polys), xs)
+    assert grid.shape == (40, 25)
+    assert grid.tolist() == [[field.eval(c, int(x)) for x in xs] for c in polys]
+    # pairwise: polynomial i at point i
+    pairs = field.horner(pad_coeffs(polys)[:25], xs)
+    assert pairs.tolist() == [field.eval(c, int(x)) for c, x in zip(polys, xs)]
+
+
+def test_poly_arithmetic():
+    f = get_prime_field(5)
+    a, b = [3, 4, 2, 1], [2, 0, 4]
+    assert f.poly_add(a, b) == [3, 1, 2, 0]
+    assert f.poly_sub(a, a) == []
+    prod = f.poly_mul(a, b)
+    assert prod == [1, 3, 1, 3, 3, 4]
+    assert f.poly_divmod(prod, b) == (a, [])
+    q, r = f.poly_divmod(a, b)
+    assert f.poly_add(f.poly_mul(q, b), r) == a and len(r) < len(b)
+
+
+def test_eval_keys_in_bulk():
+    params = [
+        {"coeffs": [3, 4, 2, 1], "x": 7, "p": 5},
+        {"coeffs": [1, 0], "x": 12, "p": 7},
+        {"coeffs": [6, 5, 4, 3, 2, 1], "x": 3, "p": 7},
+        {"coeffs": [2], "x": 1, "p": 11},
+    ]
+    assert eval_keys(params) == [answer_key("gf-eval", q) for q in params]
+
+
+def _reference(a, b, p):
+    out = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a.tolist()):
+        for j, y in enumerate(b.tolist()):
+            out[i + j] = (out[i + j] + x * y) % p
+    return out
+
+
+@pytest.mark.parametrize("p", [101, 65537, 998244353, 2147483647])
+def test_multiplication_algorithms_agree(p):
+    rng = np.random.default_rng(p)
+    for n, k in [(1, 1), (7, 3), (600, 600), (1300, 700), (2000, 90)]:
+        a = rng.integers(0, p, n)
+        b = rng.integers(0, p, k)
+        expected = _reference(a, b, p) if n * k < 10**5 else prime_mul.schoolbook(a, b, p).tolist()
+        assert prime_mul.schoolbook(a, b, p).tolist() == expected
+        assert prime_mul.karatsuba(a, b, p).tolist() == expected
+        if prime_mul.ntt_friendly(p, n + k - 1):
+            assert prime_mul.ntt(a, b, p).tolist() == expected
+        assert prime_mul.crt_ntt(a, b, p).tolist() == expected
+
+
+def test_large_product_uses_ntt():
+    p = 998244353
+    f = get_prime_field(p)
+    rng = np.random.default_rng(0)
+    a = rng.integers(0, p, 100_001).tolist()
+    b = rng.integers(0, p, 100_001).tolist()
+    prod = f.poly_mul(a, b)
+    assert len(prod) == 200_001
+    # (ab)(x) = a(x) b(x) at a few random points
+    xs = rng.integers(0, p, 4)
+    assert f.horner(prod, xs).tolist() == (f.horner(a, xs) * f.horner(b, xs) % p).tolist()
+
+
+def test_large_product_mod_unfriendly_prime():
+    p = 2147483647
+    f = get_prime_field(p)
+    rng = np.random.default_rng(1)
+    a = rng.integers(0, p, 100_001).tolist()
+    b = rng.integers(0, p, 100_001).tolist()
+    prod = f.poly_mul(a, b)
+    xs = rng.integers(0, p, 4)
+    assert f.horner(prod, xs).tolist() == (f.horner(a, xs) * f.horner(b, xs) % p).tolist()
+    # Largest coefficients: the exact product needs all three CRT primes
+    top = np.full(5000, p - 1)
+    assert prime_mul.crt_ntt(top, top, p).tolist() == prime_mul.schoolbook(top, top, p).tolist()
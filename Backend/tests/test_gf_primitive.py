@@ -0,0 +1,51 @@
+import math
+
+import pytest
+
+from Backend.gf import GFConfig, default_config
+from Backend.gf import primitive
+from Backend.gf.mersenne_factors import MERSENNE_FACTORS
+from Backend.gf.primitive import element_order, factor_mersenne, find_generators, is_primitive, primitive_polynomials
+
+
+def test_precomputed_factorizations():
+    for m, factors in MERSENNE_FACTORS.items():
+        assert math.prod(factors) == (1 << m) - 1
+
+
+def test_factors_unlisted_degree():
+    factors = factor_mersenne(200)
+    assert math.prod(factors) == (1 << 200) - 1
+    assert factor_mersenne(200) is factors
+
+
+
+def test_unfactorable_degree_fails_once(monkeypatch):
+    calls = []
+
+    def rho(n):
+        calls.append(n)
+        return None
+
+    monkeypatch.setattr(primitive, "_pollard_brent", rho)
+    for _ in range(3):
+        with pytest.raises(ValueError, match="not available"):
+            factor_mersenne(1019)
+    assert len(calls) == 1
+
+def test_aes_modulus_is_not_primitive():
+    cfg = default_config(8)
+    assert not is_primitive(0x11B)
+    assert element_order(0x02, cfg) == 51
+    assert find_generators(cfg, 1) == [0x03]
+
+
+@pytest.mark.parametrize("m", [4, 8, 16])
+def test_primitive_polynomials_generate_the_field(m):
+    for f in primitive_polynomials(m, 3):
+        cfg = GFConfig(m, f)
+        seen, x = set(), 1
+        for _ in range(cfg.size - 1):
+            seen.add(x)
+            x = (x << 1) ^ (f if x >> (m - 1) else 0)
+        assert len(seen) == cfg.size - 1
@@ -0,0 +1,126 @@
+import random
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from Backend.deps import get_current_user
+from Backend.gf import NIST_POLYS, GFConfig
+from Backend.gf.bigint import get_big_field
+from Backend.gf.irreducible import lowest_weight_irreducible
+from Backend.gf.quadratic import get_quadratic
+from Backend.routers import gf
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(gf.router)
+    app.dependency_overrides[get_current_user] = lambda: object()
+    return TestClient(app)
+
+
+def _field(m):
+    return GFConfig(m, NIST_POLYS.get(m) or lowest_weight_irreducible(m))
+
+
+def _trace(a, field, m):
+    # Tr(a) = a + a^2 + ... + a^(2^(m-1))
+    out = 0
+    for _ in range(m):
+        out ^= a
+        a = field.sqr(a)
+    return out
+
+
+def _half_trace(a, field, m):
+    # H(a) = sum of a^(4^i), i = 0 .. (m-1)/2
+    out = 0
+    for _ in range((m + 1) // 2):
+        out ^= a
+        a = field.sqr(field.sqr(a))
+    return out
+
+
+@pytest.mark.parametrize("m", [2, 3, 8, 12, 16, 17, 33, 64, 163, 233, 571])
+def test_maps_match_direct_formulas(m):
+    cfg = _field(m)
+    field = get_big_field(cfg)
+    q = get_quadratic(cfg)
+    rng = random.Random(m)
+    for _ in range(10):
+        a = rng.getrandbits(m)
+        tr = _trace(a, field, m)
+        assert q.trace(a) == tr
+        assert field.sqr(q.sqrt(a)) == a
+        z = q.solve(a)
+        if tr:
+            assert z is None
+        else:
+            assert field.sqr(z) ^ z == a
+        if m % 2:
+            assert q.half_trace(a) == _half_trace(a, field, m)
+
+
+def test_trace_is_balanced_and_linear():
+    cfg = _field(8)
+    q = get_quadratic(cfg)
+    traces = [q.trace(a) for a in range(256)]
+    assert sum(traces) == 128
+    assert all(q.trace(a ^ b) == traces[a] ^ traces[b] for a in range(0, 256, 7) for b in range(0, 256, 5))
+
+
+def test_half_trace_needs_odd_m():
+    q = get_quadratic(_field(8))
+    with pytest.raises(ValueError):
+        q.half_trace(3)
+    with pytest.raises(ValueError):
+        q.batch_half_trace(np.array([3], dtype=np.uint64))
+
+
+@pytest.mark.parametrize("m", [8, 13, 32, 63, 64])
+def test_batches_match_scalar(m):
+    cfg = _field(m)
+    q = get_quadratic(cfg)
+    rng = random.Random(m)
+    values = [rng.getrandbits(m) for _ in range(200)]
+    arr = np.array(values, dtype=np.uint64)
+    assert q.batch_trace(arr).tolist() == [q.trace(v) for v in values]
+    assert q.batch_sqrt(arr).tolist() == [q.sqrt(v) for v in values]
+    roots, solvable = q.batch_solve(arr)
+    assert [int(z) if ok else None for z, ok in zip(roots, solvable)] == [q.solve(v) for v in values]
+    if m % 2:
+        assert q.batch_half_trace(arr).tolist() == [q.half_trace(v) for v in values]
+
+
+def test_batches_stop_at_word_size():
+    with pytest.raises(ValueError):
+        get_quadratic(_field(163)).batch_sqrt(np.array([1], dtype=np.uint64))
+
+
+def test_quadratic_endpoint(client):
+    cfg = _field(163)
+    q = get_quadratic(cfg)
+    values = [random.Random(i).getrandbits(163) for i in range(6)]
+    body = {"op": "solve", "m": 163, "mod_poly": hex(cfg.mod_poly), "values": [hex(v) for v in values]}
+    resp = client.post("/gf/quadratic", json=body)
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["mod_poly"] == f"0x{cfg.mod_poly:X}"
+    expected = [q.solve(v) for v in values]
+    assert [int(r, 16) if r is not None else None for r in data["results"]] == expected
+
+    resp = client.post("/gf/quadratic", json={"op": "trace", "m": 8, "values": ["0x0", "0x1", "0x2"]})
+    assert resp.json()["results"] == ["0x0", "0x0", "0x0"]
+    resp = client.post("/gf/quadratic", json={"op": "sqrt", "m": 8, "values": ["0x4"]})
+    assert resp.json()["results"] == ["0x2"]
+
+
+def test_quadratic_endpoint_errors(client):
+    resp = client.post("/gf/quadratic", json={"op": "half-trace", "m": 8, "values": ["0x3"]})
+    assert resp.status_code == 400
+    resp = client.post("/gf/quadratic", json={"op": "trace", "m": 8, "values": ["zz"]})
+    assert resp.status_code == 400
+    resp = client.post("/gf/quadratic", json={"op": "trace", "m": 8, "mod_poly": "0x101", "values": ["0x3"]})
+    assert resp.status_code == 400
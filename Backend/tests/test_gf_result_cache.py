@@ -0,0 +1,94 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from Backend.deps import get_current_user
+from Backend.gf import default_config
+from Backend.gf.result_cache import ResultCache, compute, etag
+from Backend.gf.trace import trace_op
+from Backend.routers import gf
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(gf.router)
+    app.dependency_overrides[get_current_user] = lambda: object()
+    gf.result_cache.clear()
+    return TestClient(app)
+
+
+def _result(trace):
+    try:
+        while True:
+            next(trace)
+    except StopIteration as stop:
+        return stop.value
+
+
+@pytest.mark.parametrize("op", ["add", "sub", "mul", "div", "inv", "pow", "mod"])
+@pytest.mark.parametrize("m", [8, 163])
+def test_compute_matches_traces(op, m):
+    cfg = default_config(m)
+    # Unreduced operands: both paths reduce them the same way
+    a, b = (1 << (m + 3)) | 0x57, 0x83
+    assert compute(op, a, b, cfg) == _result(trace_op(op, a, b, cfg))
+
+
+def test_lru_evicts_by_count_and_bytes():
+    cache = ResultCache(max_items=2, max_bytes=400)
+    cache.put(("mul", 1, 1, 8, 0x11B, False), b"a" * 10)
+    cache.put(("mul", 2, 1, 8, 0x11B, False), b"b" * 10)
+    assert cache.get(("mul", 1, 1, 8, 0x11B, False)) == b"a" * 10
+    cache.put(("mul", 3, 1, 8, 0x11B, False), b"c" * 10)
+    # 2 was least recently used
+    assert cache.get(("mul", 2, 1, 8, 0x11B, False)) is None
+    cache.put(("mul", 4, 1, 8, 0x11B, True), b"d" * 95)
+    cache.put(("mul", 5, 1, 8, 0x11B, True), b"e" * 95)
+    assert cache.stats()["bytes"] <= 400 and cache.stats()["entries"] == 2
+    # Bodies over a quarter of the budget are not stored
+    cache.put(("mul", 6, 1, 8, 0x11B, True), b"f" * 101)
+    assert cache.get(("mul", 6, 1, 8, 0x11B, True)) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_etag_depends_on_every_key_field():
+    key = ("mul", 0x57, 0x83, 8, 0x11B, False)
+    tags = {etag(key)}
+    for i, other in enumerate(["div", 0x58, 0x84, 9, 0x11D, True]):
+        tags.add(etag(key[:i] + (other,) + key[i + 1 :]))
+    assert len(tags) == 7
+    assert etag(key).startswith('"') and etag(key).endswith('"')
+
+
+def test_compute_endpoint_caches_and_revalidates(client):
+    params = {"op": "mul", "a": "0x57", "b": "0x83"}
+    first = client.get("/gf/compute", params=params)
+    assert first.status_code == 200 and first.headers["x-cache"] == "MISS"
+    assert first.json() == {"op": "mul", "m": 8, "mod_poly": "0x11B", "a": "0x57", "b": "0x83", "result": "0xC1"}
+    # Same key spelled differently: decimal operands, explicit default modulus
+    second = client.get("/gf/compute", params={"op": "mul", "a": "87", "b": "131", "mod_poly": "0x11B"})
+    assert second.headers["x-cache"] == "HIT" and second.content == first.content
+    assert second.headers["etag"] == first.headers["etag"]
+
+    not_modified = client.get("/gf/compute", params=params, headers={"If-None-Match": first.headers["etag"]})
+    assert not_modified.status_code == 304 and not_modified.headers["etag"] == first.headers["etag"]
+
+    traced = client.get("/gf/compute", params={**params, "trace": "true"})
+    assert traced.headers["x-cache"] == "MISS" and traced.headers["etag"] != first.headers["etag"]
+    body = traced.json()
+    assert body["result"] == "0xC1" and body["steps"][0]["kind"] == "mul"
+
+    stats = client.get("/gf/compute/stats").json()
+    assert (stats["hits"], stats["misses"], stats["revalidations"], stats["entries"]) == (1, 2, 1, 2)
+
+
+def test_compute_endpoint_errors(client, monkeypatch):
+    assert client.get("/gf/compute", params={"op": "inv", "a": "0"}).status_code == 400
+    assert client.get("/gf/compute", params={"op": "mul", "a": "1", "m": 2000}).status_code == 400
+    monkeypatch.setattr(gf.settings, "GF_COMPUTE_MAX_STEPS", 10)
+    params = {"op": "pow", "a": "3", "b": "1000", "trace": "true"}
+    assert client.get("/gf/compute", params=params).status_code == 413
+    # Untraced results have no step limit
+    assert client.get("/gf/compute", params={**params, "trace": "false"}).status_code == 200
+    assert gf.result_cache.stats()["entries"] == 1
@@ -0,0 +1,151 @@
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from Backend.deps import get_current_user
+from Backend.gf import GFConfig, get_tables
+from Backend.gf.rs import RS_FIELD, ReedSolomon, get_reed_solomon
+from Backend.routers import gf
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(gf.router)
+    app.dependency_overrides[get_current_user] = lambda: object()
+    return TestClient(app)
+
+
+def _corrupt(words, errors, rng):
+    out = words.copy()
+    for row, count in zip(out, errors):
+        positions = rng.choice(len(row), count, replace=False)
+        row[positions] ^= rng.integers(1, 256, count, dtype=np.uint8)
+    return out
+
+
+def _poly_eval(coeffs, x, tables):
+    # Horner, highest degree first
+    acc = 0
+    for c in coeffs:
+        acc = tables.mul(acc, x) ^ c
+    return acc
+
+
+def test_generator_roots_and_systematic_form():
+    code = get_reed_solomon(255, 223)
+    tables = get_tables(RS_FIELD)
+    assert code.alpha == tables.generator
+    assert len(code.generator) == 33 and code.generator[0] == 1
+    assert all(_poly_eval(code.generator, tables.exp[j], tables) == 0 for j in range(32))
+
+    rng = np.random.default_rng(0)
+    messages = rng.integers(0, 256, (50, 223), dtype=np.uint8)
+    codewords = code.encode(messages)
+    assert codewords.shape == (50, 255)
+    assert (codewords[:, :223] == messages).all()
+    assert not code.syndromes(codewords).any()
+    # Every codeword is a multiple of g(x): it vanishes at the roots of g
+    word = [int(v) for v in codewords[7]]
+    assert all(_poly_eval(word, tables.exp[j], tables) == 0 for j in range(32))
+
+
+@pytest.mark.parametrize(
+    "n, k, mod_poly, fcr",
+    [(255, 223, 0x11B, 0), (255, 239, 0x11D, 1), (40, 20, 0x11D, 3), (15, 9, 0x11B, 0), (20, 17, 0x11B, 120)],
+)
+def test_decode_corrects_up_to_t_errors(n, k, mod_poly, fcr):
+    code = ReedSolomon(n, k, GFConfig(8, mod_poly), fcr)
+    rng = np.random.default_rng(n + k)
+    messages = rng.integers(0, 256, (300, k), dtype=np.uint8)
+    errors = rng.integers(0, code.t + 1, 300)
+    decoded, corrected = code.decode(_corrupt(code.encode(messages), errors, rng))
+    assert (decoded == messages).all()
+    assert corrected.tolist() == errors.tolist()
+
+
+def test_decode_flags_too_many_errors():
+    code = get_reed_solomon(255, 223)
+    rng = np.random.default_rng(1)
+    messages = rng.integers(0, 256, (100, 223), dtype=np.uint8)
+    received = _corrupt(code.encode(messages), [17] * 100, rng)
+    decoded, corrected = code.decode(received)
+    assert (corrected == -1).all()
+    # Uncorrectable words come back as received
+    assert (decoded == received[:, :223]).all()
+
+
+def test_decoder_steps():
+    code = get_reed_solomon(255, 223)
+    rng = np.random.default_rng(2)
+    codeword = code.encode(rng.integers(0, 256, (1, 223), dtype=np.uint8))
+    received = codeword.copy()
+    received[0, [3, 100, 254]] ^= np.array([0x01, 0x80, 0x5A], dtype=np.uint8)
+    synd = code.syndromes(received)
+    lam, length = code.berlekamp_massey(synd)
+    assert length.tolist() == [3]
+    roots = code.chien_search(lam)
+    assert np.flatnonzero(roots[0]).tolist() == [3, 100, 254]
+    values = code.forney(synd, lam, roots)
+    assert values[0, [3, 100, 254]].tolist() == [0x01, 0x80, 0x5A]
+    assert (received ^ values == codeword).all()
+
+
+def test_code_parameters():
+    with pytest.raises(ValueError):
+        ReedSolomon(256, 200)
+    with pytest.raises(ValueError):
+        ReedSolomon(10, 10)
+    with pytest.raises(ValueError):
+        ReedSolomon(15, 11, GFConfig(4, 0x13))
+    with pytest.raises(ValueError):
+        get_reed_solomon(255, 223).encode(np.zeros((2, 222), dtype=np.uint8))
+
+
+def test_rs_endpoint(client):
+    code = get_reed_solomon(15, 11, GFConfig(8, 0x11D))
+    rng = np.random.default_rng(3)
+    messages = rng.integers(0, 256, (4, 11), dtype=np.uint8)
+    body = {"op": "encode", "n": 15, "k": 11, "mod_poly": "0x11D", "blocks": [m.tobytes().hex() for m in messages]}
+    resp = client.post("/gf/rs", json=body)
+    assert resp.status_code == 200
+    data = resp.json()
+    assert (data["mod_poly"], data["alpha"], data["corrected"]) == ("0x11D", "0x2", None)
+    codewords = code.encode(messages)
+    assert data["blocks"] == [w.tobytes().hex() for w in codewords]
+
+    received = _corrupt(codewords, [0, 1, 2, 3], rng)
+    body = {"op": "decode", "n": 15, "k": 11, "mod_poly": "0x11D", "blocks": [w.tobytes().hex() for w in received]}
+    data = client.post("/gf/rs", json=body).json()
+    assert data["corrected"][:3] == [0, 1, 2] and data["corrected"][3] in (-1, 3)
+    assert data["blocks"][:3] == [m.tobytes().hex() for m in messages[:3]]
+
+
+def test_rs_endpoint_binary(client):
+    code = get_reed_solomon(255, 223)
+    rng = np.random.default_rng(4)
+    messages = rng.integers(0, 256, (64, 223), dtype=np.uint8)
+    headers = {"Content-Type": "application/octet-stream"}
+    resp = client.post("/gf/rs?op=encode", content=messages.tobytes(), headers=headers)
+    assert resp.status_code == 200
+    codewords = np.frombuffer(resp.content, dtype=np.uint8).reshape(64, 255)
+    assert (codewords == code.encode(messages)).all()
+
+    errors = rng.integers(0, 17, 64)
+    resp = client.post("/gf/rs?op=decode", content=_corrupt(codewords, errors, rng).tobytes(), headers=headers)
+    assert len(resp.content) == 64 * 223 + 64 * 2
+    assert resp.content[: 64 * 223] == messages.tobytes()
+    assert np.frombuffer(resp.content[64 * 223 :], dtype="<i2").tolist() == errors.tolist()
+
+
+def test_rs_endpoint_errors(client):
+    resp = client.post("/gf/rs", json={"op": "encode", "n": 15, "k": 11, "blocks": ["00" * 10]})
+    assert resp.status_code == 400
+    resp = client.post("/gf/rs", json={"op": "encode", "n": 15, "k": 16, "blocks": []})
+    assert resp.status_code == 400
+    resp = client.post("/gf/rs", json={"op": "decode", "mod_poly": "0x13", "blocks": []})
+    assert resp.status_code == 400
+    headers = {"Content-Type": "application/octet-stream"}
+    resp = client.post("/gf/rs?op=decode", content=b"\x00" * 100, headers=headers)
+    assert resp.status_code == 400
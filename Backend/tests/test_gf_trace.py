@@ -0,0 +1,140 @@
+import json
+from itertools import islice
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from Backend.deps import get_current_user
+from Backend.gf import NIST_POLYS, GFConfig, default_config, gf_div, gf_inv, gf_mod, gf_mul, gf_pow
+from Backend.gf.packed_trace import PackedTrace, TraceTooLong
+from Backend.gf.trace import stream_op, trace_mul, trace_op, trace_pow
+from Backend.routers import gf
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(gf.router)
+    app.dependency_overrides[get_current_user] = lambda: object()
+    return TestClient(app)
+
+
+def _run(trace):
+    steps = []
+    try:
+        while True:
+            steps.append(next(trace))
+    except StopIteration as stop:
+        return steps, stop.value
+
+
+@pytest.mark.parametrize("cfg", [default_config(3), default_config(8), GFConfig(16, 0x1002B)])
+def test_results_match_engine(cfg):
+    a, b = 0x1234 & cfg.mask or 3, 0x0F0F & cfg.mask or 5
+    assert _run(trace_op("mul", a, b, cfg))[1] == gf_mul(a, b, cfg)
+    assert _run(trace_op("div", a, b, cfg))[1] == gf_div(a, b, cfg)
+    assert _run(trace_op("inv", a, b, cfg))[1] == gf_inv(a, cfg)
+    assert _run(trace_op("pow", a, 77, cfg))[1] == gf_pow(a, 77, cfg)
+    assert _run(trace_op("mod", 0xABCDE, 0, cfg))[1] == gf_mod(0xABCDE, cfg)
+    assert _run(trace_op("sub", a, b, cfg))[1] == a ^ b
+
+
+def test_step_schema_matches_gf2m_ts():
+    # 0x57 * 0x83 in the AES field: 8 "mul" steps, then reduce steps and one "mod"
+    steps, value = _run(trace_mul(0x57, 0x83, default_config(8)))
+    assert value == 0xC1
+    assert [s["kind"] for s in steps[:8]] == ["mul"] * 8
+    assert steps[0] == {"kind": "mul", "i": 0, "bBit": 1, "aBefore": 0x57, "aAfter": 0x57, "pBefore": 0, "pAfter": 0x57}
+    assert steps[-1] == {"kind": "mod", "before": steps[7]["pAfter"], "after": 0xC1}
+    assert all(s["kind"] == "reduce" for s in steps[8:-1])
+
+    steps, _ = _run(trace_pow(3, 5, default_config(8)))
+    exp = [s for s in steps if s["kind"] == "exp"]
+    assert [s["bit"] for s in exp] == [1, 0, 1]
+    assert exp[-1]["accAfter"] == gf_pow(3, 5, default_config(8))
+
+
+def test_trace_is_lazy():
+    cfg = GFConfig(571, NIST_POLYS[571])
+    steps = list(islice(stream_op("pow", 0x1234567, (1 << 570) - 3, cfg), 3))
+    assert [s["kind"] for s in steps] == ["mul"] * 3
+    # values beyond 2^53 are sent as hex strings
+    big = next(s for s in stream_op("mul", 1 << 300, 1 << 200, cfg) if s["kind"] == "mod")
+    assert big["before"] == f"0x{1 << 500:X}"
+
+
+def test_trace_endpoint_ndjson(client):
+    res = client.get("/gf/trace", params={"op": "mul", "a": "0x57", "b": "0x83", "m": 8})
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in res.text.splitlines()]
+    assert lines[0]["kind"] == "mul"
+    assert lines[-1] == {"kind": "result", "value": 0xC1}
+
+
+def test_trace_endpoint_sse(client):
+    res = client.get(
+        "/gf/trace",
+        params={"op": "inv", "a": "0x53", "m": 8},
+        headers={"Accept": "text/event-stream"},
+    )
+    assert res.headers["content-type"].startswith("text/event-stream")
+    events = [block.split("\n") for block in res.text.strip().split("\n\n")]
+    assert {e[0] for e in events[:-1]} == {"event: step"}
+    assert events[-1] == ["event: result", 'data: {"kind":"result","value":202}']
+
+
+def test_trace_endpoint_rejects_non_invertible(client):
+    assert client.get("/gf/trace", params={"op": "inv", "a": "0", "m": 8}).status_code == 400
+    res = client.get("/gf/trace", params={"op": "div", "a": "1", "b": "0x3", "m": 2, "mod_poly": "0x5"})
+    assert res.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "cfg, op, a, b",
+    [
+        (default_config(8), "pow", 0x57, 200),
+        (default_config(8), "add", 0x53, 0xCA),
+        (GFConfig(16, 0x1002B), "div", 0x1234, 0xBEEF),
+        (GFConfig(163, NIST_POLYS[163]), "inv", 12345 << 100 | 7, 0),
+    ],
+)
+def test_packed_trace_round_trip(cfg, op, a, b):
+    packed = PackedTrace.from_steps(stream_op(op, a, b, cfg), cfg.m, cfg.mod_poly)
+    assert PackedTrace.from_op(op, a, b, cfg).to_bytes() == packed.to_bytes()
+    decoded = PackedTrace.from_bytes(packed.to_bytes())
+    expected = [s for s in stream_op(op, a, b, cfg) if s["kind"] != "result"]
+    as_ints = [{k: int(v, 16) if isinstance(v, str) and v.startswith("0x") else v for k, v in s.items()} for s in expected]
+    assert list(decoded.steps()) == as_ints
+    assert decoded.result == _run(trace_op(op, a, b, cfg))[1]
+
+
+@pytest.mark.parametrize("cfg", [default_config(8), GFConfig(16, 0x1002B), GFConfig(163, NIST_POLYS[163])])
+@pytest.mark.parametrize(
+    "op, a, b",
+    [("pow", 0x1234, (1 << 40) - 7), ("mul", 0x1234, 0x5B), ("div", 0x1234, 0x5B), ("mod", 0x1234 << 500 | 0x5678, 0)],
+)
+def test_packed_trace_is_much_smaller(cfg, op, a, b):
+    a = a if op == "mod" else a & cfg.mask
+    steps = list(stream_op(op, a, b, cfg))
+    ndjson = sum(len(json.dumps(s, separators=(",", ":"))) + 1 for s in steps)
+    assert ndjson >= 5 * len(PackedTrace.from_op(op, a, b, cfg).to_bytes())
+
+
+def test_trace_endpoint_binary(client):
+    res = client.get("/gf/trace", params={"op": "pow", "a": "0x57", "b": "200", "m": 8, "format": "binary"})
+    assert res.headers["content-type"] == "application/octet-stream"
+    packed = PackedTrace.from_bytes(res.content)
+    assert packed.result == gf_pow(0x57, 200, default_config(8))
+    res = client.get("/gf/trace", params={"op": "mul", "a": "3", "b": "5"}, headers={"Accept": "application/octet-stream"})
+    assert PackedTrace.from_bytes(res.content).result == 15
+
+
+def test_packed_trace_step_limit(client, monkeypatch):
+    cfg = default_config(8)
+    with pytest.raises(TraceTooLong):
+        PackedTrace.from_op("pow", 0x57, 200, cfg, max_steps=10)
+    monkeypatch.setattr(gf.settings, "GF_COMPUTE_MAX_STEPS", 10)
+    res = client.get("/gf/trace", params={"op": "pow", "a": "0x57", "b": "200", "format": "binary"})
+    assert res.status_code == 413
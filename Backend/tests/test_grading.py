@@ -0,0 +1,214 @@
+import json
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from Backend import models
+from Backend.database import Base
+from Backend.grading import DEFAULT_PARAMS, answer_key, grade_answer
+from Backend.grading import worker
+
+
+def _grade(template_id, content):
+    return grade_answer(template_id, answer_key(template_id, DEFAULT_PARAMS[template_id]), content)
+
+
+def test_answer_keys():
+    assert answer_key("gf-addition", DEFAULT_PARAMS["gf-addition"]) == {"sums": [0x1B, 0xE7]}
+    assert answer_key("gf-multiplication", DEFAULT_PARAMS["gf-multiplication"]) == {"product": 0b100}
+    assert answer_key("gf-irreducible", DEFAULT_PARAMS["gf-irreducible"]) == {
+        "poly": 0x13,
+        "irreducible": True,
+        "factors": [[0x13, 1]],
+    }
+    assert answer_key("gf-eval", DEFAULT_PARAMS["gf-eval"]) == {"value": 0}
+    # 5P = (α³ + α², α² + 1)
+    assert answer_key("ec-scalar-mul", DEFAULT_PARAMS["ec-scalar-mul"]) == {"point": [0xC, 0x5]}
+
+
+def test_checkers():
+    assert _grade("gf-addition", "1) x⁴ + x³ + x + 1\n2) x^7 + x^6 + x^5 + x^2 + x + 1") == 100.0
+    assert _grade("gf-addition", "1) x^4 + x^3 + x + 1\n2) x^7 + x + 1") == 50.0
+    assert _grade("gf-multiplication", "(x^2+1)(x+1) = x^3 + x^2 + x + 1\n= x^2") == 100.0
+    assert _grade("gf-multiplication", "x^3 + x^2 + x + 1") == 0.0
+    assert _grade("gf-irreducible", "It is irreducible: no roots and no quadratic factor.") == 100.0
+    assert _grade("gf-irreducible", "Not irreducible, (x^2+x+1)^2") == 0.0
+    assert _grade("gf-irreducible", "It is not reducible.") == 100.0
+    assert _grade("gf-irreducible", "It isn't reducible") == 100.0
+    # x^4 + x^2 + 1 = (x^2 + x + 1)^2
+    key = answer_key("gf-irreducible", {"poly": 0b10101})
+    assert grade_answer("gf-irreducible", key, "Reducible: x⁴ + x² + 1 = (x² + x + 1)²") == 100.0
+    assert grade_answer("gf-irreducible", key, "It is reducible, (x^2+1)(x^2+x+1)") == 50.0
+    assert grade_answer("gf-irreducible", key, "reducible") == 50.0
+    assert grade_answer("gf-irreducible", key, "It is not reducible") == 0.0
+    # keys whose factorization timed out fall back to checking the product
+    key["factors"] = None
+    assert grade_answer("gf-irreducible", key, "reducible: (x^2+x+1)(x^2+x+1)") == 100.0
+    assert _grade("gf-eval", "7 = 2 mod 5, f(2) = 24 + 16 + 4 + 1 = 45 = 0 (mod 5)") == 100.0
+    assert _grade("gf-eval", "no idea") is None
+    assert _grade("ec-scalar-mul", "2P = (α² + α, α³)\n5P = (α³ + α², α² + 1)") == 100.0
+    assert _grade("ec-scalar-mul", "(0xC, 0x5)") == 100.0
+    assert _grade("ec-scalar-mul", "5P = (α³, α² + 1)") == 0.0
+    assert _grade("ec-scalar-mul", "5P = O") == 0.0
+    assert _grade("ec-scalar-mul", "no idea") is None
+
+
+def test_ec_keys_match_single_keys():
+    from Backend.grading.answers import ec_keys
+    from Backend.grading.exercises import generate_params
+
+    params = [generate_params("ec-scalar-mul", 3, uid) for uid in range(25)]
+    assert ec_keys(params) == [answer_key("ec-scalar-mul", p) for p in params]
+    assert worker.compute_keys("ec-scalar-mul", params) == ec_keys(params)
+
+
+@pytest.fixture
+def session_factory(monkeypatch):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(worker, "SessionLocal", factory)
+    return factory
+
+
+def test_batch_job_grades_latest_submissions(session_factory):
+    db = session_factory()
+    teacher = models.User(email="t@example.com", password_hash="x", role=models.UserRole.instructor)
+    students = [models.User(email=f"s{i}@example.com", password_hash="x") for i in range(3)]
+    db.add_all([teacher, *students])
+    db.flush()
+    classroom = models.Classroom(name="c", code="ABC123", instructor_id=teacher.id)
+    db.add(classroom)
+    db.flush()
+    assignment = models.Assignment(title="mul", classroom_id=classroom.id, template_id="gf-multiplication")
+    db.add(assignment)
+    db.flush()
+    answers = ["x^2", "x + 1", "I don't know"]
+    for student, answer in zip(students, answers):
+        db.add(models.Submission(user_id=student.id, assignment_id=assignment.id, content=answer))
+    db.commit()
+
+    job = worker.create_job(assignment.id)
+    worker.run_job(job)
+    assert (job.status, job.total, job.graded, job.skipped) == ("done", 3, 2, 1)
+    grades = {s.content: s.grade for s in session_factory().query(models.Submission)}
+    assert grades == {"x^2": 100.0, "x + 1": 0.0, "I don't know": None}
+
+
+def test_submission_grading_leaves_batch_jobs_pollable(session_factory):
+    db = session_factory()
+    teacher = models.User(email="t@example.com", password_hash="x", role=models.UserRole.instructor)
+    student = models.User(email="s@example.com", password_hash="x")
+    db.add_all([teacher, student])
+    db.flush()
+    classroom = models.Classroom(name="c", code="ABC123", instructor_id=teacher.id)
+    db.add(classroom)
+    db.flush()
+    assignment = models.Assignment(title="mul", classroom_id=classroom.id, template_id="gf-multiplication")
+    db.add(assignment)
+    db.flush()
+    submission = models.Submission(user_id=student.id, assignment_id=assignment.id, content="x^2")
+    db.add(submission)
+    db.commit()
+
+    batch = worker.create_job(assignment.id)
+    jobs = len(worker.JOBS)
+    for _ in range(worker._MAX_JOBS + 1):
+        job = worker.grade_submissions(assignment.id, [submission.id])
+    assert job.status == "done"
+    assert len(worker.JOBS) == jobs and worker.get_job(batch.id) is batch
+    assert session_factory().query(models.Submission).one().grade == 100.0
+
+
+def test_exercise_variants():
+    from Backend.grading.exercises import describe, generate_params
+    from Backend.routers.assignment import POLY_TEMPLATES
+
+    for tpl in POLY_TEMPLATES:
+        assert describe(tpl.id, DEFAULT_PARAMS[tpl.id]) == tpl.description
+        variants = [generate_params(tpl.id, 7, uid) for uid in range(30)]
+        assert variants == [generate_params(tpl.id, 7, uid) for uid in range(30)]
+        assert len({json.dumps(v) for v in variants}) > 15
+    irreducible = [answer_key("gf-irreducible", generate_params("gf-irreducible", 1, uid))["irreducible"] for uid in range(40)]
+    assert 5 < sum(irreducible) < 35
+
+
+def test_personalized_job_grades_against_stored_keys(session_factory):
+    from Backend.grading.exercises import generate_params
+
+    db = session_factory()
+    teacher = models.User(email="t@example.com", password_hash="x", role=models.UserRole.instructor)
+    students = [models.User(email=f"s{i}@example.com", password_hash="x") for i in range(4)]
+    db.add_all([teacher, *students])
+    db.flush()
+    classroom = models.Classroom(name="c", code="ABC123", instructor_id=teacher.id)
+    db.add(classroom)
+    db.flush()
+    assignment = models.Assignment(
+        title="eval", classroom_id=classroom.id, template_id="gf-eval", personalized=True
+    )
+    db.add(assignment)
+    db.commit()
+    ids = [s.id for s in students]
+    keys = worker.ensure_keys(db, assignment, ids[:3])
+    assert db.query(models.AnswerKey).count() == 3
+    assert json.loads(keys[ids[0]].params) == generate_params("gf-eval", assignment.id, ids[0])
+    # The first three answer their own variant, the last one copies the first
+    own = {uid: json.loads(row.key)["value"] for uid, row in keys.items()}
+    answers = [f"= {own[ids[0]]}", f"= {own[ids[1]]}", f"= {own[ids[2]]}", f"= {own[ids[0]]}"]
+    for uid, answer in zip(ids, answers):
+        db.add(models.Submission(user_id=uid, assignment_id=assignment.id, content=answer))
+    db.commit()
+
+    job = worker.create_job(assignment.id)
+    worker.run_job(job)
+    assert job.status == "done", job.error
+    fresh = session_factory()
+    # the fourth student's key was generated on demand
+    assert fresh.query(models.AnswerKey).count() == 4
+    fourth = json.loads(fresh.query(models.AnswerKey).filter_by(user_id=ids[3]).one().key)["value"]
+    grades = {s.user_id: s.grade for s in fresh.query(models.Submission)}
+    assert [grades[uid] for uid in ids[:3]] == [100.0, 100.0, 100.0]
+    assert grades[ids[3]] == (100.0 if fourth == own[ids[0]] else 0.0)
+
+
+def test_update_keeps_personalized_when_omitted(session_factory):
+    from Backend.routers.assignment import update_assignment
+    from Backend.schemas import AssignmentCreate
+
+    db = session_factory()
+    teacher = models.User(email="t@example.com", password_hash="x", role=models.UserRole.instructor)
+    db.add(teacher)
+    db.flush()
+    classroom = models.Classroom(name="c", code="ABC123", instructor_id=teacher.id)
+    db.add(classroom)
+    db.flush()
+    assignment = models.Assignment(title="eval", classroom_id=classroom.id, template_id="gf-eval")
+    db.add(assignment)
+    db.commit()
+    assert AssignmentCreate(title="t", classroom_id=classroom.id).personalized is False
+
+    def put(**fields):
+        payload = AssignmentCreate(classroom_id=classroom.id, template_id="gf-eval", **fields)
+        return update_assignment(assignment.id, payload, db=db, user=teacher)
+
+    # A title edit leaves a shared-template assignment shared
+    assert put(title="renamed").personalized is False
+    assert put(title="renamed", personalized=True).personalized is True
+    out = put(title="again")
+    assert (out.title, out.personalized) == ("again", True)
+
+    # Without template_id either, the template and every student's key stay
+    student = models.User(email="s@example.com", password_hash="x")
+    db.add(student)
+    db.flush()
+    db.add(models.ClassroomMember(classroom_id=classroom.id, user_id=student.id))
+    db.commit()
+    put(title="again")
+    keys = [row.id for row in db.query(models.AnswerKey).filter_by(assignment_id=assignment.id)]
+    assert len(keys) == 1
+    out = update_assignment(assignment.id, AssignmentCreate(title="last", classroom_id=classroom.id), db=db, user=teacher)
+    assert (out.template_id, out.personalized) == ("gf-eval", True)
+    assert [row.id for row in db.query(models.AnswerKey).filter_by(assignment_id=assignment.id)] == keys
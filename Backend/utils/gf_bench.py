@@ -0,0 +1,229 @@
+"""Timing of the GF(2^m) engine modes, with a checked-in baseline.
+
+    python -m Backend.utils.gf_bench [--m 8 163 571] [--ops inv pow] [--repeat 5]
+        [--json results.json] [--baseline [PATH]] [--threshold 0.5]
+
+Prints microseconds per operation for every mode in ``MODES`` that applies to
+the field (tables stop at ``TABLE_MAX_M``; NumPy batches run add/mul/sqr/mod
+on packed words up to ``WORD_MAX_M``). Operands are random but seeded, so
+runs compare.
+
+``--json`` writes the results; ``--baseline`` compares them with a previous
+run (``BASELINE`` when no path is given) and exits with status 1 when any
+cell is more than ``--threshold`` slower. Both runs also time a fixed
+pure-Python loop, and baseline times are scaled by the ratio of the two, so a
+baseline recorded on another machine still compares. Refresh the baseline
+after an intended change with ``--json Backend/utils/gf_bench_baseline.json``.
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+
+from ..gf import NIST_POLYS, GFConfig
+from ..gf.batch import WORD_MAX_M, WORD_OPS, batch_eval, batch_mul
+from ..gf.fast import ENGINE_MODES, get_engine
+from ..gf.field import inv_bitwise, mul_bitwise, poly_mod, pow_bitwise
+from ..gf.irreducible import lowest_weight_irreducible
+from ..gf.tables import TABLE_MAX_M, get_tables
+
+BENCH_OPS = ("add", "mul", "sqr", "inv", "pow", "mod")
+# table: log/antilog lookups; bitwise: shift-and-add reference loops;
+# ENGINE_MODES: big-int engines; batch: NumPy gathers over BATCH_SIZE operands
+MODES = ("table", "bitwise", *ENGINE_MODES, "batch")
+DEFAULT_M = (2, 4, 8, 16, 32, 64, 128, 163, 233, 283, 409, 571)
+BATCH_SIZE = 4096
+BASELINE = Path(__file__).with_name("gf_bench_baseline.json")
+# Run-to-run noise of single cells reaches 30-40% on shared machines
+DEFAULT_THRESHOLD = 0.5
+# Differences below this per timed call are timer noise, whatever the ratio;
+# batch cells are per element of a BATCH_SIZE call, so their floor is divided by it
+NOISE_US = 0.2
+
+
+def _field(m: int) -> GFConfig:
+    return GFConfig(m, NIST_POLYS.get(m) or lowest_weight_irreducible(m))
+
+
+def _scalar_ops(cfg: GFConfig, mode: str) -> dict[str, Callable]:
+    if mode == "table":
+        t = get_tables(cfg)
+        return {
+            "add": lambda a, b: a ^ b,
+            "mul": t.mul,
+            "sqr": lambda a: t.mul(a, a),
+            "inv": t.inv,
+            "pow": t.pow,
+            "mod": lambda x: poly_mod(x, cfg.mod_poly),
+        }
+    if mode == "bitwise":
+        return {
+            "add": lambda a, b: a ^ b,
+            "mul": lambda a, b: mul_bitwise(a, b, cfg),
+            "sqr": lambda a: mul_bitwise(a, a, cfg),
+            "inv": lambda a: inv_bitwise(a, cfg),
+            "pow": lambda a, n: pow_bitwise(a, n, cfg),
+            "mod": lambda x: poly_mod(x, cfg.mod_poly),
+        }
+    field = get_engine(cfg, mode)
+    return {
+        "add": lambda a, b: a ^ b,
+        "mul": field.mul,
+        "sqr": field.sqr,
+        "inv": field.inv,
+        "pow": field.pow,
+        "mod": field.reduce,
+    }
+
+
+def applies(mode: str, m: int, op: str) -> bool:
+    if mode == "table":
+        return m <= TABLE_MAX_M
+    if mode == "batch":
+        # Packed words above the table fields; sqr is a batch_mul
+        return m <= TABLE_MAX_M or (m <= WORD_MAX_M and op in (*WORD_OPS, "sqr"))
+    return True
+
+
+def _operands(cfg: GFConfig, count: int) -> tuple[list[int], list[int], list[int]]:
+    # Nonzero elements, exponents below 2^m, and unreduced products to reduce
+    rng = random.Random(cfg.m)
+    values = [rng.getrandbits(cfg.m) | 1 for _ in range(count)]
+    exps = [rng.getrandbits(cfg.m) for _ in range(count)]
+    wide = [rng.getrandbits(2 * cfg.m - 1) for _ in range(count)]
+    return values, exps, wide
+
+
+def time_op(cfg: GFConfig, mode: str, op: str, repeat: int = 5, samples: int = 16) -> Optional[float]:
+    """Best-of-``repeat`` microseconds per ``op``, or None when ``mode`` does not apply."""
+    if not applies(mode, cfg.m, op):
+        return None
+    if mode == "batch":
+        samples = BATCH_SIZE
+    values, exps, wide = _operands(cfg, samples)
+    if mode == "batch":
+        a = np.array(values, dtype=np.uint64)
+        b = a[::-1].copy()
+        # Batch inputs are at most 64 bits wide (exponents: int64)
+        n = np.array([e & (2**63 - 1) for e in exps], dtype=np.int64)
+        x = np.array([v & (2**64 - 1) for v in wide], dtype=np.uint64)
+        calls = {
+            "add": lambda: batch_eval("add", a, b, cfg),
+            "mul": lambda: batch_eval("mul", a, b, cfg),
+            "sqr": lambda: batch_mul(a, a, cfg),
+            "inv": lambda: batch_eval("inv", a, None, cfg),
+            "pow": lambda: batch_eval("pow", a, n, cfg),
+            "mod": lambda: batch_eval("mod", x, None, cfg),
+        }
+    else:
+        f = _scalar_ops(cfg, mode)
+        pairs = list(zip(values, reversed(values)))
+        calls = {
+            "add": lambda: [f["add"](a, b) for a, b in pairs],
+            "mul": lambda: [f["mul"](a, b) for a, b in pairs],
+            "sqr": lambda: [f["sqr"](a) for a in values],
+            "inv": lambda: [f["inv"](a) for a in values],
+            "pow": lambda: [f["pow"](a, n) for a, n in zip(values, exps)],
+            "mod": lambda: [f["mod"](x) for x in wide],
+        }
+    run = calls[op]
+    run()  # warm up the per-field tables
+    return round(min(timeit.repeat(run, number=1, repeat=repeat)) / samples * 1e6, 4)
+
+
+def calibrate(repeat: int = 5) -> float:
+    """Microseconds for a fixed pure-Python loop: the speed of this interpreter and machine."""
+    return min(timeit.repeat(lambda: sum(i * i for i in range(2000)), number=5, repeat=repeat)) / 5 * 1e6
+
+
+def bench(ms: list[int], ops: list[str], repeat: int = 5, modes: tuple[str, ...] = MODES) -> list[dict]:
+    rows = []
+    for m in ms:
+        cfg = _field(m)
+        for op in ops:
+            times = {mode: time_op(cfg, mode, op, repeat) for mode in modes}
+            rows.append({"m": m, "op": op, "us": times})
+    return rows
+
+
+def to_json(rows: list[dict], calibration_us: float) -> dict:
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "calibration_us": calibration_us,
+        "results": rows,
+    }
+
+
+def compare(
+    rows: list[dict], baseline: list[dict], threshold: float = DEFAULT_THRESHOLD, scale: float = 1.0
+) -> list[dict]:
+    """Cells of ``rows`` more than ``threshold`` (0.5 = 50%) slower than ``baseline``.
+
+    Baseline times are multiplied by ``scale`` first (see ``calibrate``).
+    Cells missing from either side are skipped, as are differences below
+    ``NOISE_US`` per call (a whole batch for ``batch`` cells).
+    """
+    base = {(r["m"], r["op"], mode): us * scale for r in baseline for mode, us in r["us"].items() if us is not None}
+    regressions = []
+    for row in rows:
+        for mode, us in row["us"].items():
+            old = base.get((row["m"], row["op"], mode))
+            if us is None or old is None:
+                continue
+            per_call = BATCH_SIZE if mode == "batch" else 1
+            if us > old * (1 + threshold) and (us - old) * per_call >= NOISE_US:
+                regressions.append(
+                    {"m": row["m"], "op": row["op"], "mode": mode, "base": old, "us": us, "ratio": us / old}
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare GF(2^m) engine modes.")
+    parser.add_argument("--m", type=int, nargs="+", default=list(DEFAULT_M))
+    parser.add_argument("--ops", nargs="+", choices=BENCH_OPS, default=list(BENCH_OPS))
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", type=Path, help="write the results to this file")
+    parser.add_argument("--baseline", type=Path, nargs="?", const=BASELINE, help="compare with a previous --json run")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    modes = tuple(args.modes)
+    header = f"{'m':>5} {'op':>4} " + " ".join(f"{mode:>12}" for mode in modes)
+    print(header + "   (us/op)")
+    calibration = calibrate()
+    rows = []
+    for m in args.m:
+        for row in bench([m], args.ops, args.repeat, modes):
+            rows.append(row)
+            cells = " ".join(f"{us:12.3f}" if us is not None else f"{'-':>12}" for us in row["us"].values())
+            print(f"{row['m']:>5} {row['op']:>4} {cells}", flush=True)
+
+    if args.json:
+        args.json.write_text(json.dumps(to_json(rows, calibration), indent=1) + "\n")
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        scale = calibration / baseline["calibration_us"]
+        print(f"machine speed vs baseline: {1 / scale:.2f}x")
+        regressions = compare(rows, baseline["results"], args.threshold, scale)
+        for r in regressions:
+            print(
+                f"REGRESSION m={r['m']} {r['op']} {r['mode']}: "
+                f"{r['base']:.3f} -> {r['us']:.3f} us ({r['ratio']:.2f}x)"
+            )
+        print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%} against {args.baseline}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Persisted catalog of irreducible trinomials/pentanomials per degree.
+
+Build it ahead of time with ``python -m Backend.utils.irreducible_catalog``.
+A degree missing from the table is computed once on first lookup and stored:
+inline up to ``live_max_m``, above that by ``build_degree`` in the grading
+process pool, while the lookup raises ``DegreePending``.
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from threading import Lock
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..database import SessionLocal
+from ..gf.irreducible import irreducible_pentanomials, irreducible_trinomials
+from ..grading.worker import get_pool
+from ..models import IrreduciblePoly
+
+# Degrees handed to build_degree and not stored yet
+_pending: set[int] = set()
+_pending_lock = Lock()
+
+
+class DegreePending(Exception):
+    """The degree is not in the catalog yet and is too large to compute inline."""
+
+
+def poly_hex(poly: int) -> str:
+    return f"0x{poly:X}"
+
+
+def compute_degree(m: int) -> list[tuple[int, int, bool]]:
+    """(poly, weight, is_lowest) rows for degree m; runs in worker processes."""
+    trinomials = irreducible_trinomials(m)
+    pentanomials = irreducible_pentanomials(m)
+    if not trinomials and not pentanomials:
+        raise ValueError(f"No irreducible trinomial or pentanomial of degree {m}")
+    lowest = trinomials[0] if trinomials else pentanomials[0]
+    return [(f, 3, f == lowest) for f in trinomials] + [(f, 5, f == lowest) for f in pentanomials]
+
+
+def _store(db: Session, m: int, rows: list[tuple[int, int, bool]]) -> None:
+    db.add_all(
+        IrreduciblePoly(m=m, poly=poly_hex(f), weight=weight, is_lowest=is_lowest)
+        for f, weight, is_lowest in rows
+    )
+    try:
+        db.commit()
+    except IntegrityError:
+        # another request stored this degree first
+        db.rollback()
+
+
+def ensure_degree(db: Session, m: int, live_max_m: int | None = None) -> None:
+    if db.query(IrreduciblePoly.id).filter(IrreduciblePoly.m == m).first():
+        return
+    if live_max_m is not None and m > live_max_m:
+        raise DegreePending(f"Degree {m} is not in the catalog yet")
+    _store(db, m, compute_degree(m))
+
+
+def build_degree(m: int) -> None:
+    """Compute and store one degree in the grading process pool (background task)."""
+    with _pending_lock:
+        if m in _pending:
+            return
+        _pending.add(m)
+    db = SessionLocal()
+    try:
+        if not db.query(IrreduciblePoly.id).filter(IrreduciblePoly.m == m).first():
+            _store(db, m, get_pool().submit(compute_degree, m).result())
+    finally:
+        db.close()
+        with _pending_lock:
+            _pending.discard(m)
+
+
+def get_catalog(db: Session, m: int, live_max_m: int | None = None) -> dict:
+    ensure_degree(db, m, live_max_m)
+    rows = (
+        db.query(IrreduciblePoly)
+        .filter(IrreduciblePoly.m == m)
+        .order_by(IrreduciblePoly.weight, IrreduciblePoly.id)
+        .all()
+    )
+    return {
+        "m": m,
+        "lowest": next(row.poly for row in rows if row.is_lowest),
+        "trinomials": [row.poly for row in rows if row.weight == 3],
+        "pentanomials": [row.poly for row in rows if row.weight == 5],
+    }
+
+
+def build(db: Session, max_m: int, jobs: int | None = None) -> None:
+    done = {m for (m,) in db.query(IrreduciblePoly.m).distinct()}
+    missing = [m for m in range(2, max_m + 1) if m not in done]
+    if not missing:
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(compute_degree, m): m for m in missing}
+        for future in as_completed(futures):
+            m = futures[future]
+            _store(db, m, future.result())
+            print(f"[INFO] Irreducible catalog: stored m={m}")
+
+
+def main() -> None:
+    from ..core.config import settings
+    from ..database import Base, engine
+
+    parser = argparse.ArgumentParser(description="Precompute the irreducible polynomial catalog.")
+    parser.add_argument("--max-m", type=int, default=settings.GF_MAX_M)
+    parser.add_argument("--jobs", type=int, default=None)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        build(db, args.max_m, args.jobs)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
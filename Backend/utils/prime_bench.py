@@ -0,0 +1,70 @@
+"""Timing of the GF(p)[x] multiplication algorithms, for tuning their thresholds.
+
+    python -m Backend.utils.prime_bench [--p 998244353 1000003] [--n 32 64 ... 100001] [--repeat 3]
+
+Prints milliseconds per product of two random length-n polynomials for
+schoolbook, Karatsuba, NTT (NTT-friendly primes only) and the three-prime
+CRT NTT, and the fastest of them. ``KARATSUBA_MIN``, ``NTT_MIN`` and
+``CRT_NTT_MIN`` in ``gf/prime_mul.py`` sit at the crossovers; schoolbook is
+skipped once it would take seconds.
+"""
+import argparse
+import timeit
+
+import numpy as np
+
+from ..gf import prime_mul
+
+DEFAULT_P = (998244353, 1000003, 101)
+DEFAULT_N = (32, 64, 96, 128, 192, 256, 512, 1024, 4096, 16384, 100001)
+# Largest n timed with the quadratic algorithm
+SCHOOLBOOK_MAX_N = 16384
+
+ALGORITHMS = {
+    "schoolbook": prime_mul.schoolbook,
+    "karatsuba": prime_mul.karatsuba,
+    "ntt": prime_mul.ntt,
+    "crt_ntt": prime_mul.crt_ntt,
+}
+
+
+def time_mul(algo: str, n: int, p: int, repeat: int = 3) -> float | None:
+    """Best-of-``repeat`` milliseconds per product, or None when ``algo`` does not apply."""
+    if algo == "ntt" and not prime_mul.ntt_friendly(p, 2 * n - 1):
+        return None
+    if algo == "crt_ntt" and not prime_mul.crt_friendly(p, n, 2 * n - 1):
+        return None
+    if algo == "schoolbook" and n > SCHOOLBOOK_MAX_N:
+        return None
+    rng = np.random.default_rng(n)
+    a = rng.integers(0, p, n)
+    b = rng.integers(0, p, n)
+    fn = ALGORITHMS[algo]
+    number = max(1, 2048 // n)
+    return min(timeit.repeat(lambda: fn(a, b, p), number=number, repeat=repeat)) / number * 1e3
+
+
+def bench(ps: list[int], ns: list[int], repeat: int = 3) -> list[dict]:
+    return [
+        {"p": p, "n": n, "ms": {algo: time_mul(algo, n, p, repeat) for algo in ALGORITHMS}}
+        for p in ps
+        for n in ns
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare GF(p)[x] multiplication algorithms.")
+    parser.add_argument("--p", type=int, nargs="+", default=list(DEFAULT_P))
+    parser.add_argument("--n", type=int, nargs="+", default=list(DEFAULT_N))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'p':>10} {'n':>7} " + " ".join(f"{algo:>11}" for algo in ALGORITHMS) + "   best (ms/product)")
+    for row in bench(args.p, args.n, args.repeat):
+        times = {algo: ms for algo, ms in row["ms"].items() if ms is not None}
+        cells = " ".join(f"{ms:11.3f}" if ms is not None else f"{'-':>11}" for ms in row["ms"].values())
+        print(f"{row['p']:>10} {row['n']:>7} {cells}   {min(times, key=times.get)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@
 // Central API client for Auth/Classroom service (FastAPI backend)
 // Handles base URL resolution, credentials, CSRF tokens, and typed helpers.
 
+import { decodeTrace, type PackedTrace } from "./traceCodec";
+
 export const AUTH_BASE_URL: string =
   import.meta.env.VITE_API_BASE_URL_AUTH || "/api";
 const CSRF_COOKIE_NAME = "csrf_token";
@@ -227,6 +229,8 @@ export type Assignment = {
   classroom_id: number;
   due_date?: string | null;
   attachment_url?: string | null;
+  template_id?: string | null;
+  personalized?: boolean;
   created_at: string;
 };
 
@@ -245,6 +249,15 @@ export type AssignmentTemplate = {
   description?: string | null;
 };
 
+export type Exercise = {
+  assignment_id: number;
+  template_id: string;
+  user_id?: number | null;
+  description: string;
+  params: Record<string, unknown>;
+  key?: Record<string, unknown> | null;
+};
+
 export type Submission = {
   id: number;
   user_id: number;
@@ -349,6 +362,8 @@ type AssignmentCreatePayload = {
   description?: string | null;
   classroom_id: number;
   due_date?: string | null;
+  template_id?: string | null;
+  personalized?: boolean;
 };
 
 export async function listAssignments(classroomId: number | string): Promise<Assignment[]> {
@@ -370,6 +385,11 @@ export async function listAssignmentTemplates(): Promise<AssignmentTemplate[]> {
   return request("/assignments/templates", { method: "GET" });
 }
 
+// The caller's own variant of a personalized template assignment
+export async function getMyExercise(assignmentId: number | string): Promise<Exercise> {
+  return request(`/assignments/${assignmentId}/exercise`, { method: "GET" });
+}
+
 export async function uploadAssignmentAttachment(
   assignmentId: number,
   file: File,
@@ -446,6 +466,31 @@ export async function gradeSubmission(submissionId: number, grade: number): Prom
   return request(`/submissions/${submissionId}/grade?${qs.toString()}`, { method: "POST" });
 }
 
+// --- GF(2^m) step traces ---
+
+export type TraceParams = {
+  op: "add" | "sub" | "mul" | "div" | "inv" | "pow" | "mod";
+  a: string;
+  b?: string;
+  m: number;
+  modPoly?: string;
+};
+
+export async function fetchPackedTrace(params: TraceParams): Promise<PackedTrace> {
+  const qs = new URLSearchParams({ op: params.op, a: params.a, m: String(params.m), format: "binary" });
+  if (params.b !== undefined) qs.set("b", params.b);
+  if (params.modPoly !== undefined) qs.set("mod_poly", params.modPoly);
+  const res = await fetch(`${AUTH_BASE_URL}/gf/trace?${qs.toString()}`, {
+    credentials: "include",
+    headers: { Accept: "application/octet-stream" },
+  });
+  if (!res.ok) {
+    const text = await res.text();
+    throw new ApiError(res.status, text ? tryParseJSON(text) : res.statusText);
+  }
+  return decodeTrace(await res.arrayBuffer());
+}
+
 // --- Instructor requests ---
 
 export async function submitInstructorRequest(
@@ -511,6 +556,7 @@ export const api = {
   getAssignment,
   createAssignment,
   listAssignmentTemplates,
+  getMyExercise,
   uploadAssignmentAttachment,
   submitAssignment,
   uploadAssignmentFile,
@@ -527,4 +573,5 @@ export const api = {
   enrollTotpMfa,
   verifyTotpMfa,
   disableTotpMfa,
+  fetchPackedTrace,
 };
@@ -0,0 +1,315 @@
+// src/lib/traceCodec.ts
+// Decoder for packed step traces (GET /gf/trace?format=binary).
+// Layout and field references mirror Backend/gf/packed_trace.py. Steps are
+// kept as one typed array per (kind, field); nothing is allocated per step
+// until a caller asks for one with stepAt().
+
+import type { Step } from "./gf2m";
+
+export const TRACE_KINDS = ["mul", "reduce", "mod", "add", "exp", "egcd"] as const;
+export type TraceKind = (typeof TRACE_KINDS)[number];
+
+type FieldSpec = [name: string, small: "u8" | "u16" | "", refs: string[]];
+
+const FIELDS: Record<TraceKind, FieldSpec[]> = {
+  mul: [
+    ["i", "u16", []],
+    ["bBit", "u8", []],
+    ["aBefore", "", ["<aBefore"]],
+    ["aAfter", "", ["=aBefore"]],
+    ["pBefore", "", ["<pAfter"]],
+    ["pAfter", "", ["=pBefore"]],
+  ],
+  reduce: [
+    ["carry", "u16", []],
+    ["before", "", ["<after"]],
+    ["after", "", ["=before+mod<<carry"]],
+  ],
+  mod: [
+    ["before", "", []],
+    ["after", "", ["=before%mod"]],
+  ],
+  add: [
+    ["op", "u8", []],
+    ["a", "", []],
+    ["b", "", []],
+    ["result", "", []],
+  ],
+  exp: [
+    ["bit", "u8", []],
+    ["baseBefore", "", ["<baseAfter"]],
+    ["baseAfter", "", []],
+    ["accBefore", "", ["<accAfter"]],
+    ["accAfter", "", ["=accBefore"]],
+  ],
+  egcd: [
+    ["a", "", ["<r", "<b"]],
+    ["b", "", ["<b", "<r"]],
+    ["q", "", ["<q"]],
+    ["r", "", ["=a+b*q"]],
+    ["t0", "", ["<t0+t1*q", "<t1"]],
+    ["t1", "", ["<t1", "<t0+t1*q"]],
+  ],
+};
+
+const MAGIC = "GFTR";
+const VERSION = 2;
+const ADD_OPS = ["add", "sub"] as const;
+// Values up to 48 bits are exact in a Float64Array; wider ones use 32-bit limbs
+const MAX_NUMERIC_WIDTH = 6;
+
+type Column = Uint8Array | Uint16Array | Float64Array | Uint32Array;
+
+export type PackedTrace = {
+  m: number;
+  length: number;
+  kinds: Uint8Array; // kind code per step (index into TRACE_KINDS)
+  rank: Uint32Array; // index of each step within its kind's columns
+  columns: Record<TraceKind, Record<string, Column>>;
+  limbs: number; // 0 for numeric columns, else 32-bit limbs per value
+  modPoly: number | bigint;
+  result: number | bigint;
+};
+
+// XOR and carry-less product on exact integers up to 2^53
+function xorNum(a: number, b: number): number {
+  const hi = (Math.floor(a / 2 ** 32) ^ Math.floor(b / 2 ** 32)) >>> 0;
+  return hi * 2 ** 32 + (((a >>> 0) ^ (b >>> 0)) >>> 0);
+}
+
+function clmulNum(a: number, b: number): number {
+  let prod = 0;
+  while (b > 0) {
+    if (b % 2) prod = xorNum(prod, a);
+    a *= 2;
+    b = Math.floor(b / 2);
+  }
+  return prod;
+}
+
+function degNum(x: number): number {
+  let d = -1;
+  for (; x >= 1; x = Math.floor(x / 2)) d++;
+  return d;
+}
+
+function modNum(x: number, f: number): number {
+  const df = degNum(f);
+  for (let d = degNum(x); d >= df; d = degNum(x)) x = xorNum(x, f * 2 ** (d - df));
+  return x;
+}
+
+const degBig = (x: bigint) => (x ? x.toString(2).length - 1 : -1);
+
+function modBig(x: bigint, f: bigint): bigint {
+  const df = degBig(f);
+  for (let d = degBig(x); d >= df; d = degBig(x)) x ^= f << BigInt(d - df);
+  return x;
+}
+
+function clmulBig(a: bigint, b: bigint): bigint {
+  let prod = 0n;
+  while (b > 0n) {
+    if (b & 1n) prod ^= a;
+    a <<= 1n;
+    b >>= 1n;
+  }
+  return prod;
+}
+
+function readBig(bytes: Uint8Array, offset: number, width: number): bigint {
+  let v = 0n;
+  for (let i = width - 1; i >= 0; i--) v = (v << 8n) | BigInt(bytes[offset + i]);
+  return v;
+}
+
+function readNum(view: DataView, offset: number, width: number): number {
+  switch (width) {
+    case 1:
+      return view.getUint8(offset);
+    case 2:
+      return view.getUint16(offset, true);
+    case 4:
+      return view.getUint32(offset, true);
+    default: {
+      let v = 0;
+      for (let i = width - 1; i >= 0; i--) v = v * 256 + view.getUint8(offset + i);
+      return v;
+    }
+  }
+}
+
+function getLimbs(col: Uint32Array, limbs: number, k: number): bigint {
+  let v = 0n;
+  for (let j = limbs - 1; j >= 0; j--) v = (v << 32n) | BigInt(col[k * limbs + j]);
+  return v;
+}
+
+function setLimbs(col: Uint32Array, limbs: number, k: number, v: bigint): void {
+  for (let j = 0; j < limbs; j++) {
+    col[k * limbs + j] = Number(v & 0xffffffffn);
+    v >>= 32n;
+  }
+}
+
+export function decodeTrace(buffer: ArrayBuffer): PackedTrace {
+  const view = new DataView(buffer);
+  const bytes = new Uint8Array(buffer);
+  const magic = String.fromCharCode(...bytes.subarray(0, 4));
+  if (magic !== MAGIC || view.getUint16(4, true) !== VERSION) {
+    throw new Error("Not a packed step trace");
+  }
+  const m = view.getUint16(6, true);
+  const length = view.getUint32(8, true);
+  const counts = TRACE_KINDS.map((_, i) => view.getUint32(12 + 4 * i, true));
+  let pos = 12 + 4 * TRACE_KINDS.length;
+
+  // Widths of the polynomial columns of every kind present, then result and mod_poly
+  const nValues =
+    TRACE_KINDS.reduce((n, kind, i) => n + (counts[i] ? FIELDS[kind].filter((f) => !f[1]).length : 0), 0) + 2;
+  const widths: number[] = [];
+  for (let i = 0; i < nValues; i++) widths.push(view.getUint16(pos + 2 * i, true));
+  pos += 2 * nValues;
+  const maxWidth = Math.max(...widths);
+  const limbs = maxWidth > MAX_NUMERIC_WIDTH ? Math.ceil(maxWidth / 4) : 0;
+  const modWidth = widths[nValues - 1];
+  const modPoly = limbs ? readBig(bytes, pos, modWidth) : readNum(view, pos, modWidth);
+  pos += modWidth;
+
+  const kinds = bytes.slice(pos, pos + length);
+  pos += length;
+  const rank = new Uint32Array(length);
+  const seen = new Uint32Array(TRACE_KINDS.length);
+  for (let i = 0; i < length; i++) rank[i] = seen[kinds[i]]++;
+
+  const columns = {} as Record<TraceKind, Record<string, Column>>;
+  let col = 0;
+  TRACE_KINDS.forEach((kind, kindCode) => {
+    const count = counts[kindCode];
+    const cols: Record<string, Column> = {};
+    columns[kind] = cols;
+    if (!count) {
+      for (const [name, small] of FIELDS[kind]) {
+        cols[name] = small === "u8" ? new Uint8Array(0) : small === "u16" ? new Uint16Array(0) : new Float64Array(0);
+      }
+      return;
+    }
+    const packed: { name: string; refs: Ref[]; selectors: Uint8Array; cursor: number; width: number }[] = [];
+
+    for (const [name, small, refs] of FIELDS[kind]) {
+      if (small) {
+        const size = small === "u8" ? 1 : 2;
+        const out = small === "u8" ? new Uint8Array(count) : new Uint16Array(count);
+        for (let k = 0; k < count; k++) out[k] = readNum(view, pos + k * size, size);
+        cols[name] = out;
+        pos += count * size;
+        continue;
+      }
+      const selectors = bytes.subarray(pos, pos + ((count + 3) >> 2));
+      pos += selectors.length;
+      let stored = 0;
+      for (let k = 0; k < count; k++) if (!((selectors[k >> 2] >> ((k & 3) * 2)) & 3)) stored++;
+      const width = widths[col++];
+      packed.push({ name, refs: refs.map(parseRef), selectors, cursor: pos, width });
+      cols[name] = limbs ? new Uint32Array(count * limbs) : new Float64Array(count);
+      pos += stored * width;
+    }
+
+    // Step by step: "<" references need the previous step of every column
+    for (let k = 0; k < count; k++) {
+      for (const p of packed) {
+        const sel = (p.selectors[k >> 2] >> ((k & 3) * 2)) & 3;
+        if (limbs) {
+          const v = sel
+            ? resolveBig(cols, limbs, modPoly as bigint, p.refs[sel - 1], k)
+            : readBig(bytes, p.cursor, p.width);
+          setLimbs(cols[p.name] as Uint32Array, limbs, k, v);
+        } else {
+          (cols[p.name] as Float64Array)[k] = sel
+            ? resolveNum(cols, modPoly as number, p.refs[sel - 1], k)
+            : readNum(view, p.cursor, p.width);
+        }
+        if (!sel) p.cursor += p.width;
+      }
+    }
+  });
+
+  const resultWidth = widths[nValues - 2];
+  const result = limbs ? readBig(bytes, pos, resultWidth) : readNum(view, pos, resultWidth);
+  return { m, length, kinds, rank, columns, limbs, modPoly, result };
+}
+
+// Reference forms: "=f" same step, "<f" previous step, "=f+g*h" f + g*h in
+// GF(2)[x], "=f+mod<<g" f + mod_poly x^g (g a small column), "=f%mod" f mod mod_poly
+type Ref = { prev: boolean; op: "copy" | "clmul" | "shift" | "mod"; names: string[] };
+
+function parseRef(ref: string): Ref {
+  const prev = ref[0] === "<";
+  const body = ref.slice(1);
+  if (body.endsWith("%mod")) return { prev, op: "mod", names: [body.slice(0, -4)] };
+  const [f, rest] = body.split("+");
+  if (rest === undefined) return { prev, op: "copy", names: [f] };
+  if (rest.startsWith("mod<<")) return { prev, op: "shift", names: [f, rest.slice(5)] };
+  return { prev, op: "clmul", names: [f, ...rest.split("*")] };
+}
+
+function resolveNum(cols: Record<string, Column>, modPoly: number, { prev, op, names }: Ref, k: number): number {
+  const idx = prev ? k - 1 : k;
+  const get = (name: string) => cols[name][idx] as number;
+  switch (op) {
+    case "copy":
+      return get(names[0]);
+    case "mod":
+      return modNum(get(names[0]), modPoly);
+    case "shift":
+      return xorNum(get(names[0]), modPoly * 2 ** get(names[1]));
+    default:
+      return xorNum(get(names[0]), clmulNum(get(names[1]), get(names[2])));
+  }
+}
+
+function resolveBig(
+  cols: Record<string, Column>,
+  limbs: number,
+  modPoly: bigint,
+  { prev, op, names }: Ref,
+  k: number,
+): bigint {
+  const idx = prev ? k - 1 : k;
+  const get = (name: string) => getLimbs(cols[name] as Uint32Array, limbs, idx);
+  switch (op) {
+    case "copy":
+      return get(names[0]);
+    case "mod":
+      return modBig(get(names[0]), modPoly);
+    case "shift":
+      // The shift is a small (u16) column, not a limb column
+      return get(names[0]) ^ (modPoly << BigInt(cols[names[1]][idx]));
+    default:
+      return get(names[0]) ^ clmulBig(get(names[1]), get(names[2]));
+  }
+}
+
+/** Value of one field of step i, as a hex string (works for any width). */
+export function hexAt(trace: PackedTrace, i: number, field: string): string {
+  const kind = TRACE_KINDS[trace.kinds[i]];
+  const col = trace.columns[kind][field];
+  const k = trace.rank[i];
+  // Small (u8/u16) columns hold plain numbers even when values use limbs
+  const small = col instanceof Uint8Array || col instanceof Uint16Array;
+  const v = trace.limbs && !small ? getLimbs(col as Uint32Array, trace.limbs, k) : col[k];
+  return "0x" + v.toString(16).toUpperCase();
+}
+
+/** Materialize step i with the Step schema of gf2m.ts (numeric traces only). */
+export function stepAt(trace: PackedTrace, i: number): Step {
+  if (trace.limbs) throw new Error("Values exceed 48 bits; read them with hexAt()");
+  const kind = TRACE_KINDS[trace.kinds[i]];
+  const k = trace.rank[i];
+  const step: Record<string, number | string> = { kind };
+  for (const [name] of FIELDS[kind]) {
+    const v = trace.columns[kind][name][k];
+    step[name] = name === "op" ? ADD_OPS[v] : v;
+  }
+  return step as unknown as Step;
+}
@@ -13,6 +13,7 @@ import {
   AUTH_BASE_URL,
   listClassrooms,
   listAssignments,
+  getMyExercise,
   submitAssignment,
   uploadAssignmentFile,
   listSubmissionsForAssignment,
@@ -52,7 +53,19 @@ export default function StudentClassroom() {
       }
       setClassroom(cls);
       const data = await listAssignments(classId);
-      setAssignments(data);
+      // Personalized template assignments show each student their own variant
+      const withExercises = await Promise.all(
+        data.map(async (a) => {
+          if (!a.template_id || !a.personalized) return a;
+          try {
+            const exercise = await getMyExercise(a.id);
+            return { ...a, description: exercise.description };
+          } catch {
+            return a;
+          }
+        }),
+      );
+      setAssignments(withExercises);
       const mats = await listMaterials(classId);
       setMaterials(mats);
       // fetch submissions per assignment (own submissions)
@@ -307,6 +307,8 @@ function AssignmentsPanel({
         title: title.trim(),
         description: desc.trim() ? desc.trim() : null,
         due_date: due ? new Date(due).toISOString() : null,
+        template_id: templateId || null,
+        personalized: Boolean(templateId),
       };
       const created = await createAssignment(payload);
       if (file) {